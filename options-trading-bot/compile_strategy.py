@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Ahead-of-time compile the strategy kernels with numba.pycc
+Run: python compile_strategy.py
+
+Builds src/strategy/strategy_native.*.so (high_win_rate_strategy) and
+src/strategy/hedge_kernels.*.so (options_hedge). Both modules import these in
+preference to the JIT path so the first signal or hedge update has no compile delay.
+"""
+import os
+import sys
+
+from numba.pycc import CC
+
+from src.strategy.high_win_rate_strategy import _ann_vol_impl, _step_all_impl
+from src.strategy.options_hedge import _payoff_impl
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'strategy')
+
+
+def build_strategy_native():
+    """Compile and write the native high-win-rate strategy module"""
+    cc = CC('strategy_native')
+    cc.output_dir = OUTPUT_DIR
+    cc.verbose = True
+
+    cc.export('ann_vol', 'f8(f8[:], i8, i8)')(_ann_vol_impl)
+    cc.export('step_all', 'void(f8[:], i8[:], i8[:], f8[:, :])')(_step_all_impl)
+
+    cc.compile()
+    print(f"✓ Built strategy_native in {cc.output_dir}")
+
+
+def build_hedge_kernels():
+    """Compile and write the native hedge payoff module"""
+    cc = CC('hedge_kernels')
+    cc.output_dir = OUTPUT_DIR
+    cc.verbose = True
+
+    cc.export('payoff', 'void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], b1[:], f8[:], f8[:])')(_payoff_impl)
+
+    cc.compile()
+    print(f"✓ Built hedge_kernels in {cc.output_dir}")
+
+
+def main():
+    """Compile and write all native kernel modules"""
+    build_strategy_native()
+    build_hedge_kernels()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,7 @@ Shows practical examples of:
 
 import math
 import sys
+import numpy as np
 from datetime import datetime, timedelta
 from src.quant.black_scholes import BlackScholesModel, estimate_volatility_from_prices
 from src.quant.monte_carlo import MonteCarloSimulator
@@ -77,12 +78,12 @@ def demo_greeks_analysis():
     )
     
     print(f"\n📈 Greek Values:")
-    print(f"   Price:  ${greeks['price']:.4f}")
-    print(f"   Delta:  {greeks['delta']:>7.4f}  (↑ $1 stock = ↑ ${greeks['delta']:.4f} option)")
-    print(f"   Gamma:  {greeks['gamma']:>7.6f}  (Delta changes by {greeks['gamma']:.4f} per $1 move)")
-    print(f"   Vega:   {greeks['vega']:>7.4f}  (↑ 1% IV = ↑ ${greeks['vega']:.4f} option)")
-    print(f"   Theta:  {greeks['theta']:>7.6f}  (Daily decay = ${abs(greeks['theta']):.6f}/day)")
-    print(f"   Rho:    {greeks['rho']:>7.4f}  (↑ 1% rate = ↑ ${greeks['rho']:.4f} option)")
+    print(f"   Price:  ${greeks.price:.4f}")
+    print(f"   Delta:  {greeks.delta:>7.4f}  (↑ $1 stock = ↑ ${greeks.delta:.4f} option)")
+    print(f"   Gamma:  {greeks.gamma:>7.6f}  (Delta changes by {greeks.gamma:.4f} per $1 move)")
+    print(f"   Vega:   {greeks.vega:>7.4f}  (↑ 1% IV = ↑ ${greeks.vega:.4f} option)")
+    print(f"   Theta:  {greeks.theta:>7.6f}  (Daily decay = ${abs(greeks.theta):.6f}/day)")
+    print(f"   Rho:    {greeks.rho:>7.4f}  (↑ 1% rate = ↑ ${greeks.rho:.4f} option)")
     
     # Show sensitivity to different spot prices
     print(f"\n📊 Delta Sensitivity (spot price changes):")
@@ -198,20 +199,17 @@ def demo_integrated_strategy():
     
     # Generate synthetic price data (downtrend = RSI oversold)
     print(f"\n📊 Generating synthetic AAPL price data...")
-    closes = []
+    closes = np.empty(30)
     
     # Downtrend (days 1-20): 150 → 145
-    for i in range(20):
-        price = 150 - (i * 0.25) + (i % 3) * 0.1
-        closes.append(price)
+    days = np.arange(20)
+    closes[:20] = 150 - (days * 0.25) + (days % 3) * 0.1
     
     # Recovery (days 21-30): 145 → 149
-    for i in range(10):
-        price = 145 + (i * 0.4)
-        closes.append(price)
+    closes[20:] = 145 + np.arange(10) * 0.4
     
-    current_price = closes[-1]
-    print(f"   Days: 30 | Price range: ${min(closes):.2f} - ${max(closes):.2f}")
+    current_price = closes[-1].item()
+    print(f"   Days: 30 | Price range: ${closes.min():.2f} - ${closes.max():.2f}")
     print(f"   Current price: ${current_price:.2f}")
     
     # Analyze call opportunity
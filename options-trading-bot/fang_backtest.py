@@ -45,7 +45,9 @@ class YahooDataFetcher:
     @staticmethod
     def _generate_sample_data(symbol: str, days: int = 365) -> List[Dict]:
         """Generate realistic sample data (fallback)"""
-        np.random.seed(hash(symbol) % 2**32)
+        # Per-symbol generator seeded from the ticker bytes (hash() is salted
+        # per process, and reseeding the global state leaks into other code)
+        rng = np.random.default_rng(np.random.SeedSequence(list(symbol.encode())))
         
         # Base prices for stocks
         base_prices = {
@@ -65,14 +67,14 @@ class YahooDataFetcher:
         
         for i in range(days):
             # Random walk with drift
-            daily_return = np.random.normal(0.0005, 0.02)  # 0.05% mean, 2% volatility
+            daily_return = rng.normal(0.0005, 0.02)  # 0.05% mean, 2% volatility
             price = price * (1 + daily_return)
             
-            open_p = price * (1 + np.random.normal(0, 0.005))
-            high = max(open_p, price) * (1 + abs(np.random.normal(0, 0.01)))
-            low = min(open_p, price) * (1 - abs(np.random.normal(0, 0.01)))
+            open_p = price * (1 + rng.normal(0, 0.005))
+            high = max(open_p, price) * (1 + abs(rng.normal(0, 0.01)))
+            low = min(open_p, price) * (1 - abs(rng.normal(0, 0.01)))
             close = price
-            volume = np.random.uniform(20000000, 100000000)
+            volume = rng.uniform(20000000, 100000000)
             
             candle = {
                 'timestamp': current_date,
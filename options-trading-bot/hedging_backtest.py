@@ -158,7 +158,8 @@ def run_hedged_backtest():
                         
                         # Apply protective put hedge
                         hedge_manager.hedge_position(
-                            symbol, current_price, current_price, int(position_size)
+                            symbol, current_price, current_price, int(position_size),
+                            now=price_data[symbol][day]['date'], bar=day
                         )
             
             # Check exits - UNHEDGED
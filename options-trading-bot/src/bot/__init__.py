@@ -168,8 +168,8 @@ class EnhancedTradingBot:
             
             updates = []
             for pos in self.positions:
-                # Get current price
-                quote = self.broker.get_quote(pos['symbol'])
+                # Get current price (live, never a cached quote)
+                quote = self.broker.get_quote(pos['symbol'], use_cache=False)
                 current_price = quote.get('price')
                 
                 if not current_price:
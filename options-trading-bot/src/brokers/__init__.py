@@ -12,6 +12,12 @@ from src.core.logger import logger
 class SchwabBrokerAPI:
     """Integration with Charles Schwab broker API using OAuth 2.0 with automatic token management"""
     
+    # Seconds a successful market data response is reused. Off (0) by
+    # default so trading code always sees live data; test runs opt in.
+    # Minute-bar history (days <= 5) expires with the quotes
+    quote_cache_ttl = 0.0
+    history_cache_ttl = 0.0
+    
     def __init__(
         self,
         account_number: str,
@@ -54,6 +60,10 @@ class SchwabBrokerAPI:
         
         self.session = requests.Session()
         self._update_headers()
+        
+        # Market data responses: key -> (monotonic expiry, value)
+        self._response_cache = {}
+        self._cache_lock = threading.Lock()
     
     def _update_headers(self):
         """Update session headers with current token"""
@@ -322,8 +332,46 @@ class SchwabBrokerAPI:
             logger.error(f"Error fetching account info: {str(e)}")
             return {}
     
-    def get_quote(self, symbol: str) -> Dict:
-        """Get real-time quote for a symbol"""
+    def _cached(self, key: tuple, ttl: float, fetch):
+        """
+        Result of fetch() for key, reused until ttl seconds have passed
+        
+        Empty results (failed requests) are not cached, so they are retried
+        on the next call.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        
+        value = fetch()
+        if value and ttl > 0:
+            with self._cache_lock:
+                self._response_cache[key] = (now + ttl, value)
+        return value
+    
+    def clear_cache(self):
+        """Forget all cached market data responses"""
+        with self._cache_lock:
+            self._response_cache.clear()
+    
+    def get_quote(self, symbol: str, use_cache: bool = True) -> Dict:
+        """
+        Get real-time quote for a symbol
+        
+        Args:
+            symbol: Stock symbol
+            use_cache: Reuse a quote up to quote_cache_ttl seconds old; pass
+                False where a live price matters (stop-loss checks)
+        """
+        if not use_cache:
+            return self._fetch_quote(symbol)
+        return dict(self._cached(('quote', symbol), self.quote_cache_ttl,
+                                 lambda: self._fetch_quote(symbol)))
+    
+    def _fetch_quote(self, symbol: str) -> Dict:
+        """Request a quote from the API"""
         try:
             # Quotes use /marketdata/v1/quotes with symbols parameter
             url = "https://api.schwabapi.com/marketdata/v1/quotes"
@@ -354,6 +402,9 @@ class SchwabBrokerAPI:
         """
         Get historical price data for analysis
         
+        Responses are cached per (symbol, days) for history_cache_ttl seconds
+        (not at all by default).
+        
         Args:
             symbol: Stock symbol
             days: Number of days of history to fetch
@@ -361,6 +412,12 @@ class SchwabBrokerAPI:
         Returns:
             List of OHLC data
         """
+        ttl = self.quote_cache_ttl if days <= 5 else self.history_cache_ttl
+        return list(self._cached(('history', symbol, days), ttl,
+                                 lambda: self._fetch_price_history(symbol, days)))
+    
+    def _fetch_price_history(self, symbol: str, days: int) -> List[Dict]:
+        """Request price history from the API"""
         try:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
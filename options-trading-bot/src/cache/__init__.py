@@ -0,0 +1,3 @@
+from src.cache.price_cache import FileCache
+
+__all__ = ["FileCache"]
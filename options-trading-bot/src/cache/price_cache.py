@@ -0,0 +1,75 @@
+"""
+On-disk JSON cache with per-entry expiry
+Used to keep price history across scanner runs (cron jobs, re-runs with
+different CLI arguments) without re-hitting the broker API
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from src.core.logger import logger
+
+
+class FileCache:
+    """JSON values stored one file per key, each with an optional TTL"""
+    
+    def __init__(self, directory: str = ".cache/prices"):
+        """
+        Initialize cache
+        
+        Args:
+            directory: Folder holding the cache files (created on first write)
+        """
+        self.directory = directory
+    
+    def _path(self, key: str) -> str:
+        """File for a key; hashed so any key is a safe file name"""
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key
+        
+        Returns:
+            Stored value, or None if missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        return entry.get('value')
+    
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        Store a JSON-serializable value
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Lifetime in seconds (None never expires)
+        """
+        entry = {
+            'key': key,
+            'expires_at': time.time() + ttl_seconds if ttl_seconds is not None else None,
+            'value': value
+        }
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Price cache write failed for %s: %s", key, e)
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers
+The tree still supports Python 3.9, so newer stdlib features are gated here
+"""
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -1,10 +1,19 @@
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 DB_URL = os.getenv("DB_URL", "sqlite:///./data/trading.db")
 
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False})
+# An in-memory SQLite database only exists inside its connection, so every
+# session has to share that one connection
+IN_MEMORY = DB_URL in ("sqlite://", "sqlite:///:memory:")
+
+engine = create_engine(
+    DB_URL,
+    connect_args={"check_same_thread": False},
+    **({"poolclass": StaticPool} if IN_MEMORY else {})
+)
 SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
@@ -12,5 +21,6 @@ def get_db_session():
     return SessionLocal()
 
 def init_db():
-    os.makedirs("data", exist_ok=True)
+    if not IN_MEMORY:
+        os.makedirs("data", exist_ok=True)
     Base.metadata.create_all(bind=engine)
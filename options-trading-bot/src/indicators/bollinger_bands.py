@@ -1,6 +1,7 @@
 """
 Bollinger Bands indicator calculation
 """
+from collections import deque
 import numpy as np
 from typing import List, Optional, Dict
 
@@ -18,6 +19,16 @@ class BollingerBandsIndicator:
         """
         self.period = period
         self.std_dev_multiplier = std_dev_multiplier
+        
+        # Rolling state primed by calculate() and advanced by update(): the
+        # window's prices, their mean and sum of squared deviations (M2)
+        self.window = None
+        self.mean = None
+        self.m2 = None
+        
+        # Last calculate() result keyed on its window's bytes: the strategy
+        # asks for bands and band position of the same closes several times
+        self._last = None
     
     def calculate(self, closes: List[float]) -> Optional[Dict[str, float]]:
         """
@@ -33,13 +44,53 @@ class BollingerBandsIndicator:
         if len(closes) < self.period:
             return None
         
-        closes_array = np.array(closes[-self.period:])
+        closes_array = np.asarray(closes[-self.period:], dtype=np.float64)
+        key = closes_array.tobytes()
+        if self._last is not None and self._last[0] == key:
+            return dict(self._last[1])
         
         # Calculate middle band (SMA)
-        middle_band = np.mean(closes_array)
+        self.mean = closes_array.mean()
+        
+        # Sum of squared deviations, kept so update() can slide the window
+        deviations = closes_array - self.mean
+        self.m2 = deviations @ deviations
+        self.window = deque(closes_array.tolist(), maxlen=self.period)
+        
+        bands = self._bands(closes_array[-1])
+        self._last = (key, bands)
+        return dict(bands)
+    
+    def update(self, close: float) -> Optional[Dict[str, float]]:
+        """
+        Advance the bands by one new close in O(1)
         
-        # Calculate standard deviation
-        std_dev = np.std(closes_array)
+        Slides the window with Welford's update for a fixed-size window (add
+        the new close, evict the oldest), matching calculate(closes + [close])
+        up to rounding once calculate has primed the state; returns None
+        before that.
+        """
+        if self.window is None:
+            return None
+        
+        # The rolling state no longer matches the memoized window
+        self._last = None
+        evicted = self.window[0]
+        self.window.append(close)
+        old_mean = self.mean
+        self.mean = old_mean + (close - evicted) / self.period
+        # M2 changes by (x - old)(x - new_mean + old - old_mean); rounding
+        # can push a flat window's M2 a hair below zero
+        self.m2 = max(0.0, self.m2 + (close - evicted) * (close - self.mean + evicted - old_mean))
+        
+        return self._bands(close)
+    
+    def _bands(self, current_price: float) -> Dict[str, float]:
+        """Band values from the current window mean and M2"""
+        middle_band = self.mean
+        
+        # Calculate (population) standard deviation
+        std_dev = np.sqrt(self.m2 / self.period)
         
         # Calculate bands
         upper_band = middle_band + (self.std_dev_multiplier * std_dev)
@@ -50,7 +101,6 @@ class BollingerBandsIndicator:
         
         # Calculate %B (Bollinger Band % B) - where price sits relative to bands
         # %B = (price - lower) / (upper - lower)
-        current_price = closes_array[-1]
         percent_b = (current_price - lower_band) / band_width if band_width > 0 else 0.5
         
         return {
@@ -144,6 +194,13 @@ class BollingerBandsIndicator:
             return 'lower'
         else:
             return 'middle'
+    
+    def reset(self):
+        """Reset internal state for new symbol"""
+        self.window = None
+        self.mean = None
+        self.m2 = None
+        self._last = None
 
 
 def calculate_bollinger_bands_simple(
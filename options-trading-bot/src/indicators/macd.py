@@ -2,7 +2,42 @@
 MACD (Moving Average Convergence Divergence) indicator calculation
 """
 import numpy as np
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union
+from src.core.jit import njit, NUMBA_AVAILABLE
+
+# Series at least this long go through the compiled EMA kernel in
+# _calculate_ema (when numba is installed); shorter ones aren't worth the
+# list -> array -> list round trip
+JIT_MIN_LENGTH = 200
+
+
+@njit(cache=True)
+def _ema_kernel(values, period):
+    """EMA series of a float64 array, seeded with the SMA of the first period values"""
+    multiplier = 2.0 / (period + 1)
+    out = np.empty(values.shape[0] - period + 1)
+    ema = values[:period].mean()
+    out[0] = ema
+    for i in range(period, values.shape[0]):
+        ema = values[i] * multiplier + ema * (1 - multiplier)
+        out[i - period + 1] = ema
+    return out
+
+
+@njit(cache=True)
+def _macd_kernel(closes, fast_period, slow_period, signal_period):
+    """
+    Last fast and slow EMA, MACD series and last signal EMA of a float64 array
+    
+    The signal EMA is NaN when there are fewer than signal_period MACD values.
+    """
+    fast = _ema_kernel(closes, fast_period)
+    slow = _ema_kernel(closes, slow_period)
+    macd_values = fast[slow_period - fast_period:] - slow
+    signal = np.nan
+    if macd_values.shape[0] >= signal_period:
+        signal = _ema_kernel(macd_values, signal_period)[-1]
+    return fast[-1], slow[-1], macd_values, signal
 
 
 class MACDIndicator:
@@ -24,9 +59,16 @@ class MACDIndicator:
         self.fast_ema = None
         self.slow_ema = None
         self.signal_ema = None
+        # Streaming state for update(): MACD line reported by calculate and
+        # the MACD values seeding the signal EMA until it has signal_period
+        self.macd_line = None
+        self._signal_seed = []
     
     def _calculate_ema(self, values: List[float], period: int) -> List[float]:
         """Calculate exponential moving average"""
+        if NUMBA_AVAILABLE and len(values) >= max(JIT_MIN_LENGTH, period):
+            return _ema_kernel(np.asarray(values, dtype=np.float64), period).tolist()
+        
         ema_values = []
         multiplier = 2.0 / (period + 1)
         
@@ -45,12 +87,12 @@ class MACDIndicator:
         
         return ema_values
     
-    def calculate(self, closes: List[float]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    def calculate(self, closes: Union[List[float], np.ndarray]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """
         Calculate MACD line, signal line, and histogram
         
         Args:
-            closes: List of closing prices
+            closes: List or float64 array of closing prices (arrays are used as-is)
             
         Returns:
             Tuple of (MACD, Signal, Histogram) or (None, None, None) if insufficient data
@@ -58,6 +100,9 @@ class MACDIndicator:
         if len(closes) < self.slow_period:
             return None, None, None
         
+        if NUMBA_AVAILABLE:
+            return self._calculate_compiled(np.asarray(closes, dtype=np.float64))
+        
         # Calculate fast and slow EMAs
         fast_ema_values = self._calculate_ema(closes, self.fast_period)
         slow_ema_values = self._calculate_ema(closes, self.slow_period)
@@ -78,13 +123,63 @@ class MACDIndicator:
         
         signal_values = self._calculate_ema(macd_values, self.signal_period)
         
-        if not signal_values:
-            return macd_line, None, None
+        # Keep the EMA state so update() can continue the series
+        self.fast_ema = fast_ema_values[-1]
+        self.slow_ema = slow_ema_values[-1]
+        self.macd_line = macd_line
+        self.signal_ema = signal_values[-1] if signal_values else None
+        self._signal_seed = [] if signal_values else macd_values
+        
+        return self._current()
+    
+    def _calculate_compiled(self, closes: np.ndarray) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """calculate() with every EMA in one compiled call (same state and result)"""
+        fast_ema, slow_ema, macd_values, signal_ema = _macd_kernel(
+            closes, self.fast_period, self.slow_period, self.signal_period
+        )
+        has_signal = macd_values.shape[0] >= self.signal_period
         
-        signal_line = signal_values[-1]
-        histogram = macd_line - signal_line
+        self.fast_ema = fast_ema
+        self.slow_ema = slow_ema
+        self.macd_line = float(macd_values[0])
+        self.signal_ema = signal_ema if has_signal else None
+        self._signal_seed = [] if has_signal else macd_values.tolist()
         
-        return macd_line, signal_line, histogram
+        return self._current()
+    
+    def update(self, close: float) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Advance MACD by one new close in O(1)
+        
+        Returns the same tuple as calculate(closes + [close]) once calculate
+        has primed the EMAs; (None, None, None) before that.
+        """
+        if self.slow_ema is None:
+            return None, None, None
+        
+        fast_multiplier = 2.0 / (self.fast_period + 1)
+        slow_multiplier = 2.0 / (self.slow_period + 1)
+        self.fast_ema = close * fast_multiplier + self.fast_ema * (1 - fast_multiplier)
+        self.slow_ema = close * slow_multiplier + self.slow_ema * (1 - slow_multiplier)
+        macd_value = self.fast_ema - self.slow_ema
+        
+        if self.signal_ema is None:
+            # Signal EMA starts as the SMA of the first signal_period MACD values
+            self._signal_seed.append(macd_value)
+            if len(self._signal_seed) == self.signal_period:
+                self.signal_ema = np.mean(self._signal_seed)
+                self._signal_seed = []
+        else:
+            signal_multiplier = 2.0 / (self.signal_period + 1)
+            self.signal_ema = macd_value * signal_multiplier + self.signal_ema * (1 - signal_multiplier)
+        
+        return self._current()
+    
+    def _current(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """(MACD, Signal, Histogram) from the streaming state"""
+        if self.signal_ema is None:
+            return self.macd_line, None, None
+        return self.macd_line, self.signal_ema, self.macd_line - self.signal_ema
     
     def calculate_bulk(self, closes: List[float]) -> Dict[str, List]:
         """
@@ -164,3 +259,5 @@ class MACDIndicator:
         self.fast_ema = None
         self.slow_ema = None
         self.signal_ema = None
+        self.macd_line = None
+        self._signal_seed = []
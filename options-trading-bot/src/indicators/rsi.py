@@ -2,7 +2,36 @@
 RSI (Relative Strength Index) indicator calculation
 """
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Union
+from src.core.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _average_gain_loss_kernel(window):
+    """Mean gain and mean loss over the price changes of a float64 window"""
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, window.shape[0]):
+        delta = window[i] - window[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        else:
+            loss_sum -= delta
+    n = window.shape[0] - 1
+    return gain_sum / n, loss_sum / n
+
+
+@njit(cache=True)
+def _rsi_bulk_kernel(closes, period):
+    """RSI of every window closes[i - period:i + 1], as calculate_bulk (NaN for i < period)"""
+    out = np.full(closes.shape[0], np.nan)
+    for i in range(period, closes.shape[0]):
+        avg_gain, avg_loss = _average_gain_loss_kernel(closes[i - period:i + 1])
+        if avg_loss == 0:
+            out[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
 
 
 class RSIIndicator:
@@ -20,13 +49,14 @@ class RSIIndicator:
         self.losses = []
         self.avg_gain = None
         self.avg_loss = None
+        self.prev_close = None
     
-    def calculate(self, closes: List[float], period: Optional[int] = None) -> Optional[float]:
+    def calculate(self, closes: Union[List[float], np.ndarray], period: Optional[int] = None) -> Optional[float]:
         """
         Calculate RSI for a series of closes
         
         Args:
-            closes: List of closing prices
+            closes: List or float64 array of closing prices (arrays are used as-is)
             period: Override period if needed
             
         Returns:
@@ -38,8 +68,17 @@ class RSIIndicator:
         if len(closes) < self.period + 1:
             return None
         
+        window = closes[-self.period-1:]
+        if self.avg_gain is None and NUMBA_AVAILABLE:
+            # Initial averages in one compiled pass, no gain/loss temporaries
+            self.avg_gain, self.avg_loss = _average_gain_loss_kernel(
+                np.asarray(window, dtype=np.float64)
+            )
+            self.prev_close = closes[-1]
+            return self._rsi_from_averages()
+        
         # Calculate price changes
-        deltas = np.diff(closes[-self.period-1:])
+        deltas = np.diff(window)
         
         # Separate gains and losses
         gains = np.where(deltas > 0, deltas, 0)
@@ -54,7 +93,30 @@ class RSIIndicator:
             self.avg_gain = (self.avg_gain * (self.period - 1) + gains[-1]) / self.period
             self.avg_loss = (self.avg_loss * (self.period - 1) + losses[-1]) / self.period
         
-        # Calculate RS and RSI
+        self.prev_close = closes[-1]
+        return self._rsi_from_averages()
+    
+    def update(self, close: float) -> Optional[float]:
+        """
+        Advance RSI by one new close in O(1)
+        
+        Same Wilder smoothing as calculate(closes + [close]) after calculate
+        has primed the state; returns None before that.
+        """
+        if self.avg_gain is None or self.prev_close is None:
+            return None
+        
+        delta = close - self.prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+        self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        self.prev_close = close
+        
+        return self._rsi_from_averages()
+    
+    def _rsi_from_averages(self) -> float:
+        """RSI from the current average gain and loss"""
         if self.avg_loss == 0:
             return 100.0 if self.avg_gain > 0 else 50.0
         
@@ -73,6 +135,11 @@ class RSIIndicator:
         Returns:
             List of RSI values
         """
+        if NUMBA_AVAILABLE:
+            # Every window in one compiled pass instead of NumPy calls per bar
+            values = _rsi_bulk_kernel(np.asarray(closes, dtype=np.float64), self.period)
+            return [None if np.isnan(value) else value for value in values.tolist()]
+        
         rsi_values = []
         deltas = np.diff(closes)
         
@@ -111,3 +178,4 @@ class RSIIndicator:
         self.losses = []
         self.avg_gain = None
         self.avg_loss = None
+        self.prev_close = None
@@ -0,0 +1,168 @@
+"""
+Rolling RSI and MACD over one symbol's growing close series
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.core.jit import njit, prange
+from src.indicators.rsi import RSIIndicator, _average_gain_loss_kernel
+from src.indicators.macd import MACDIndicator, _macd_kernel
+
+
+@njit(cache=True, parallel=True)
+def _indicator_rows_kernel(closes, lengths, rsi_period, macd_fast, macd_slow, macd_signal, out):
+    """Fill out[i] with (rsi, macd, signal, histogram) of the last lengths[i] closes of row i"""
+    n = closes.shape[1]
+    for i in prange(closes.shape[0]):
+        row = closes[i, n - lengths[i]:]
+        out[i, :] = np.nan
+        
+        if row.shape[0] >= rsi_period + 1:
+            # Same seed averages and RSI as a fresh RSIIndicator.calculate
+            avg_gain, avg_loss = _average_gain_loss_kernel(row[row.shape[0] - rsi_period - 1:])
+            if avg_loss == 0:
+                out[i, 0] = 100.0 if avg_gain > 0 else 50.0
+            else:
+                out[i, 0] = 100 - (100 / (1 + avg_gain / avg_loss))
+        
+        if row.shape[0] >= macd_slow:
+            # Same tuple as a fresh MACDIndicator.calculate
+            _, _, macd_values, signal = _macd_kernel(row, macd_fast, macd_slow, macd_signal)
+            out[i, 1] = macd_values[0]
+            out[i, 2] = signal
+            out[i, 3] = macd_values[0] - signal
+
+
+def indicator_matrix(closes: np.ndarray, rsi_period: int = 14, macd_fast: int = 12,
+                     macd_slow: int = 26, macd_signal: int = 9) -> np.ndarray:
+    """
+    RSI and MACD for many independent series in one compiled pass
+    
+    Args:
+        closes: 2-D float64 array, one series per row, left-padded with NaN
+            to a common length
+        rsi_period: RSI calculation period
+        macd_fast, macd_slow, macd_signal: MACD periods
+    
+    Returns:
+        Array of shape (rows, 4) with rsi, macd, signal and histogram per
+        row; NaN where a row is too short for the indicator
+    """
+    closes = np.ascontiguousarray(closes, dtype=np.float64)
+    lengths = np.count_nonzero(~np.isnan(closes), axis=1)
+    out = np.empty((closes.shape[0], 4))
+    _indicator_rows_kernel(closes, lengths, rsi_period, macd_fast, macd_slow, macd_signal, out)
+    return out
+
+
+# How a series passed to SeriesHistory.observe relates to the previous one
+SAME, EXTENDED, REPLACED = 0, 1, 2
+
+
+class SeriesHistory:
+    """Copy of the last close series seen, grown in amortized O(1) per appended bar"""
+    
+    def __init__(self):
+        self._buffer = np.empty(0)
+        self.length = 0
+    
+    @property
+    def closes(self) -> np.ndarray:
+        """The stored series (a view; do not modify)"""
+        return self._buffer[:self.length]
+    
+    def observe(self, closes) -> int:
+        """
+        Store closes as the current series
+        
+        Values are compared, not just the length and last close, so a
+        sliding window whose newest close repeats the previous one is not
+        mistaken for the same series.
+        
+        Returns:
+            SAME when closes equal the stored series, EXTENDED when they are
+            the stored series plus one bar, REPLACED otherwise
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        n = closes.shape[0]
+        seen = self.closes
+        if n == self.length and np.array_equal(closes, seen):
+            return SAME
+        if self.length and n == self.length + 1 and np.array_equal(closes[:-1], seen):
+            self.append(closes[-1])
+            return EXTENDED
+        
+        self._buffer = closes.copy()
+        self.length = n
+        return REPLACED
+    
+    def append(self, close: float):
+        """Add one close to the stored series"""
+        if self.length == self._buffer.shape[0]:
+            grown = np.empty(max(2 * self.length, 64))
+            grown[:self.length] = self.closes
+            self._buffer = grown
+        self._buffer[self.length] = close
+        self.length += 1
+
+
+class IndicatorStream:
+    """RSI and MACD that advance in O(1) when the closes grow by one bar"""
+    
+    def __init__(self, rsi_period: int = 14, macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9):
+        """
+        Initialize stream
+        
+        Args:
+            rsi_period: RSI calculation period
+            macd_fast, macd_slow, macd_signal: MACD periods
+        """
+        self.rsi = RSIIndicator(rsi_period)
+        self.macd = MACDIndicator(macd_fast, macd_slow, macd_signal)
+        
+        self.history = SeriesHistory()
+        self.values = (None, (None, None, None))
+    
+    def advance(self, closes) -> Tuple[Optional[float], Tuple[Optional[float], Optional[float], Optional[float]]]:
+        """
+        Indicator values for closes, reusing the state from the previous call
+        
+        When closes extend the previous series by exactly one bar the
+        indicators are advanced with update(); an unchanged series returns the
+        stored values; anything else rebuilds them with calculate().
+        
+        Args:
+            closes: List or float64 array of closing prices
+        
+        Returns:
+            Tuple of (rsi_value, (macd, signal, histogram))
+        """
+        # Extending only pays off once both indicators had enough history
+        primed = self.rsi.avg_gain is not None and self.macd.slow_ema is not None
+        relation = self.history.observe(closes)
+        if relation == SAME and self.history.length:
+            return self.values
+        if relation == EXTENDED and primed:
+            return self._advance_one(closes[-1])
+        
+        self.rsi.reset()
+        self.macd.reset()
+        self.values = (self.rsi.calculate(closes), self.macd.calculate(closes))
+        return self.values
+    
+    def update(self, close: float) -> Tuple[Optional[float], Tuple[Optional[float], Optional[float], Optional[float]]]:
+        """
+        Append one close to the series
+        
+        Returns:
+            Tuple of (rsi_value, (macd, signal, histogram)); values stay None
+            until advance() has seen enough history to prime the indicators
+        """
+        self.history.append(close)
+        return self._advance_one(close)
+    
+    def _advance_one(self, close: float):
+        """Step both indicators by a close already recorded in history"""
+        self.values = (self.rsi.update(close), self.macd.update(close))
+        return self.values
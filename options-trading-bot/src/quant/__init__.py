@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
-from scipy import stats
+from scipy.special import stdtr
 from src.core.logger import logger
 
 class QuantitativeAnalysis:
@@ -10,7 +10,7 @@ class QuantitativeAnalysis:
     @staticmethod
     def calculate_returns(prices: List[float]) -> np.ndarray:
         """Calculate daily returns"""
-        prices = np.array(prices)
+        prices = np.asarray(prices, dtype=np.float64)
         returns = np.diff(prices) / prices[:-1]
         return returns
     
@@ -47,13 +47,13 @@ class QuantitativeAnalysis:
         Returns:
             Sharpe ratio
         """
-        returns = np.array(returns)
-        excess_returns = returns - (risk_free_rate / 252)
+        excess_returns = np.asarray(returns, dtype=np.float64) - (risk_free_rate / 252)
+        std = excess_returns.std()
         
-        if np.std(excess_returns) == 0:
+        if std == 0:
             return 0.0
         
-        sharpe = np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(252)
+        sharpe = excess_returns.mean() / std * np.sqrt(252)
         return float(sharpe)
     
     @staticmethod
@@ -67,7 +67,7 @@ class QuantitativeAnalysis:
         Returns:
             Max drawdown as percentage
         """
-        prices = np.array(prices)
+        prices = np.asarray(prices, dtype=np.float64)
         cummax = np.maximum.accumulate(prices)
         drawdown = (prices - cummax) / cummax
         max_dd = np.min(drawdown)
@@ -129,8 +129,8 @@ class QuantitativeAnalysis:
             asset_returns = asset_returns[-min_len:]
             market_returns = market_returns[-min_len:]
         
-        asset_returns = np.array(asset_returns)
-        market_returns = np.array(market_returns)
+        asset_returns = np.asarray(asset_returns, dtype=np.float64)
+        market_returns = np.asarray(market_returns, dtype=np.float64)
         
         covariance = np.cov(asset_returns, market_returns)[0, 1]
         market_variance = np.var(market_returns)
@@ -175,15 +175,35 @@ class QuantitativeAnalysis:
         Returns:
             Regression stats including slope, intercept, R²
         """
-        prices = np.array(prices)
-        x = np.arange(len(prices))
-        
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, prices)
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        
+        # Closed-form least squares against x = 0..n-1 on centred data; the
+        # x mean and sum of squares are known exactly
+        x_mean = (n - 1) / 2
+        sxx = n * (n * n - 1) / 12
+        y_mean = prices.mean()
+        y_dev = prices - y_mean
+        sxy = (np.arange(n) - x_mean) @ y_dev
+        syy = y_dev @ y_dev
+        
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 0.0
+        
+        # Slope standard error and two-sided t-test p-value (as linregress)
+        dof = n - 2
+        ss_res = max(syy - slope * sxy, 0.0)
+        std_err = np.sqrt(ss_res / dof / sxx) if dof > 0 else 0.0
+        if std_err > 0:
+            p_value = 2 * stdtr(dof, -abs(slope / std_err))
+        else:
+            p_value = 1.0 if slope == 0 else 0.0
         
         return {
             'slope': float(slope),
             'intercept': float(intercept),
-            'r_squared': float(r_value ** 2),
+            'r_squared': float(r_squared),
             'p_value': float(p_value),
             'std_err': float(std_err),
             'trend': 'UP' if slope > 0 else 'DOWN'
@@ -206,26 +226,23 @@ class QuantitativeAnalysis:
         Returns:
             Probability distribution of future prices
         """
-        results = []
-        
-        for _ in range(simulations):
-            price = current_price
-            for _ in range(days):
-                daily_return = np.random.normal(returns_mean, returns_std)
-                price = price * (1 + daily_return)
-            results.append(price)
+        # All daily returns in one draw (same row-major order as stepping
+        # path by path), compounded along each row
+        growth = np.random.normal(returns_mean, returns_std, (simulations, days))
+        growth += 1
+        results = current_price * growth.prod(axis=1)
         
-        results = np.array(results)
+        percentiles = np.percentile(results, [5, 25, 75, 95])
         
         return {
             'mean_price': float(np.mean(results)),
             'std_dev': float(np.std(results)),
             'min_price': float(np.min(results)),
             'max_price': float(np.max(results)),
-            'percentile_5': float(np.percentile(results, 5)),
-            'percentile_25': float(np.percentile(results, 25)),
-            'percentile_75': float(np.percentile(results, 75)),
-            'percentile_95': float(np.percentile(results, 95)),
+            'percentile_5': float(percentiles[0]),
+            'percentile_25': float(percentiles[1]),
+            'percentile_75': float(percentiles[2]),
+            'percentile_95': float(percentiles[3]),
             'prob_up': float(np.sum(results > current_price) / simulations),
             'prob_down': float(np.sum(results < current_price) / simulations)
         }
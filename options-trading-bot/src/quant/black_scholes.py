@@ -7,9 +7,166 @@ risk exposure in options positions.
 """
 
 import math
-from typing import Dict, Tuple, Optional
-from scipy.stats import norm
+from typing import Dict, NamedTuple, Tuple, Optional
+import numpy as np
 from datetime import datetime, timedelta
+from src.core.jit import njit, prange
+
+class Greeks(NamedTuple):
+    """Option price and Greeks (floats, or arrays from calculate_greeks_batch)"""
+    price: float
+    delta: float
+    gamma: float
+    vega: float
+    theta: float
+    rho: float
+
+
+# Order of the rows written by _greeks_batch_kernel
+GREEK_FIELDS = Greeks._fields
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _greeks_batch_kernel(spot, strikes, t, vol, r, is_call, out):
+    """Fill out[:, i] with GREEK_FIELDS for strikes[i] (closed-form Black-Scholes)"""
+    sqrt_t = math.sqrt(t) if t > 0 else 0.0
+    degenerate = t <= 0 or vol <= 0 or spot <= 0
+    disc = math.exp(-r * t)
+    inv_sqrt2 = 1.0 / math.sqrt(2.0)
+    inv_sqrt2pi = 1.0 / math.sqrt(2.0 * math.pi)
+    gamma_den = spot * vol * sqrt_t
+    
+    for i in prange(strikes.shape[0]):
+        k = strikes[i]
+        if degenerate:
+            d1 = 0.0
+            d2 = 0.0
+        else:
+            d1 = (math.log(spot / k) + (r + 0.5 * vol * vol) * t) / (vol * sqrt_t)
+            d2 = d1 - vol * sqrt_t
+        
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * inv_sqrt2pi
+        disc_k = k * disc
+        decay = -spot * pdf_d1 * vol / (2 * sqrt_t) if sqrt_t > 0 else 0.0
+        
+        # N(x) = erfc(-x / sqrt(2)) / 2, accurate in both tails
+        if is_call:
+            nd1 = 0.5 * math.erfc(-d1 * inv_sqrt2)
+            nd2 = 0.5 * math.erfc(-d2 * inv_sqrt2)
+            out[0, i] = max(0.0, spot * nd1 - disc_k * nd2)
+            out[1, i] = nd1
+            out[4, i] = (decay - r * disc_k * nd2) / 365
+            out[5, i] = disc_k * t * nd2 / 100
+        else:
+            n_d1 = 0.5 * math.erfc(d1 * inv_sqrt2)
+            n_d2 = 0.5 * math.erfc(d2 * inv_sqrt2)
+            out[0, i] = max(0.0, disc_k * n_d2 - spot * n_d1)
+            out[1, i] = -n_d1
+            out[4, i] = (decay + r * disc_k * n_d2) / 365
+            out[5, i] = -disc_k * t * n_d2 / 100
+        out[2, i] = pdf_d1 / gamma_den if gamma_den > 0 else 0.0
+        out[3, i] = spot * pdf_d1 * sqrt_t / 100
+
+
+# Scalar kernels behind the BlackScholesModel staticmethods: each call runs
+# as machine code instead of a chain of scipy.stats dispatches
+
+@njit(cache=True, fastmath=True)
+def _norm_cdf(x):
+    """Standard normal CDF as erfc(-x / sqrt(2)) / 2, accurate in both tails"""
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+@njit(cache=True, fastmath=True)
+def _norm_pdf(x):
+    """Standard normal density"""
+    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+@njit(cache=True, fastmath=True)
+def _d1_d2_nb(spot, strike, t, vol, r):
+    """d1 and d2 of the Black-Scholes formula ((0, 0) for degenerate inputs)"""
+    if t <= 0 or vol <= 0 or spot <= 0:
+        return 0.0, 0.0
+    d1 = (math.log(spot / strike) + (r + 0.5 * vol ** 2) * t) / (vol * math.sqrt(t))
+    return d1, d1 - vol * math.sqrt(t)
+
+
+@njit(cache=True, fastmath=True)
+def _call_price_nb(spot, strike, t, vol, r):
+    d1, d2 = _d1_d2_nb(spot, strike, t, vol, r)
+    return max(0.0, spot * _norm_cdf(d1) - strike * math.exp(-r * t) * _norm_cdf(d2))
+
+
+@njit(cache=True, fastmath=True)
+def _put_price_nb(spot, strike, t, vol, r):
+    d1, d2 = _d1_d2_nb(spot, strike, t, vol, r)
+    return max(0.0, strike * math.exp(-r * t) * _norm_cdf(-d2) - spot * _norm_cdf(-d1))
+
+
+@njit(cache=True, fastmath=True)
+def _delta_nb(spot, strike, t, vol, r, is_call):
+    d1, _ = _d1_d2_nb(spot, strike, t, vol, r)
+    return _norm_cdf(d1) if is_call else _norm_cdf(d1) - 1
+
+
+@njit(cache=True, fastmath=True)
+def _gamma_nb(spot, strike, t, vol, r):
+    d1, _ = _d1_d2_nb(spot, strike, t, vol, r)
+    return _norm_pdf(d1) / (spot * vol * math.sqrt(t))
+
+
+@njit(cache=True, fastmath=True)
+def _vega_nb(spot, strike, t, vol, r):
+    d1, _ = _d1_d2_nb(spot, strike, t, vol, r)
+    return spot * _norm_pdf(d1) * math.sqrt(t) / 100
+
+
+@njit(cache=True, fastmath=True)
+def _theta_nb(spot, strike, t, vol, r, is_call):
+    d1, d2 = _d1_d2_nb(spot, strike, t, vol, r)
+    decay = -spot * _norm_pdf(d1) * vol / (2 * math.sqrt(t))
+    if is_call:
+        return (decay - r * strike * math.exp(-r * t) * _norm_cdf(d2)) / 365
+    return (decay + r * strike * math.exp(-r * t) * _norm_cdf(-d2)) / 365
+
+
+@njit(cache=True, fastmath=True)
+def _rho_nb(spot, strike, t, vol, r, is_call):
+    _, d2 = _d1_d2_nb(spot, strike, t, vol, r)
+    if is_call:
+        return strike * t * math.exp(-r * t) * _norm_cdf(d2) / 100
+    return -strike * t * math.exp(-r * t) * _norm_cdf(-d2) / 100
+
+
+@njit(cache=True, fastmath=True)
+def _greeks_nb(spot, strike, t, vol, r, is_call):
+    """Price, delta, gamma, vega, theta and rho in one compiled call"""
+    price = _call_price_nb(spot, strike, t, vol, r) if is_call else _put_price_nb(spot, strike, t, vol, r)
+    return (
+        price,
+        _delta_nb(spot, strike, t, vol, r, is_call),
+        _gamma_nb(spot, strike, t, vol, r),
+        _vega_nb(spot, strike, t, vol, r),
+        _theta_nb(spot, strike, t, vol, r, is_call),
+        _rho_nb(spot, strike, t, vol, r, is_call),
+    )
+
+
+@njit(cache=True)
+def _returns_std_kernel(prices):
+    """Population std of the simple returns of prices, without temporaries"""
+    n = prices.shape[0] - 1
+    total = 0.0
+    for i in range(n):
+        total += prices[i + 1] / prices[i] - 1.0
+    mean = total / n
+    
+    sq_dev = 0.0
+    for i in range(n):
+        dev = prices[i + 1] / prices[i] - 1.0 - mean
+        sq_dev += dev * dev
+    return math.sqrt(sq_dev / n)
 
 
 class BlackScholesModel:
@@ -59,17 +216,10 @@ class BlackScholesModel:
         Returns:
             Tuple of (d1, d2)
         """
-        if time_to_expiry <= 0 or volatility <= 0 or spot_price <= 0:
-            return 0.0, 0.0
-        
-        d1 = (
-            math.log(spot_price / strike_price) +
-            (risk_free_rate + 0.5 * volatility ** 2) * time_to_expiry
-        ) / (volatility * math.sqrt(time_to_expiry))
-        
-        d2 = d1 - volatility * math.sqrt(time_to_expiry)
-        
-        return d1, d2
+        return _d1_d2_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate)
+        )
     
     @staticmethod
     def call_price(
@@ -92,16 +242,10 @@ class BlackScholesModel:
         Returns:
             Call option price
         """
-        d1, d2 = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
-        )
-        
-        call = (
-            spot_price * norm.cdf(d1) -
-            strike_price * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
+        return _call_price_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate)
         )
-        
-        return max(0, call)
     
     @staticmethod
     def put_price(
@@ -124,16 +268,10 @@ class BlackScholesModel:
         Returns:
             Put option price
         """
-        d1, d2 = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
-        )
-        
-        put = (
-            strike_price * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) -
-            spot_price * norm.cdf(-d1)
+        return _put_price_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate)
         )
-        
-        return max(0, put)
     
     @staticmethod
     def delta(
@@ -152,14 +290,10 @@ class BlackScholesModel:
             - Put Delta: -1 to 0 (negative = bearish)
             - Delta of 0.5 = 50% probability ITM at expiration
         """
-        d1, _ = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
+        return _delta_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate), option_type.lower() == 'call'
         )
-        
-        if option_type.lower() == 'call':
-            return norm.cdf(d1)
-        else:  # put
-            return norm.cdf(d1) - 1
     
     @staticmethod
     def gamma(
@@ -177,12 +311,10 @@ class BlackScholesModel:
             - ATM options have highest Gamma
             - Gamma risk increases as expiration approaches
         """
-        d1, _ = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
+        return _gamma_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate)
         )
-        
-        gamma = norm.pdf(d1) / (spot_price * volatility * math.sqrt(time_to_expiry))
-        return gamma
     
     @staticmethod
     def vega(
@@ -201,12 +333,10 @@ class BlackScholesModel:
             - Higher Vega = more sensitive to volatility
             - Vega peaks at ATM, decreases toward expiration
         """
-        d1, _ = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
+        return _vega_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate)
         )
-        
-        vega = spot_price * norm.pdf(d1) * math.sqrt(time_to_expiry) / 100
-        return vega
     
     @staticmethod
     def theta(
@@ -227,22 +357,10 @@ class BlackScholesModel:
             - Theta accelerates as expiration approaches
             - Theta is positive for short positions
         """
-        d1, d2 = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
+        return _theta_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate), option_type.lower() == 'call'
         )
-        
-        if option_type.lower() == 'call':
-            theta = (
-                -spot_price * norm.pdf(d1) * volatility / (2 * math.sqrt(time_to_expiry)) -
-                risk_free_rate * strike_price * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
-            ) / 365
-        else:  # put
-            theta = (
-                -spot_price * norm.pdf(d1) * volatility / (2 * math.sqrt(time_to_expiry)) +
-                risk_free_rate * strike_price * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2)
-            ) / 365
-        
-        return theta
     
     @staticmethod
     def rho(
@@ -262,16 +380,10 @@ class BlackScholesModel:
             - Put Rho negative (hurt by rising rates)
             - Rho significance increases with time to expiration
         """
-        _, d2 = BlackScholesModel.calculate_d1_d2(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
+        return _rho_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate), option_type.lower() == 'call'
         )
-        
-        if option_type.lower() == 'call':
-            rho = strike_price * time_to_expiry * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2) / 100
-        else:  # put
-            rho = -strike_price * time_to_expiry * math.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) / 100
-        
-        return rho
     
     @staticmethod
     def price_option_chain(
@@ -313,41 +425,52 @@ class BlackScholesModel:
         volatility: float,
         option_type: str = 'call',
         risk_free_rate: float = RISK_FREE_RATE
-    ) -> Dict[str, float]:
+    ) -> Greeks:
         """
         Calculate all Greeks for an option
         
         Returns:
-            Dictionary with keys: delta, gamma, vega, theta, rho, price
+            Greeks tuple: price, delta, gamma, vega, theta, rho
         """
-        call_price = BlackScholesModel.call_price(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
-        )
-        put_price = BlackScholesModel.put_price(
-            spot_price, strike_price, time_to_expiry, volatility, risk_free_rate
-        )
+        return Greeks._make(_greeks_nb(
+            float(spot_price), float(strike_price), float(time_to_expiry),
+            float(volatility), float(risk_free_rate), option_type.lower() == 'call'
+        ))
+    
+    @staticmethod
+    def calculate_greeks_batch(
+        spot_price: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        volatility: float,
+        option_type: str = 'call',
+        risk_free_rate: float = RISK_FREE_RATE
+    ) -> Greeks:
+        """
+        Calculate price and all Greeks for an array of strikes in one pass
         
-        return {
-            'spot_price': spot_price,
-            'strike_price': strike_price,
-            'time_to_expiry_years': time_to_expiry,
-            'volatility': volatility,
-            'option_type': option_type,
-            'price': call_price if option_type.lower() == 'call' else put_price,
-            'delta': BlackScholesModel.delta(spot_price, strike_price, time_to_expiry, volatility, option_type, risk_free_rate),
-            'gamma': BlackScholesModel.gamma(spot_price, strike_price, time_to_expiry, volatility, risk_free_rate),
-            'vega': BlackScholesModel.vega(spot_price, strike_price, time_to_expiry, volatility, risk_free_rate),
-            'theta': BlackScholesModel.theta(spot_price, strike_price, time_to_expiry, volatility, option_type, risk_free_rate),
-            'rho': BlackScholesModel.rho(spot_price, strike_price, time_to_expiry, volatility, option_type, risk_free_rate),
-        }
-
-
-def estimate_volatility_from_prices(prices: list, window: int = 20) -> float:
+        Same formulas as calculate_greeks, evaluated by a parallel numba
+        kernel over strikes. Degenerate inputs (no time, volatility or spot)
+        give zero gamma and time decay instead of dividing by zero.
+        
+        Returns:
+            Greeks tuple of arrays, one entry per strike
+        """
+        strikes = np.ascontiguousarray(strikes, dtype=np.float64)
+        out = np.empty((len(GREEK_FIELDS), strikes.shape[0]))
+        _greeks_batch_kernel(
+            float(spot_price), strikes, float(time_to_expiry), float(volatility),
+            float(risk_free_rate), option_type.lower() == 'call', out
+        )
+        return Greeks._make(out)
+
+
+def estimate_volatility_from_prices(prices, window: int = 20) -> float:
     """
     Estimate annualized volatility from historical prices
     
     Args:
-        prices: List of closing prices
+        prices: List or float64 array of closing prices
         window: Number of periods to use (default 20 days)
         
     Returns:
@@ -356,24 +479,14 @@ def estimate_volatility_from_prices(prices: list, window: int = 20) -> float:
     if len(prices) < 2:
         return 0.20  # Default 20% if insufficient data
     
-    # Use most recent window
-    recent_prices = prices[-window:] if len(prices) >= window else prices
+    # Daily returns over the most recent window
+    recent_prices = np.asarray(prices[-window:], dtype=np.float64)
     
-    # Calculate daily returns
-    returns = []
-    for i in range(1, len(recent_prices)):
-        daily_return = (recent_prices[i] - recent_prices[i-1]) / recent_prices[i-1]
-        returns.append(daily_return)
-    
-    if not returns:
+    if recent_prices.size < 2:
         return 0.20
     
-    # Calculate standard deviation of returns
-    mean_return = sum(returns) / len(returns)
-    variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-    daily_volatility = math.sqrt(variance)
-    
-    # Annualize (252 trading days per year)
-    annual_volatility = daily_volatility * math.sqrt(252)
+    # Population standard deviation of returns, annualized (252 trading
+    # days); the kernel forms each return on the fly in two compiled passes
+    annual_volatility = _returns_std_kernel(recent_prices) * math.sqrt(252)
     
     return min(2.0, max(0.05, annual_volatility))  # Clamp between 5% and 200%
@@ -9,15 +9,116 @@ Uses geometric Brownian motion to simulate price paths and estimate:
 - Path-dependent option pricing (Asian, Barrier, etc.)
 """
 
-import random
 import math
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
+from src.core.jit import njit, prange
+from src.quant.black_scholes import BlackScholesModel
+
+# mc_precision names accepted by the strategies -> dtype of the simulated
+# arrays; float32 halves memory traffic and its rounding error sits far
+# below the 1/sqrt(N) sampling error of a Monte Carlo estimate
+MC_PRECISIONS = {'f32': np.float32, 'f64': np.float64}
+
+def make_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    Generator on the PCG64DXSM bit generator
+    
+    PCG64DXSM is NumPy's recommended bit generator for new code: faster per
+    normal than the legacy MT19937 global state and free of PCG64's
+    weaknesses with many parallel streams.
+    """
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+def _std_error(samples: np.ndarray, antithetic: Optional[bool] = None,
+               interleaved: bool = False) -> np.ndarray:
+    """
+    Standard error of samples.mean(axis=-1)
+    
+    Antithetic samples (USE_ANTITHETIC if None) are not independent, so the
+    error comes from the num_simulations // 2 pair means instead. Pairs sit
+    in mirrored halves as drawn by _draw_normals, or in adjacent even/odd
+    entries with interleaved (simulate_price_paths rows); an unpaired last
+    draw is left out of the error.
+    """
+    if antithetic is None:
+        antithetic = MonteCarloSimulator.USE_ANTITHETIC
+    n = samples.shape[-1]
+    pairs = n // 2
+    if not antithetic or pairs < 2:
+        return samples.std(axis=-1) / math.sqrt(n)
+    if interleaved:
+        first, second = samples[..., 0:2 * pairs:2], samples[..., 1:2 * pairs:2]
+    else:
+        first, second = samples[..., :pairs], samples[..., n - pairs:]
+    return ((first + second) * 0.5).std(axis=-1) / math.sqrt(pairs)
+
+
+# Order of the rows written by _terminal_stats_kernel
+TERMINAL_STAT_FIELDS = (
+    'option_price', 'std_error', 'prob_itm_at_expiry', 'var_95', 'cvar_95',
+    'best_gain', 'expected_payoff'
+)
+
+
+@njit(cache=True, parallel=True)
+def _terminal_stats_kernel(spots, strikes, drifts, scales, sizes, premiums, z, discount, zero,
+                           is_call, cutoff, pairs, out):
+    """
+    Fill out[:, i] with TERMINAL_STAT_FIELDS for underlying i (shared normals z)
+    
+    Every per-path operand has z's dtype (the float64 scalars are reduced
+    or passed in by the caller), so float32 normals keep the path arrays
+    in float32. pairs is the number of antithetic pairs in z's mirrored
+    halves (0 without antithetic); see _std_error.
+    """
+    n = z.shape[0]
+    
+    for i in prange(spots.shape[0]):
+        final_prices = spots[i] * np.exp(drifts[i] + scales[i] * z)
+        if is_call:
+            moneyness = final_prices - strikes[i]
+        else:
+            moneyness = strikes[i] - final_prices
+        payoffs = np.maximum(moneyness, zero)
+        discounted = payoffs * discount
+        
+        # Same P&L and VaR/CVaR conventions as simulate_and_analyze
+        pnl = np.partition((payoffs - premiums[i]) * sizes[i], cutoff)
+        var = -pnl[cutoff]
+        
+        out[0, i] = discounted.mean()
+        if pairs > 1:
+            pair_means = (discounted[:pairs] + discounted[n - pairs:]) * 0.5
+            out[1, i] = pair_means.std() / math.sqrt(pairs)
+        else:
+            out[1, i] = discounted.std() / math.sqrt(n)
+        out[2, i] = np.count_nonzero(moneyness > 0) / n
+        out[3, i] = var
+        out[4, i] = -pnl[:cutoff].mean() if cutoff > 0 else var
+        out[5, i] = pnl.max()
+        out[6, i] = payoffs.mean()
 
 
 class MonteCarloSimulator:
     """Monte Carlo simulation for options and risk analysis"""
     
+    # Default for every antithetic=None argument: pair each normal draw Z
+    # with -Z, halving RNG cost and variance for monotone payoffs
+    USE_ANTITHETIC = True
+    
+    # Default for every qmc=None argument: draw normals from a scrambled
+    # Sobol sequence (via scipy) instead of a pseudo-random generator. Error
+    # falls closer to O(1/N) than O(1/sqrt(N)) for smooth payoffs, but the
+    # sequence is only balanced when the number of draws is a power of two
+    USE_QMC = False
+    
+    # Generator behind every rng=None argument; MonteCarloSimulator(seed)
+    # replaces it with a seeded one
+    RNG = make_rng()
+    
     def __init__(self, seed: Optional[int] = None):
         """
         Initialize Monte Carlo simulator
@@ -26,7 +127,7 @@ class MonteCarloSimulator:
             seed: Random seed for reproducibility
         """
         if seed is not None:
-            random.seed(seed)
+            MonteCarloSimulator.RNG = make_rng(seed)
         self.simulation_results = None
     
     @staticmethod
@@ -36,8 +137,11 @@ class MonteCarloSimulator:
         risk_free_rate: float,
         time_steps: int,
         num_simulations: int,
-        days_to_expiry: int
-    ) -> List[List[float]]:
+        days_to_expiry: int,
+        antithetic: Optional[bool] = None,
+        rng: Optional[np.random.Generator] = None,
+        dtype=np.float64
+    ) -> np.ndarray:
         """
         Simulate stock price paths using geometric Brownian motion
         
@@ -55,33 +159,332 @@ class MonteCarloSimulator:
             time_steps: Number of time steps to simulate
             num_simulations: Number of price paths to generate
             days_to_expiry: Days until expiration
+            antithetic: Generate paths in mirrored pairs (USE_ANTITHETIC if None)
+            rng: Generator to draw from (MonteCarloSimulator.RNG if None)
+            dtype: Float dtype of the paths (see MC_PRECISIONS)
             
         Returns:
-            List of price paths, each path is a list of prices
+            C-contiguous array of shape (num_simulations, time_steps + 1),
+            one price path per row starting at spot_price
         """
+        if antithetic is None:
+            antithetic = MonteCarloSimulator.USE_ANTITHETIC
         dt = days_to_expiry / (365 * time_steps)  # Time step in years
         
-        paths = []
+        # GBM step: exp(drift + diffusion * Z)
+        drift = (risk_free_rate - 0.5 * volatility ** 2) * dt
+        diffusion = volatility * math.sqrt(dt)
+        
+        # All normals in one draw; with antithetic every even row's shocks are
+        # mirrored into the odd row after it
+        num_draws = (num_simulations + 1) // 2 if antithetic else num_simulations
+        if rng is None:
+            rng = MonteCarloSimulator.RNG
+        shocks = rng.standard_normal((num_draws, time_steps), dtype=dtype)
+        
+        # Log-price increments, column 0 being the spot itself
+        paths = np.empty((num_simulations, time_steps + 1), dtype=dtype)
+        paths[:, 0] = 0.0
+        if antithetic:
+            paths[0::2, 1:] = shocks
+            np.negative(shocks[:num_simulations // 2], out=paths[1::2, 1:])
+        else:
+            paths[:, 1:] = shocks
+        paths[:, 1:] *= diffusion
+        paths[:, 1:] += drift
+        
+        # Compound along each path: S_t = S_0 * exp(sum of increments)
+        np.cumsum(paths, axis=1, out=paths)
+        np.exp(paths, out=paths)
+        paths *= spot_price
+        return paths
+    
+    @staticmethod
+    def _draw_normals(
+        num_simulations: int,
+        antithetic: Optional[bool] = None,
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+        qmc: Optional[bool] = None,
+        dtype=np.float64
+    ) -> np.ndarray:
+        """
+        Standard normals (Z, -Z halves if antithetic), written into out when given
+        
+        With qmc the independent half (or all, without antithetic) comes from
+        a scrambled 1-D Sobol sequence seeded from rng, mapped through the
+        normal inverse CDF. The array has out's dtype if given, else dtype.
+        """
+        if antithetic is None:
+            antithetic = MonteCarloSimulator.USE_ANTITHETIC
+        if qmc is None:
+            qmc = MonteCarloSimulator.USE_QMC
+        z = np.empty(num_simulations, dtype=dtype) if out is None else out[:num_simulations]
+        num_draws = (num_simulations + 1) // 2 if antithetic else num_simulations
+        if rng is None:
+            rng = MonteCarloSimulator.RNG
+        if qmc:
+            from scipy.special import ndtri
+            from scipy.stats import qmc as scipy_qmc
+            sampler = scipy_qmc.Sobol(d=1, scramble=True, seed=rng)
+            ndtri(sampler.random(num_draws)[:, 0], out=z[:num_draws])
+        else:
+            rng.standard_normal(out=z[:num_draws], dtype=z.dtype)
+        if antithetic:
+            np.negative(z[:num_simulations - num_draws], out=z[num_draws:])
+        return z
+    
+    @staticmethod
+    def simulate_terminal_prices(
+        spot_price: float,
+        volatility: float,
+        risk_free_rate: float,
+        days_to_expiry: int,
+        num_simulations: int,
+        antithetic: Optional[bool] = None,
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+        qmc: Optional[bool] = None,
+        dtype=np.float64
+    ) -> np.ndarray:
+        """
+        Draw GBM prices at expiry directly (exact for GBM, no intermediate steps)
+        
+        With antithetic variates (USE_ANTITHETIC unless overridden) half the
+        normals are drawn and mirrored (Z, -Z), which reduces variance for
+        monotone payoffs at no extra RNG cost.
+        
+        Args:
+            rng: Generator to draw from (MonteCarloSimulator.RNG if None)
+            out: Preallocated buffer of at least num_simulations; the prices
+                are computed in place (in its dtype) and a view of it is returned
+            qmc: Use scrambled Sobol normals (USE_QMC if None); keep the
+                number of draws a power of two
+            dtype: Float dtype of the prices when out is None (see MC_PRECISIONS)
+        
+        Returns:
+            Array of num_simulations terminal prices
+        """
+        time_to_expiry = days_to_expiry / 365
+        z = MonteCarloSimulator._draw_normals(num_simulations, antithetic, rng, out, qmc, dtype)
+        
+        z *= volatility * math.sqrt(time_to_expiry)
+        z += (risk_free_rate - 0.5 * volatility ** 2) * time_to_expiry
+        np.exp(z, out=z)
+        z *= spot_price
+        return z
+    
+    @staticmethod
+    def simulate_importance_sampled(
+        spot_price: float,
+        strike_price,
+        volatility: float,
+        risk_free_rate: float,
+        days_to_expiry: int,
+        option_type: str = 'call',
+        num_simulations: int = 10000,
+        min_shift: float = 0.5,
+        rng: Optional[np.random.Generator] = None
+    ) -> Dict[str, float]:
+        """
+        European price and ITM probability with the normal shifted to the strike
+        
+        For out-of-the-money strikes almost every plain GBM path pays zero.
+        Drawing Z + x instead, where x is the normal score at which the
+        terminal price equals the strike, puts about half the paths in the
+        money; each path is reweighted by the likelihood ratio
+        exp(-x*Z - x^2/2), so the estimator stays unbiased. Strikes less than
+        min_shift standard deviations out of the money are not shifted.
+        
+        Args:
+            spot_price: Current stock price
+            strike_price: Strike price, or array of strikes (one shared sample)
+            volatility: Annual volatility
+            risk_free_rate: Annual risk-free rate
+            days_to_expiry: Days until expiration
+            option_type: 'call' or 'put'
+            num_simulations: Number of simulations
+            min_shift: Smallest |x| worth shifting
+            rng: Generator to draw from (MonteCarloSimulator.RNG if None)
+            
+        Returns:
+            Dictionary with option_price, std_error, prob_itm_at_expiry and
+            shift (arrays shaped like strike_price when it is an array)
+        """
+        strikes = np.asarray(strike_price, dtype=np.float64)
+        time_to_expiry = days_to_expiry / 365
+        drift = (risk_free_rate - 0.5 * volatility ** 2) * time_to_expiry
+        diffusion = volatility * math.sqrt(time_to_expiry)
+        is_call = option_type.lower() == 'call'
+        
+        # Normal score that lands exactly on the strike; shift only if OTM
+        shift = (np.log(strikes / spot_price) - drift) / diffusion
+        otm = shift >= min_shift if is_call else shift <= -min_shift
+        shift = np.where(otm, shift, 0.0)[..., None]
+        
+        z = MonteCarloSimulator._draw_normals(num_simulations, rng=rng)
+        final_prices = spot_price * np.exp(drift + diffusion * (z + shift))
+        weights = np.exp(-shift * z - 0.5 * shift * shift)
+        
+        if is_call:
+            moneyness = final_prices - strikes[..., None]
+        else:  # put
+            moneyness = strikes[..., None] - final_prices
+        discounted = np.maximum(moneyness, 0.0) * weights * math.exp(-risk_free_rate * time_to_expiry)
+        
+        result = {
+            'option_price': discounted.mean(axis=-1),
+            'std_error': _std_error(discounted),
+            'prob_itm_at_expiry': np.where(moneyness > 0, weights, 0.0).mean(axis=-1),
+            'shift': shift[..., 0],
+        }
+        if strikes.ndim == 0:
+            result = {name: float(value) for name, value in result.items()}
+        result['num_simulations'] = num_simulations
+        return result
+    
+    @staticmethod
+    def simulate_and_analyze(
+        spot_price: float,
+        strike_price: float,
+        volatility: float,
+        risk_free_rate: float,
+        days_to_expiry: int,
+        option_type: str = 'call',
+        position_size: int = 1,
+        confidence_level: float = 0.95,
+        num_simulations: int = 10000,
+        antithetic: Optional[bool] = None,
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+        qmc: Optional[bool] = None,
+        dtype=np.float64
+    ) -> Dict[str, float]:
+        """
+        Option price, ITM probability and VaR/CVaR from one simulation
+        
+        All statistics are functionals of the same terminal-price sample, so
+        this replaces separate price_european_option, calculate_probability_itm
+        and calculate_var_cvar calls (same payoff and P&L conventions).
         
-        for _ in range(num_simulations):
-            path = [spot_price]
-            current_price = spot_price
+        Args:
+            spot_price: Current stock price
+            strike_price: Option strike price
+            volatility: Annual volatility
+            risk_free_rate: Annual risk-free rate
+            days_to_expiry: Days until expiration
+            option_type: 'call' or 'put'
+            position_size: Number of option contracts (for VaR/CVaR)
+            confidence_level: VaR confidence level (0.90, 0.95, 0.99)
+            num_simulations: Number of simulations
+            antithetic: Use antithetic variates (USE_ANTITHETIC if None)
+            rng: Generator to draw from (see simulate_terminal_prices)
+            out: Reusable buffer for the terminal prices
+            qmc: Use scrambled Sobol normals (USE_QMC if None)
+            dtype: Float dtype of the simulated arrays (see MC_PRECISIONS);
+                the reductions run in it and are reported as Python floats
             
-            for _ in range(time_steps):
-                # Random normal variable
-                random_normal = random.gauss(0, 1)
-                
-                # GBM step
-                drift = (risk_free_rate - 0.5 * volatility ** 2) * dt
-                diffusion = volatility * math.sqrt(dt) * random_normal
-                
-                # New price
-                current_price = current_price * math.exp(drift + diffusion)
-                path.append(current_price)
+        Returns:
+            Dictionary with option_price, std_error, prob_itm_at_expiry,
+            var_95, cvar_95, best_gain and expected_payoff
+        """
+        final_prices = MonteCarloSimulator.simulate_terminal_prices(
+            spot_price, volatility, risk_free_rate, days_to_expiry, num_simulations, antithetic,
+            rng, out, qmc, dtype
+        )
+        
+        if option_type.lower() == 'call':
+            moneyness = final_prices - strike_price
+        else:  # put
+            moneyness = strike_price - final_prices
+        payoffs = np.maximum(moneyness, 0.0)
+        
+        discount_factor = math.exp(-risk_free_rate * (days_to_expiry / 365))
+        discounted = payoffs * discount_factor
+        
+        # P&L per path against a rough ATM premium; an O(N) partition puts
+        # the VaR order statistic at cutoff with the worse tail before it
+        # (and the best path last)
+        cutoff = int(num_simulations * (1 - confidence_level))
+        pnl = np.partition(
+            (payoffs - 0.05 * spot_price) * position_size, [cutoff, num_simulations - 1]
+        )
+        var = -pnl[cutoff]
+        cvar = -pnl[:cutoff].mean() if cutoff > 0 else var
+        
+        return {
+            'option_price': float(discounted.mean()),
+            'std_error': float(_std_error(discounted, antithetic)),
+            'prob_itm_at_expiry': float(np.count_nonzero(moneyness > 0) / num_simulations),
+            'var_95': float(var),
+            'cvar_95': float(cvar),
+            'best_gain': float(pnl[-1]),
+            'expected_payoff': float(payoffs.mean()),
+            'num_simulations': num_simulations
+        }
+    
+    @staticmethod
+    def simulate_and_analyze_batch(
+        spot_prices,
+        strike_prices,
+        volatilities,
+        risk_free_rate: float,
+        days_to_expiry: int,
+        option_type: str = 'call',
+        position_sizes=1,
+        confidence_level: float = 0.95,
+        num_simulations: int = 10000,
+        antithetic: Optional[bool] = None,
+        rng: Optional[np.random.Generator] = None,
+        qmc: Optional[bool] = None,
+        dtype=np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        simulate_and_analyze for many underlyings in one parallel pass
+        
+        Every underlying is priced against the same normal draws (common
+        random numbers), and the per-underlying work runs in a numba prange
+        loop when numba is installed.
+        
+        Args:
+            spot_prices, strike_prices, volatilities: One entry per underlying
+            position_sizes: Contracts per underlying (scalar or array)
+            Other arguments as in simulate_and_analyze
             
-            paths.append(path)
+        Returns:
+            Dictionary of TERMINAL_STAT_FIELDS arrays (one entry per
+            underlying, in dtype) plus num_simulations
+        """
+        spots = np.ascontiguousarray(spot_prices, dtype=np.float64)
+        strikes = np.broadcast_to(np.asarray(strike_prices, dtype=np.float64), spots.shape)
+        vols = np.broadcast_to(np.asarray(volatilities, dtype=np.float64), spots.shape)
+        sizes = np.broadcast_to(np.asarray(position_sizes, dtype=np.float64), spots.shape)
+        
+        # Per-underlying GBM coefficients, computed in float64 and then cast
+        # to the path dtype alongside everything else the kernel touches
+        t = days_to_expiry / 365
+        drifts = (risk_free_rate - 0.5 * vols ** 2) * t
+        scales = vols * math.sqrt(t)
+        premiums = 0.05 * spots
+        spots, strikes, drifts, scales, sizes, premiums = (
+            np.array(a, dtype=dtype)
+            for a in (spots, strikes, drifts, scales, sizes, premiums)
+        )
         
-        return paths
+        if antithetic is None:
+            antithetic = MonteCarloSimulator.USE_ANTITHETIC
+        z = MonteCarloSimulator._draw_normals(num_simulations, antithetic, rng, qmc=qmc, dtype=dtype)
+        out = np.empty((len(TERMINAL_STAT_FIELDS), spots.shape[0]), dtype=dtype)
+        _terminal_stats_kernel(
+            spots, strikes, drifts, scales, sizes, premiums, z,
+            z.dtype.type(math.exp(-risk_free_rate * t)), z.dtype.type(0),
+            option_type.lower() == 'call', int(num_simulations * (1 - confidence_level)),
+            num_simulations // 2 if antithetic else 0, out
+        )
+        
+        result = dict(zip(TERMINAL_STAT_FIELDS, out))
+        result['num_simulations'] = num_simulations
+        return result
     
     @staticmethod
     def price_european_option(
@@ -105,35 +508,33 @@ class MonteCarloSimulator:
             days_to_expiry: Days until expiration
             option_type: 'call' or 'put'
             num_simulations: Number of simulations
-            time_steps: Time steps per simulation
+            time_steps: Unused; the payoff only depends on the terminal price,
+                which is drawn exactly without intermediate steps
             
         Returns:
-            Dictionary with price, std_error, 95% confidence interval
+            Dictionary with price, std_error, 95% confidence interval, and
+            the final_prices and payoffs arrays
         """
-        paths = MonteCarloSimulator.simulate_price_paths(
-            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry
+        final_prices = MonteCarloSimulator.simulate_terminal_prices(
+            spot_price, volatility, risk_free_rate, days_to_expiry, num_simulations
         )
         
-        # Get final prices
-        final_prices = [path[-1] for path in paths]
-        
         # Calculate payoffs
         if option_type.lower() == 'call':
-            payoffs = [max(price - strike_price, 0) for price in final_prices]
+            payoffs = np.maximum(final_prices - strike_price, 0.0)
         else:  # put
-            payoffs = [max(strike_price - price, 0) for price in final_prices]
+            payoffs = np.maximum(strike_price - final_prices, 0.0)
         
         # Discount to present value
         discount_factor = math.exp(-risk_free_rate * (days_to_expiry / 365))
-        discounted_payoffs = [payoff * discount_factor for payoff in payoffs]
+        discounted_payoffs = payoffs * discount_factor
         
         # Calculate statistics
-        mean_price = sum(discounted_payoffs) / len(discounted_payoffs)
+        mean_price = float(discounted_payoffs.mean())
         
-        # Standard error
-        variance = sum((p - mean_price) ** 2 for p in discounted_payoffs) / len(discounted_payoffs)
-        std_dev = math.sqrt(variance)
-        std_error = std_dev / math.sqrt(num_simulations)
+        # Standard error (over antithetic pair means)
+        std_dev = float(discounted_payoffs.std())
+        std_error = float(_std_error(discounted_payoffs))
         
         # 95% confidence interval
         ci_lower = mean_price - 1.96 * std_error
@@ -172,36 +573,47 @@ class MonteCarloSimulator:
             days_to_expiry: Days until expiration
             option_type: 'call' or 'put'
             num_simulations: Number of simulations
-            time_steps: Time steps per simulation
+            time_steps: Unused; only terminal prices are simulated (see
+                prob_touch_strike below)
             
         Returns:
-            Dictionary with ITM probability and max price reached
+            Dictionary with ITM probability and the probability of touching
+            the strike before expiry (continuously monitored: the chance a
+            Brownian bridge from spot to each terminal price crosses it)
         """
-        paths = MonteCarloSimulator.simulate_price_paths(
-            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry
+        final_prices = MonteCarloSimulator.simulate_terminal_prices(
+            spot_price, volatility, risk_free_rate, days_to_expiry, num_simulations
         )
         
-        # Get final prices and max prices
-        final_prices = [path[-1] for path in paths]
-        max_prices = [max(path) for path in paths]
-        
-        # Calculate ITM outcomes
+        # Log distances of the strike from both ends of each path, positive
+        # while the strike lies beyond them (above for calls, below for puts)
         if option_type.lower() == 'call':
-            itm_count = sum(1 for p in final_prices if p > strike_price)
-            max_price_at_strike = sum(1 for p in max_prices if p > strike_price)
+            itm = final_prices > strike_price
+            start_gap = math.log(strike_price / spot_price)
+            end_gaps = np.log(strike_price / final_prices)
         else:  # put
-            itm_count = sum(1 for p in final_prices if p < strike_price)
-            max_price_at_strike = sum(1 for p in max_prices if p < strike_price)
-        
-        prob_itm = itm_count / num_simulations
-        prob_touch = max_price_at_strike / num_simulations
+            itm = final_prices < strike_price
+            start_gap = math.log(spot_price / strike_price)
+            end_gaps = np.log(final_prices / strike_price)
+        
+        # Given both endpoints, the bridge crosses the strike with probability
+        # exp(-2 * start_gap * end_gap / (sigma^2 * T)), and surely if either
+        # end is already past it
+        variance = volatility ** 2 * days_to_expiry / 365
+        if start_gap <= 0:
+            prob_touch = 1.0
+        elif variance > 0:
+            touch = np.exp(-2 * start_gap * np.maximum(end_gaps, 0.0) / variance)
+            prob_touch = float(touch.mean())
+        else:
+            prob_touch = float(itm.mean())
         
         return {
-            'prob_itm_at_expiry': prob_itm,
+            'prob_itm_at_expiry': float(itm.mean()),
             'prob_touch_strike': prob_touch,
-            'min_final_price': min(final_prices),
-            'max_final_price': max(final_prices),
-            'avg_final_price': sum(final_prices) / len(final_prices),
+            'min_final_price': float(final_prices.min()),
+            'max_final_price': float(final_prices.max()),
+            'avg_final_price': float(final_prices.mean()),
             'num_simulations': num_simulations
         }
     
@@ -234,54 +646,48 @@ class MonteCarloSimulator:
             days_to_expiry: Days until expiration
             confidence_level: Confidence level (0.90, 0.95, 0.99)
             num_simulations: Number of simulations
-            time_steps: Time steps per simulation
+            time_steps: Unused; the P&L only depends on the terminal price,
+                which is drawn exactly without intermediate steps
             
         Returns:
             Dictionary with VaR, CVaR, and percentiles
         """
-        paths = MonteCarloSimulator.simulate_price_paths(
-            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry
+        final_prices = MonteCarloSimulator.simulate_terminal_prices(
+            spot_price, volatility, risk_free_rate, days_to_expiry, num_simulations
         )
         
-        # Calculate P&L for each path
-        pnl_list = []
-        
-        for path in paths:
-            final_price = path[-1]
-            
-            if option_type.lower() == 'call':
-                payoff = max(final_price - strike_price, 0)
-                # Assume bought at ATM
-                premium = 0.05 * spot_price  # Rough estimate
-            else:  # put
-                payoff = max(strike_price - final_price, 0)
-                premium = 0.05 * spot_price
-            
-            # PnL per contract
-            pnl_per_contract = payoff - premium
-            
-            # Total PnL for position
-            total_pnl = pnl_per_contract * position_size
-            pnl_list.append(total_pnl)
+        if option_type.lower() == 'call':
+            payoffs = np.maximum(final_prices - strike_price, 0.0)
+        else:  # put
+            payoffs = np.maximum(strike_price - final_prices, 0.0)
         
-        # Sort P&L (worst to best)
-        pnl_list.sort()
+        # Total position P&L per path, assuming the option was bought at a
+        # rough ATM premium
+        premium = 0.05 * spot_price
+        pnl = (payoffs - premium) * position_size
         
-        # Calculate percentiles
+        # Only a handful of order statistics are needed, so partition around
+        # them (O(N)) instead of sorting; everything before percentile_5 is
+        # then the worse tail for CVaR
         percentile_5 = int(num_simulations * (1 - confidence_level))
         percentile_10 = int(num_simulations * 0.10)
+        median_idx = num_simulations // 2
+        upper_10 = -percentile_10 % num_simulations
+        pnl = np.partition(
+            pnl, sorted({0, percentile_5, percentile_10, median_idx, upper_10, num_simulations - 1})
+        )
         
-        var = -pnl_list[percentile_5]  # Negative because loss
-        cvar = -sum(pnl_list[:percentile_5]) / percentile_5 if percentile_5 > 0 else var
+        var = -pnl[percentile_5]  # Negative because loss
+        cvar = -pnl[:percentile_5].mean() if percentile_5 > 0 else var
         
         return {
-            'var_95': var,
-            'cvar_95': cvar,
-            'worst_loss': -pnl_list[0],
-            'best_gain': pnl_list[-1],
-            'median_pnl': pnl_list[num_simulations // 2],
-            'percentile_10': pnl_list[percentile_10],
-            'percentile_90': pnl_list[-percentile_10],
+            'var_95': float(var),
+            'cvar_95': float(cvar),
+            'worst_loss': float(-pnl[0]),
+            'best_gain': float(pnl[-1]),
+            'median_pnl': float(pnl[median_idx]),
+            'percentile_10': float(pnl[percentile_10]),
+            'percentile_90': float(pnl[upper_10]),
             'num_simulations': num_simulations
         }
     
@@ -294,7 +700,9 @@ class MonteCarloSimulator:
         days_to_expiry: int,
         option_type: str = 'call',
         num_simulations: int = 10000,
-        time_steps: int = 252
+        time_steps: int = 252,
+        control_variate: bool = True,
+        dtype=np.float64
     ) -> Dict[str, float]:
         """
         Price Asian option (arithmetic average) using Monte Carlo
@@ -302,6 +710,11 @@ class MonteCarloSimulator:
         Asian options use average price over life of option, which reduces volatility
         compared to European options.
         
+        With control_variate the European payoff on the same paths, whose
+        exact Black-Scholes price is known, corrects the Asian estimate:
+        A - beta * (E - E_bs) with beta = cov(A, E) / var(E). The two payoffs
+        are strongly correlated, so the standard error shrinks several-fold.
+        
         Args:
             spot_price: Current stock price
             strike_price: Option strike price
@@ -311,32 +724,57 @@ class MonteCarloSimulator:
             option_type: 'call' or 'put'
             num_simulations: Number of simulations
             time_steps: Time steps per simulation
+            control_variate: Adjust by the European payoff (see above)
+            dtype: Float dtype of the paths (see MC_PRECISIONS); averages
+                and payoffs are always float64
             
         Returns:
             Dictionary with option price and statistics
         """
         paths = MonteCarloSimulator.simulate_price_paths(
-            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry
+            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry,
+            dtype=dtype
         )
         
         # Calculate average price for each path
-        average_prices = [sum(path) / len(path) for path in paths]
+        average_prices = paths.mean(axis=1, dtype=np.float64)
+        final_prices = paths[:, -1].astype(np.float64)
+        is_call = option_type.lower() == 'call'
         
         # Calculate payoffs using average
-        if option_type.lower() == 'call':
-            payoffs = [max(avg - strike_price, 0) for avg in average_prices]
+        if is_call:
+            payoffs = np.maximum(average_prices - strike_price, 0.0)
         else:  # put
-            payoffs = [max(strike_price - avg, 0) for avg in average_prices]
+            payoffs = np.maximum(strike_price - average_prices, 0.0)
         
         # Discount to present value
         discount_factor = math.exp(-risk_free_rate * (days_to_expiry / 365))
-        discounted_payoffs = [payoff * discount_factor for payoff in payoffs]
+        discounted_payoffs = payoffs * discount_factor
+        
+        if control_variate:
+            # European payoff on the same paths against its closed form
+            if is_call:
+                european = np.maximum(final_prices - strike_price, 0.0)
+                european_exact = BlackScholesModel.call_price(
+                    spot_price, strike_price, days_to_expiry / 365, volatility, risk_free_rate
+                )
+            else:
+                european = np.maximum(strike_price - final_prices, 0.0)
+                european_exact = BlackScholesModel.put_price(
+                    spot_price, strike_price, days_to_expiry / 365, volatility, risk_free_rate
+                )
+            european *= discount_factor
+            european -= european_exact
+            
+            european_var = european.var()
+            if european_var > 0:
+                beta = np.mean((discounted_payoffs - discounted_payoffs.mean()) * european) / european_var
+                discounted_payoffs -= beta * european
         
         # Calculate statistics
-        mean_price = sum(discounted_payoffs) / len(discounted_payoffs)
-        variance = sum((p - mean_price) ** 2 for p in discounted_payoffs) / len(discounted_payoffs)
-        std_dev = math.sqrt(variance)
-        std_error = std_dev / math.sqrt(num_simulations)
+        mean_price = float(discounted_payoffs.mean())
+        std_dev = float(discounted_payoffs.std())
+        std_error = float(_std_error(discounted_payoffs, interleaved=True))
         
         return {
             'option_price': mean_price,
@@ -354,43 +792,42 @@ class MonteCarloSimulator:
         risk_free_rate: float,
         days_to_expiry: int,
         num_simulations: int = 10000,
-        time_steps: int = 252
+        time_steps: int = 252,
+        dtype=np.float32
     ) -> Dict[str, float]:
         """
         Analyze stock price path statistics for risk assessment
         
-        Returns statistics about price movements across all simulations
+        Returns statistics about price movements across all simulations.
+        Only aggregates are reported, so the paths are stored in float32 by
+        default (half the memory traffic, rounding far below the sampling
+        error) while every mean and std accumulates in float64.
         """
         paths = MonteCarloSimulator.simulate_price_paths(
-            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry
+            spot_price, volatility, risk_free_rate, time_steps, num_simulations, days_to_expiry,
+            dtype=dtype
         )
         
-        final_prices = [path[-1] for path in paths]
-        max_prices = [max(path) for path in paths]
-        min_prices = [min(path) for path in paths]
-        
-        # Calculate max drawdown for each path
-        drawdowns = []
-        for path in paths:
-            running_max = path[0]
-            max_dd = 0
-            for price in path[1:]:
-                if price > running_max:
-                    running_max = price
-                dd = (running_max - price) / running_max
-                max_dd = max(max_dd, dd)
-            drawdowns.append(max_dd)
+        final_prices = paths[:, -1].astype(np.float64)
+        min_price_mean = paths.min(axis=1).mean(dtype=np.float64)
+        
+        # Calculate max drawdown for each path against its running peak,
+        # reusing the path buffer for the drawdowns
+        running_max = np.maximum.accumulate(paths, axis=1)
+        np.subtract(running_max, paths, out=paths)
+        paths /= running_max
+        drawdowns = paths.max(axis=1)
         
         return {
-            'final_price_mean': sum(final_prices) / len(final_prices),
-            'final_price_std': math.sqrt(sum((p - sum(final_prices)/len(final_prices))**2 for p in final_prices) / len(final_prices)),
-            'final_price_min': min(final_prices),
-            'final_price_max': max(final_prices),
-            'max_price_mean': sum(max_prices) / len(max_prices),
-            'min_price_mean': sum(min_prices) / len(min_prices),
-            'avg_max_drawdown': sum(drawdowns) / len(drawdowns),
-            'worst_case_drawdown': max(drawdowns),
-            'prob_positive_return': sum(1 for p in final_prices if p > spot_price) / len(final_prices),
+            'final_price_mean': float(final_prices.mean()),
+            'final_price_std': float(final_prices.std()),
+            'final_price_min': float(final_prices.min()),
+            'final_price_max': float(final_prices.max()),
+            'max_price_mean': float(running_max[:, -1].mean(dtype=np.float64)),
+            'min_price_mean': float(min_price_mean),
+            'avg_max_drawdown': float(drawdowns.mean(dtype=np.float64)),
+            'worst_case_drawdown': float(drawdowns.max()),
+            'prob_positive_return': float((final_prices > spot_price).mean()),
             'num_simulations': num_simulations
         }
 
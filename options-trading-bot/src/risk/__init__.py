@@ -1,4 +1,7 @@
 from typing import Dict, Optional
+
+import numpy as np
+
 from src.core.logger import logger
 
 class RiskManager:
@@ -100,3 +103,49 @@ class RiskManager:
             'risk_reward_ratio': risk_reward_ratio,
             'direction': 'LONG' if is_long else 'SHORT'
         }
+    
+    def validate_trade_batch(self, entry_prices, stop_losses, take_profits) -> Dict[str, np.ndarray]:
+        """
+        Validate many trades at once with the rules of validate_trade
+        
+        Args:
+            entry_prices: Array of entry prices
+            stop_losses: Array of stop loss prices
+            take_profits: Array of take profit prices
+        
+        Returns:
+            {
+                'valid': bool array,
+                'direction': 'LONG' / 'SHORT' array,
+                'risk_reward_ratio': float array (0 where entry == stop loss),
+                'contracts': int array of position sizes,
+                'risk_percent': float array of account percent at risk
+            }
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        stop = np.asarray(stop_losses, dtype=np.float64)
+        target = np.asarray(take_profits, dtype=np.float64)
+        
+        is_long = target > entry
+        is_short = target < entry
+        risk = np.abs(entry - stop)
+        reward = np.abs(target - entry)
+        # Stand-in divisor where entry == stop loss; those rows are invalid anyway
+        safe_risk = np.where(risk > 0, risk, 1.0)
+        
+        contracts = np.maximum(np.floor(self.max_risk_amount / (safe_risk * 100)), 1).astype(np.int64)
+        risk_percent = np.where(risk > 0, contracts * 100 * risk / self.account_size * 100, 0.0)
+        
+        valid = (
+            (entry > 0) & (stop > 0) & (target > 0) & (risk > 0)
+            & ~(is_long & (stop > entry)) & ~(is_short & (stop < entry))
+            & (risk_percent <= self.max_risk_percent * 100)
+        )
+        
+        return {
+            'valid': valid,
+            'direction': np.where(is_long, 'LONG', 'SHORT'),
+            'risk_reward_ratio': np.where(risk > 0, reward / safe_risk, 0.0),
+            'contracts': np.where(risk > 0, contracts, 0),
+            'risk_percent': risk_percent
+        }
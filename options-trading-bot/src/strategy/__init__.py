@@ -9,6 +9,9 @@ try:
 except ImportError:
     TradingStrategy = None
 
+# +1 when profits come from rising prices, -1 when from falling ones
+_DIRECTION_SIGN = {'LONG': 1, 'SHORT': -1}
+
 class OptionsStrategy:
     """Options trading strategy using RSI and Bollinger Bands"""
     
@@ -100,16 +103,14 @@ class OptionsStrategy:
         """
         for pos in self.open_positions:
             if pos['id'] == position_id:
-                if pos['direction'] == 'LONG':
-                    if current_price >= pos['take_profit']:
-                        return {'action': 'CLOSE', 'reason': 'Take profit hit', 'pnl': 'positive'}
-                    elif current_price <= pos['stop_loss']:
-                        return {'action': 'CLOSE', 'reason': 'Stop loss hit', 'pnl': 'negative'}
+                sign = _DIRECTION_SIGN.get(pos['direction'])
+                if sign is None:
+                    continue
                 
-                elif pos['direction'] == 'SHORT':
-                    if current_price <= pos['take_profit']:
-                        return {'action': 'CLOSE', 'reason': 'Take profit hit', 'pnl': 'positive'}
-                    elif current_price >= pos['stop_loss']:
-                        return {'action': 'CLOSE', 'reason': 'Stop loss hit', 'pnl': 'negative'}
+                # Flip SHORT prices so both directions take profit above and stop below
+                if (current_price - pos['take_profit']) * sign >= 0:
+                    return {'action': 'CLOSE', 'reason': 'Take profit hit', 'pnl': 'positive'}
+                if (current_price - pos['stop_loss']) * sign <= 0:
+                    return {'action': 'CLOSE', 'reason': 'Stop loss hit', 'pnl': 'negative'}
         
         return None
@@ -13,8 +13,9 @@ from dataclasses import dataclass
 from src.indicators.rsi import RSIIndicator
 from src.indicators.macd import MACDIndicator
 from src.indicators.bollinger_bands import BollingerBandsIndicator
-from src.quant.black_scholes import BlackScholesModel, estimate_volatility_from_prices
-from src.quant.monte_carlo import MonteCarloSimulator
+from src.indicators.stream import IndicatorStream
+from src.quant.black_scholes import BlackScholesModel, Greeks, estimate_volatility_from_prices
+from src.quant.monte_carlo import MonteCarloSimulator, MC_PRECISIONS, TERMINAL_STAT_FIELDS
 from src.core.logger import logger
 
 
@@ -103,6 +104,9 @@ class EnhancedStockStrategy:
         self.rsi_overbought = rsi_overbought
         self.min_drawdown_for_buy = min_drawdown_for_buy
         
+        # Per-symbol rolling RSI/MACD, advanced in O(1) when closes grow by one bar
+        self._indicator_streams: Dict[str, IndicatorStream] = {}
+        
         # Track previous values
         self.prev_rsi = None
         self.prev_macd = None
@@ -129,9 +133,14 @@ class EnhancedStockStrategy:
             logger.warning(f"{symbol}: Insufficient data ({len(closes)} < 30)")
             return None
         
-        # Calculate indicators
-        rsi = self.rsi.calculate(closes)
-        macd, signal, histogram = self.macd.calculate(closes)
+        # Calculate indicators; a backtest that appends one bar per call
+        # advances the symbol's RSI/MACD stream instead of recomputing them
+        stream = self._indicator_streams.get(symbol)
+        if stream is None:
+            stream = self._indicator_streams[symbol] = IndicatorStream(
+                self.rsi.period, self.macd.fast_period, self.macd.slow_period, self.macd.signal_period
+            )
+        rsi, (macd, signal, histogram) = stream.advance(closes)
         bb = self.bb.calculate(closes)
         
         if rsi is None or macd is None or signal is None or histogram is None or bb is None:
@@ -254,7 +263,8 @@ class EnhancedStockStrategy:
         current_price: float,
         days_to_expiry: int = 30,
         num_simulations: int = 5000,
-        account_size: float = 50000
+        account_size: float = 50000,
+        mc_precision: str = 'f64'
     ) -> Optional[OptionsOpportunity]:
         """
         When stock signal generated, analyze options for trading
@@ -266,71 +276,124 @@ class EnhancedStockStrategy:
             days_to_expiry: Days to options expiration
             num_simulations: Monte Carlo simulations
             account_size: Account size for position sizing
+            mc_precision: 'f64' or 'f32' Monte Carlo arrays (see MC_PRECISIONS)
             
         Returns:
             OptionsOpportunity or None
         """
-        if stock_signal.action != 'BUY':
-            return None  # Only trade calls on BUY signals
-        
-        # Estimate volatility
-        volatility = estimate_volatility_from_prices(closes, window=20)
-        time_to_expiry = days_to_expiry / 365.0
-        
-        # Select strike: 30 days ATM or slightly OTM for better risk/reward
-        # Prefer 0.3-0.5 delta (30-50% probability ITM)
-        strike_price = self._select_call_strike(
-            current_price, closes, volatility, time_to_expiry, days_to_expiry
-        )
-        
-        if strike_price is None:
-            return None
+        return self.analyze_options_for_stock_signals(
+            [(stock_signal, closes, current_price)], days_to_expiry, num_simulations, account_size,
+            mc_precision
+        )[0]
+    
+    def analyze_options_for_stock_signals(
+        self,
+        signals: List[Tuple[StockSignal, List[float], float]],
+        days_to_expiry: int = 30,
+        num_simulations: int = 5000,
+        account_size: float = 50000,
+        mc_precision: str = 'f64'
+    ) -> List[Optional[OptionsOpportunity]]:
+        """
+        analyze_options_for_stock_signal for several stock signals at once
         
-        # Black-Scholes analysis
-        greeks = BlackScholesModel.calculate_greeks(
-            current_price, strike_price, time_to_expiry, volatility, 'call'
-        )
+        Strike selection and Black-Scholes run per signal; the Monte Carlo
+        for every BUY signal is a single simulate_and_analyze_batch call.
         
-        # Monte Carlo analysis
-        mc_option = MonteCarloSimulator.price_european_option(
-            current_price, strike_price, volatility, 0.05, days_to_expiry, 'call', num_simulations
-        )
+        Args:
+            signals: (stock_signal, closes, current_price) per stock
+            days_to_expiry: Days to options expiration
+            num_simulations: Monte Carlo simulations
+            account_size: Account size for position sizing
+            mc_precision: 'f64' or 'f32' Monte Carlo arrays (see MC_PRECISIONS)
+            
+        Returns:
+            OptionsOpportunity or None per signal, in input order
+        """
+        time_to_expiry = days_to_expiry / 365.0
+        opportunities: List[Optional[OptionsOpportunity]] = [None] * len(signals)
         
-        mc_prob = MonteCarloSimulator.calculate_probability_itm(
-            current_price, strike_price, volatility, 0.05, days_to_expiry, 'call', num_simulations
+        # (index, stock_signal, current_price, strike, volatility, greeks, position_size)
+        candidates = []
+        for i, (stock_signal, closes, current_price) in enumerate(signals):
+            if stock_signal.action != 'BUY':
+                continue  # Only trade calls on BUY signals
+            
+            # Estimate volatility
+            volatility = estimate_volatility_from_prices(closes, window=20)
+            
+            # Select strike: 30 days ATM or slightly OTM for better risk/reward
+            # Prefer 0.3-0.5 delta (30-50% probability ITM)
+            strike_price = self._select_call_strike(
+                current_price, closes, volatility, time_to_expiry, days_to_expiry
+            )
+            
+            if strike_price is None:
+                continue
+            
+            # Black-Scholes analysis
+            greeks = BlackScholesModel.calculate_greeks(
+                current_price, strike_price, time_to_expiry, volatility, 'call'
+            )
+            
+            # Position sizing
+            max_risk_per_trade = account_size * 0.02  # 2% risk
+            position_size = max(1, int(max_risk_per_trade / (greeks.price * 100)))
+            
+            candidates.append(
+                (i, stock_signal, current_price, strike_price, volatility, greeks, position_size)
+            )
+        
+        if not candidates:
+            return opportunities
+        
+        # Monte Carlo ITM probability and VaR for all candidates from one draw
+        # of exact GBM terminal prices (a European payoff doesn't need the path)
+        _, _, spots, strikes, vols, _, sizes = zip(*candidates)
+        mc = MonteCarloSimulator.simulate_and_analyze_batch(
+            spots, strikes, vols, 0.05, days_to_expiry, 'call', sizes, 0.95, num_simulations,
+            dtype=MC_PRECISIONS[mc_precision]
         )
         
-        # Position sizing
-        max_risk_per_trade = account_size * 0.02  # 2% risk
-        position_size = max(1, int(max_risk_per_trade / (greeks['price'] * 100)))
-        
-        # VaR analysis
-        var_result = MonteCarloSimulator.calculate_var_cvar(
-            current_price, strike_price, position_size, 'call',
-            volatility, 0.05, days_to_expiry, 0.95, num_simulations
-        )
+        for row, (i, stock_signal, _, strike_price, _, greeks, position_size) in enumerate(candidates):
+            stats = {field: float(mc[field][row]) for field in TERMINAL_STAT_FIELDS}
+            opportunities[i] = self._build_options_opportunity(
+                stock_signal, strike_price, days_to_expiry, greeks, position_size, stats
+            )
         
+        return opportunities
+    
+    def _build_options_opportunity(
+        self,
+        stock_signal: StockSignal,
+        strike_price: float,
+        days_to_expiry: int,
+        greeks: Greeks,
+        position_size: int,
+        mc: Dict
+    ) -> OptionsOpportunity:
+        """Score a priced call and package it as an OptionsOpportunity"""
         # Confidence scoring
         confidence = self._score_options_confidence(
-            stock_signal.confidence, greeks, mc_prob, var_result
+            stock_signal.confidence, greeks, mc, mc
         )
         
         # Recommendation
-        recommendation = 'BUY' if confidence >= 70 and 0.40 <= mc_prob['prob_itm_at_expiry'] <= 0.70 else 'HOLD'
+        recommendation = 'BUY' if confidence >= 70 and 0.40 <= mc['prob_itm_at_expiry'] <= 0.70 else 'HOLD'
         
         options_opp = OptionsOpportunity(
             symbol=stock_signal.symbol,
             option_type='call',
             strike_price=strike_price,
             days_to_expiry=days_to_expiry,
-            entry_price=greeks['price'],
-            delta=greeks['delta'],
-            gamma=greeks['gamma'],
-            vega=greeks['vega'],
-            theta=greeks['theta'],
-            prob_itm=mc_prob['prob_itm_at_expiry'],
-            var_95=var_result['var_95'],
-            cvar_95=var_result['cvar_95'],
+            entry_price=greeks.price,
+            delta=greeks.delta,
+            gamma=greeks.gamma,
+            vega=greeks.vega,
+            theta=greeks.theta,
+            prob_itm=mc['prob_itm_at_expiry'],
+            var_95=mc['var_95'],
+            cvar_95=mc['cvar_95'],
             recommendation=recommendation,
             confidence=confidence,
             contracts_suggested=position_size
@@ -338,7 +401,7 @@ class EnhancedStockStrategy:
         
         logger.info(
             f"{stock_signal.symbol} Call ${strike_price:.2f}: "
-            f"{recommendation} (conf={confidence:.0f}%, delta={greeks['delta']:.3f})"
+            f"{recommendation} (conf={confidence:.0f}%, delta={greeks.delta:.3f})"
         )
         
         return options_opp
@@ -381,7 +444,7 @@ class EnhancedStockStrategy:
     def _score_options_confidence(
         self,
         stock_confidence: float,
-        greeks: Dict,
+        greeks: Greeks,
         mc_prob: Dict,
         var_result: Dict
     ) -> float:
@@ -398,7 +461,7 @@ class EnhancedStockStrategy:
         stock_component = (stock_confidence / 100) * 40
         
         # Delta component (want 0.3-0.5)
-        delta = greeks['delta']
+        delta = greeks.delta
         delta_component = 0
         if 0.30 <= delta <= 0.50:
             delta_component = 30
@@ -5,7 +5,7 @@ profit-taking targets, and correlated market filtering
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, NamedTuple, Union
 from datetime import datetime
 from enum import Enum
 import numpy as np
@@ -13,6 +13,77 @@ import numpy as np
 from src.indicators.rsi import RSIIndicator
 from src.indicators.macd import MACDIndicator
 from src.core.logger import logger
+from src.core.jit import njit, prange
+
+# Price series accepted by the strategy; backtests pass float64 array views
+PriceSeries = Union[List[float], np.ndarray]
+
+# Window sizes baked into the price-level kernel
+LEVEL_LOOKBACK = 20
+ATR_PERIOD = 14
+
+
+def _ann_vol_impl(arr, start, end):
+    """Annualized volatility (%) of simple returns over arr[start:end] (single-pass Welford)"""
+    mean = 0.0
+    m2 = 0.0
+    k = 0
+    for i in range(start + 1, end):
+        r = arr[i] / arr[i - 1] - 1.0
+        k += 1
+        d = r - mean
+        mean += d / k
+        m2 += d * (r - mean)
+    if k == 0:
+        return 0.0
+    return np.sqrt(m2 / k) * np.sqrt(252.0) * 100.0
+
+
+def _step_all_impl(closes_flat, offsets, counts, out):
+    """
+    Compute per-symbol price levels for one timestamp in parallel
+    
+    closes_flat holds every symbol's closes back to back; symbol i occupies
+    closes_flat[offsets[i]:offsets[i] + counts[i]] at this timestamp.
+    Writes out[i] = (price, recent_high, recent_low, atr).
+    """
+    for i in prange(len(counts)):
+        n = counts[i]
+        if n < max(LEVEL_LOOKBACK, ATR_PERIOD + 1):
+            out[i, 0] = np.nan
+            continue
+        end = offsets[i] + n
+        hi = closes_flat[end - LEVEL_LOOKBACK]
+        lo = hi
+        for j in range(end - LEVEL_LOOKBACK + 1, end):
+            c = closes_flat[j]
+            if c > hi:
+                hi = c
+            if c < lo:
+                lo = c
+        tr_sum = 0.0
+        for j in range(end - ATR_PERIOD, end):
+            tr_sum += abs(closes_flat[j] - closes_flat[j - 1])
+        out[i, 0] = closes_flat[end - 1]
+        out[i, 1] = hi
+        out[i, 2] = lo
+        out[i, 3] = tr_sum / ATR_PERIOD
+
+
+def _epoch_ns(timestamps: List) -> np.ndarray:
+    """Convert a list of datetimes to int64 nanoseconds since epoch"""
+    return np.array(timestamps, dtype='datetime64[ns]').view(np.int64)
+
+
+# Prefer the ahead-of-time build (python compile_strategy.py) so live trading
+# skips JIT warmup; otherwise fall back to njit (or plain Python without numba)
+try:
+    from src.strategy.strategy_native import ann_vol as _ann_vol, step_all as _step_all
+    NATIVE_KERNELS = True
+except ImportError:
+    _ann_vol = njit(cache=True)(_ann_vol_impl)
+    _step_all = njit(cache=True, parallel=True)(_step_all_impl)
+    NATIVE_KERNELS = False
 
 
 class MarketRegime(Enum):
@@ -27,6 +98,13 @@ class MarketRegime(Enum):
 @dataclass
 class AdvancedSignal:
     """Enhanced trading signal with risk metrics"""
+    __slots__ = (
+        'symbol', 'action', 'confidence', 'price', 'timestamp',
+        'entry_price', 'stop_loss', 'take_profit', 'risk_reward_ratio', 'position_size_pct',
+        'market_regime', 'vix_level', 'spy_drawdown',
+        'rsi', 'macd', 'signal_line', 'indicators', 'reason',
+    )
+    
     symbol: str
     action: str  # 'BUY', 'SELL', 'HOLD'
     confidence: float  # 0-100
@@ -53,6 +131,39 @@ class AdvancedSignal:
     reason: str
 
 
+@dataclass
+class Position:
+    """Open backtest position with its exit levels"""
+    __slots__ = ('symbol', 'quantity', 'entry_price', 'entry_time',
+                 'stop_loss', 'take_profit', 'confidence')
+    
+    symbol: str
+    quantity: float
+    entry_price: float
+    entry_time: datetime
+    stop_loss: float
+    take_profit: float
+    confidence: float
+
+
+class SignalRow(NamedTuple):
+    """Lightweight signal row produced by the fast analysis path"""
+    action: str
+    confidence: float
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    risk_reward_ratio: float
+    position_size_pct: float
+    market_regime: MarketRegime
+    vix_level: float
+    spy_drawdown: float
+    rsi: float
+    macd: float
+    signal_line: float
+    histogram: float
+
+
 class AdvancedStrategy:
     """
     High-win-rate strategy using:
@@ -99,10 +210,11 @@ class AdvancedStrategy:
     
     def analyze_with_market_context(self, 
                                    symbol: str, 
-                                   closes: List[float], 
+                                   closes: PriceSeries, 
                                    current_price: float,
-                                   spy_closes: List[float],
-                                   vix_values: Optional[List[float]] = None) -> Optional[AdvancedSignal]:
+                                   spy_closes: PriceSeries,
+                                   vix_values: Optional[List[float]] = None,
+                                   precomputed_regime: Optional[Tuple[MarketRegime, float, float]] = None) -> Optional[AdvancedSignal]:
         """
         Analyze price data with full market context
         
@@ -112,15 +224,43 @@ class AdvancedStrategy:
             current_price: Current market price
             spy_closes: SPY closing prices for market regime
             vix_values: VIX values for volatility context
+            precomputed_regime: (regime, vix_level, spy_drawdown) already computed
+                for this timestamp; skips _analyze_market_regime when given
             
         Returns:
             AdvancedSignal with enhanced risk metrics or None
         """
+        # _analyze_fast expects float64; a no-op for arrays run() already converted
+        closes = np.asarray(closes, dtype=np.float64)
+        row = self._analyze_fast(closes, current_price, spy_closes, vix_values,
+                                 precomputed_regime=precomputed_regime)
+        if row is None:
+            return None
+        return self._build_signal_object(symbol, row)
+    
+    def _analyze_fast(self,
+                      closes: PriceSeries,
+                      current_price: float,
+                      spy_closes: PriceSeries,
+                      vix_values: Optional[List[float]] = None,
+                      levels: Optional[Tuple[float, float, float]] = None,
+                      precomputed_regime: Optional[Tuple[MarketRegime, float, float]] = None) -> Optional[SignalRow]:
+        """
+        Hot-path analysis used by the backtester
+        
+        Returns a SignalRow only for BUY/SELL signals that pass the R:R filter,
+        so no dataclass or indicator dict is allocated for filtered candidates.
+        levels optionally carries precomputed (recent_high, recent_low, atr).
+        closes must already be a float64 array (run() and
+        analyze_with_market_context convert at entry).
+        """
         if len(closes) < 50:
             return None  # Need more data for reliable analysis
         
-        # Determine market regime
-        market_regime, vix_level, spy_drawdown = self._analyze_market_regime(spy_closes, vix_values)
+        # Determine market regime (shared across symbols when precomputed)
+        if precomputed_regime is None:
+            precomputed_regime = self._analyze_market_regime(spy_closes, vix_values)
+        market_regime, vix_level, spy_drawdown = precomputed_regime
         
         # Skip trading in crash regimes
         if market_regime == MarketRegime.CRASH:
@@ -135,8 +275,8 @@ class AdvancedStrategy:
         
         # Generate signal based on market regime
         action, confidence, stop_loss, take_profit = self._generate_signal_with_regime(
-            symbol, closes, current_price, rsi, macd, signal, histogram, 
-            market_regime, vix_level
+            closes, current_price, rsi, macd, signal, histogram,
+            market_regime, vix_level, levels
         )
         
         if action == 'HOLD':
@@ -159,55 +299,63 @@ class AdvancedStrategy:
         self.prev_macd = macd
         self.prev_signal = signal
         
+        return SignalRow(action, confidence, current_price, stop_loss, take_profit,
+                         risk_reward_ratio, position_size, market_regime, vix_level,
+                         spy_drawdown, rsi, macd, signal, histogram)
+    
+    def _build_signal_object(self, symbol: str, row: SignalRow) -> AdvancedSignal:
+        """Build the full AdvancedSignal for a signal that actually fired"""
         return AdvancedSignal(
             symbol=symbol,
-            action=action,
-            confidence=confidence,
-            price=current_price,
+            action=row.action,
+            confidence=row.confidence,
+            price=row.entry_price,
             timestamp=datetime.now(),
-            entry_price=current_price,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            risk_reward_ratio=risk_reward_ratio,
-            position_size_pct=position_size,
-            market_regime=market_regime,
-            vix_level=vix_level,
-            spy_drawdown=spy_drawdown,
-            rsi=rsi,
-            macd=macd,
-            signal_line=signal,
+            entry_price=row.entry_price,
+            stop_loss=row.stop_loss,
+            take_profit=row.take_profit,
+            risk_reward_ratio=row.risk_reward_ratio,
+            position_size_pct=row.position_size_pct,
+            market_regime=row.market_regime,
+            vix_level=row.vix_level,
+            spy_drawdown=row.spy_drawdown,
+            rsi=row.rsi,
+            macd=row.macd,
+            signal_line=row.signal_line,
             indicators={
-                'rsi': rsi,
-                'macd': macd,
-                'signal': signal,
-                'histogram': histogram,
+                'rsi': row.rsi,
+                'macd': row.macd,
+                'signal': row.signal_line,
+                'histogram': row.histogram,
             },
-            reason=f"{market_regime.value}: RSI={rsi:.1f}, MACD={macd:.3f}, RR={risk_reward_ratio:.1f}:1"
+            reason=f"{row.market_regime.value}: RSI={row.rsi:.1f}, MACD={row.macd:.3f}, "
+                   f"RR={row.risk_reward_ratio:.1f}:1"
         )
     
     def _analyze_market_regime(self, 
-                              spy_closes: List[float], 
+                              spy_closes: PriceSeries, 
                               vix_values: Optional[List[float]]) -> Tuple[MarketRegime, float, float]:
         """Determine current market regime using SPY and VIX"""
-        if not spy_closes or len(spy_closes) < 50:
+        if spy_closes is None or len(spy_closes) < 50:
             return MarketRegime.NEUTRAL, 20.0, 0.0
         
-        # Calculate SPY metrics
-        spy_current = spy_closes[-1]
-        spy_ma20 = np.mean(spy_closes[-20:])
-        spy_ma50 = np.mean(spy_closes[-50:])
-        spy_ma200 = np.mean(spy_closes[-200:] if len(spy_closes) >= 200 else spy_closes)
+        # Calculate SPY metrics (single list -> array conversion)
+        spy_arr = np.asarray(spy_closes, dtype=np.float64)
+        n = len(spy_arr)
+        spy_current = spy_arr[-1]
+        spy_ma20 = spy_arr[-20:].mean()
+        spy_ma50 = spy_arr[-50:].mean()
+        spy_ma200 = spy_arr[-200:].mean()
         
-        spy_high_20 = max(spy_closes[-20:])
+        spy_high_20 = spy_arr[-20:].max()
         spy_drawdown = ((spy_high_20 - spy_current) / spy_high_20) * 100 if spy_high_20 > 0 else 0
         
         # Estimate VIX if not provided
-        if vix_values and len(vix_values) > 0:
+        if vix_values is not None and len(vix_values) > 0:
             vix_level = vix_values[-1]
         else:
-            # Estimate VIX from SPY volatility
-            returns = np.diff(spy_closes[-20:]) / spy_closes[-20:-1]
-            vix_level = np.std(returns) * np.sqrt(252) * 100  # Annualized volatility
+            # Estimate VIX from SPY volatility (annualized, no temporaries)
+            vix_level = _ann_vol(spy_arr, n - 20, n)
         
         # Classify regime
         if vix_level > 40 or spy_drawdown > 10:
@@ -228,21 +376,24 @@ class AdvancedStrategy:
         return regime, vix_level, spy_drawdown
     
     def _generate_signal_with_regime(self,
-                                    symbol: str,
-                                    closes: List[float],
+                                    closes: PriceSeries,
                                     current_price: float,
                                     rsi: float,
                                     macd: float,
                                     signal: float,
                                     histogram: float,
                                     market_regime: MarketRegime,
-                                    vix_level: float) -> Tuple[str, float, float, float]:
+                                    vix_level: float,
+                                    levels: Optional[Tuple[float, float, float]] = None) -> Tuple[str, float, float, float]:
         """Generate signal based on market regime"""
         
         # Calculate support and resistance
-        recent_high = max(closes[-20:])
-        recent_low = min(closes[-20:])
-        atr = self._calculate_atr(closes)
+        if levels is not None:
+            recent_high, recent_low, atr = levels
+        else:
+            recent_high = max(closes[-20:])
+            recent_low = min(closes[-20:])
+            atr = self._calculate_atr(closes)
         
         stop_loss = recent_low - atr * 0.5
         take_profit_long = recent_high + (atr * 2)
@@ -271,13 +422,12 @@ class AdvancedStrategy:
         
         return 'HOLD', 0, current_price, current_price
     
-    def _calculate_atr(self, closes: List[float], period: int = 14) -> float:
+    def _calculate_atr(self, closes: PriceSeries, period: int = 14) -> float:
         """Calculate Average True Range for volatility"""
         if len(closes) < period + 1:
             return closes[-1] * 0.02  # Default 2% if insufficient data
         
-        closes_arr = np.array(closes)
-        tr = np.abs(np.diff(closes_arr[-period-1:]))
+        tr = np.abs(np.diff(np.asarray(closes[-period-1:], dtype=np.float64)))
         return np.mean(tr)
     
     def _calculate_position_size(self, 
@@ -317,64 +467,93 @@ class HighWinRateBacktester:
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.capital = initial_capital
-        self.positions = {}
+        self.positions: Dict[str, Position] = {}
         self.trades = []
         self.win_count = 0
         self.loss_count = 0
         self.equity_curve = []
+        
+        # Exit levels of open positions in opening order (parallel arrays)
+        self._open_syms: List[str] = []
+        self._open_stop = np.empty(0)
+        self._open_target = np.empty(0)
     
     def run(self, price_data: Dict, spy_data: List[Dict], vix_data: Optional[List[Dict]] = None):
         """Run backtest with market context"""
         
         logger.info(f"Starting high-win-rate backtest with ${self.initial_capital:,.2f}")
         
-        # Extract SPY and VIX data
-        spy_closes = [c['close'] for c in spy_data]
-        vix_values = [c.get('close', 20.0) for c in vix_data] if vix_data else None
-        
-        # Get all timestamps and sort
-        all_timestamps = set()
-        for candles in price_data.values():
-            for c in candles:
-                all_timestamps.add(c['timestamp'])
+        # Flatten per-symbol closes into one buffer so all symbols can be
+        # stepped by a single kernel call per timestamp (candles are expected
+        # in chronological order)
+        symbols = list(price_data.keys())
+        sym_times = [[c['timestamp'] for c in price_data[s]] for s in symbols]
+        sym_ts = [_epoch_ns(times) for times in sym_times]
+        sym_closes = [np.array([c['close'] for c in price_data[s]], dtype=np.float64) for s in symbols]
+        offsets = np.zeros(len(symbols) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(c) for c in sym_closes])
+        closes_flat = np.concatenate(sym_closes) if symbols else np.empty(0)
+        levels = np.full((len(symbols), 4), np.nan)
+        
+        # Unique sorted int64 timestamps; the original datetime objects are
+        # kept only for reporting (equity curve / trades)
+        if symbols:
+            all_ts, first_idx = np.unique(np.concatenate(sym_ts), return_index=True)
+        else:
+            all_ts, first_idx = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        flat_times = [t for times in sym_times for t in times]
+        timestamps = [flat_times[j] for j in first_idx]
         
-        timestamps = sorted(all_timestamps)
+        # Bars visible per symbol at each timestamp, shape (T, S)
+        bar_counts = np.empty((len(all_ts), len(symbols)), dtype=np.int64)
+        for i in range(len(symbols)):
+            bar_counts[:, i] = np.searchsorted(sym_ts[i], all_ts, side='right')
         
-        for timestamp in timestamps:
+        # Extract SPY and VIX data
+        spy_arr = np.array([c['close'] for c in spy_data], dtype=np.float64)
+        spy_counts = np.searchsorted(_epoch_ns([c['timestamp'] for c in spy_data]), all_ts, side='right')
+        if vix_data:
+            vix_arr = np.array([c.get('close', 20.0) for c in vix_data], dtype=np.float64)
+            vix_counts = np.searchsorted(_epoch_ns([c['timestamp'] for c in vix_data]), all_ts, side='right')
+        
+        counts = np.zeros(len(symbols), dtype=np.int64)
+        for k, timestamp in enumerate(timestamps):
             # Get current data
+            counts = bar_counts[k]
             current_prices = {}
-            closes_by_symbol = {}
-            
-            for symbol, candles in price_data.items():
-                candles_up_to = [c for c in candles if c['timestamp'] <= timestamp]
-                if candles_up_to:
-                    current_prices[symbol] = candles_up_to[-1]['close']
-                    closes_by_symbol[symbol] = [c['close'] for c in candles_up_to]
+            for i, symbol in enumerate(symbols):
+                if counts[i]:
+                    current_prices[symbol] = float(sym_closes[i][counts[i] - 1])
             
             # Update SPY context
-            spy_candles_up_to = [c for c in spy_data if c['timestamp'] <= timestamp]
-            spy_closes = [c['close'] for c in spy_candles_up_to] if spy_candles_up_to else []
+            spy_closes = spy_arr[:spy_counts[k]]
             
             vix_vals = None
-            if vix_data:
-                vix_candles_up_to = [c for c in vix_data if c['timestamp'] <= timestamp]
-                vix_vals = [c.get('close', 20.0) for c in vix_candles_up_to] if vix_candles_up_to else None
+            if vix_data and vix_counts[k]:
+                vix_vals = vix_arr[:vix_counts[k]]
             
-            # Analyze each symbol
-            for symbol, closes in closes_by_symbol.items():
-                if not closes or len(closes) < 50:
-                    continue
+            # Market regime is the same for every symbol at this timestamp
+            regime = self.strategy._analyze_market_regime(spy_closes, vix_vals)
+            
+            # Analyze each symbol (nothing trades in a crash regime)
+            if regime[0] != MarketRegime.CRASH:
+                # Price levels for every symbol in one (parallel) call
+                _step_all(closes_flat, offsets, counts, levels)
                 
-                if symbol in current_prices:
-                    signal = self.strategy.analyze_with_market_context(
-                        symbol, closes, current_prices[symbol],
-                        spy_closes, vix_vals
+                for i, symbol in enumerate(symbols):
+                    if counts[i] < 50:
+                        continue
+                    
+                    signal = self.strategy._analyze_fast(
+                        sym_closes[i][:counts[i]], current_prices[symbol], spy_closes, vix_vals,
+                        levels=(levels[i, 1], levels[i, 2], levels[i, 3]),
+                        precomputed_regime=regime
                     )
                     
                     if signal and signal.action == 'BUY':
                         self._open_position(symbol, signal, timestamp)
                     elif signal and signal.action == 'SELL':
-                        self._close_all_positions(symbol, signal.price, timestamp)
+                        self._close_all_positions(symbol, signal.entry_price, timestamp)
             
             # Check stop losses and take profits
             self._check_exit_conditions(current_prices, timestamp)
@@ -382,14 +561,14 @@ class HighWinRateBacktester:
             # Update equity
             portfolio_value = self.capital
             for pos in self.positions.values():
-                if pos['symbol'] in current_prices:
-                    portfolio_value += pos['quantity'] * current_prices[pos['symbol']]
+                if pos.symbol in current_prices:
+                    portfolio_value += pos.quantity * current_prices[pos.symbol]
             
             self.equity_curve.append((timestamp, portfolio_value))
         
         # Close remaining positions
         final_timestamp = timestamps[-1] if timestamps else datetime.now()
-        final_prices = {s: closes[-1] for s, closes in closes_by_symbol.items() if closes}
+        final_prices = {s: float(sym_closes[i][counts[i] - 1]) for i, s in enumerate(symbols) if counts[i]}
         self._close_all_positions(None, None, final_timestamp, final_prices)
         
         return {
@@ -401,7 +580,7 @@ class HighWinRateBacktester:
             'trades': self.trades,
         }
     
-    def _open_position(self, symbol: str, signal: AdvancedSignal, timestamp: datetime):
+    def _open_position(self, symbol: str, signal: SignalRow, timestamp: datetime):
         """Open new position with stop-loss and take-profit"""
         if symbol in self.positions:
             return  # Already have position
@@ -411,32 +590,36 @@ class HighWinRateBacktester:
         
         self.capital -= position_capital
         
-        self.positions[symbol] = {
-            'symbol': symbol,
-            'quantity': quantity,
-            'entry_price': signal.entry_price,
-            'entry_time': timestamp,
-            'stop_loss': signal.stop_loss,
-            'take_profit': signal.take_profit,
-            'confidence': signal.confidence,
-        }
+        self.positions[symbol] = Position(
+            symbol=symbol,
+            quantity=quantity,
+            entry_price=signal.entry_price,
+            entry_time=timestamp,
+            stop_loss=signal.stop_loss,
+            take_profit=signal.take_profit,
+            confidence=signal.confidence,
+        )
+        self._open_syms.append(symbol)
+        self._open_stop = np.append(self._open_stop, signal.stop_loss)
+        self._open_target = np.append(self._open_target, signal.take_profit)
     
     def _check_exit_conditions(self, current_prices: Dict, timestamp: datetime):
         """Check for stop-loss or take-profit hits"""
-        for symbol in list(self.positions.keys()):
-            if symbol not in current_prices:
-                continue
-            
+        if not self._open_syms:
+            return
+        
+        # Missing prices become NaN, which never hits either level
+        cur = np.array([current_prices.get(s, np.nan) for s in self._open_syms])
+        stop_hit = cur <= self._open_stop
+        tp_hit = cur >= self._open_target
+        
+        exits = [(self._open_syms[i], stop_hit[i]) for i in np.nonzero(stop_hit | tp_hit)[0]]
+        for symbol, is_stop in exits:
             pos = self.positions[symbol]
-            current_price = current_prices[symbol]
-            
-            # Check stop loss
-            if current_price <= pos['stop_loss']:
-                self._close_position(symbol, pos['stop_loss'], timestamp, is_stop_loss=True)
-            
-            # Check take profit
-            elif current_price >= pos['take_profit']:
-                self._close_position(symbol, pos['take_profit'], timestamp, is_take_profit=True)
+            if is_stop:
+                self._close_position(symbol, pos.stop_loss, timestamp, is_stop_loss=True)
+            else:
+                self._close_position(symbol, pos.take_profit, timestamp, is_take_profit=True)
     
     def _close_position(self, symbol: str, exit_price: float, timestamp: datetime,
                        is_stop_loss: bool = False, is_take_profit: bool = False):
@@ -445,23 +628,23 @@ class HighWinRateBacktester:
             return
         
         pos = self.positions[symbol]
-        pnl = (exit_price - pos['entry_price']) * pos['quantity']
-        pnl_pct = ((exit_price - pos['entry_price']) / pos['entry_price']) * 100
+        pnl = (exit_price - pos.entry_price) * pos.quantity
+        pnl_pct = ((exit_price - pos.entry_price) / pos.entry_price) * 100
         
         self.trades.append({
             'symbol': symbol,
-            'entry_price': pos['entry_price'],
+            'entry_price': pos.entry_price,
             'exit_price': exit_price,
-            'quantity': pos['quantity'],
-            'entry_time': pos['entry_time'],
+            'quantity': pos.quantity,
+            'entry_time': pos.entry_time,
             'exit_time': timestamp,
             'pnl': pnl,
             'pnl_pct': pnl_pct,
             'exit_reason': 'take_profit' if is_take_profit else ('stop_loss' if is_stop_loss else 'close'),
-            'confidence': pos['confidence'],
+            'confidence': pos.confidence,
         })
         
-        self.capital += exit_price * pos['quantity']
+        self.capital += exit_price * pos.quantity
         
         if pnl > 0:
             self.win_count += 1
@@ -469,6 +652,10 @@ class HighWinRateBacktester:
             self.loss_count += 1
         
         del self.positions[symbol]
+        idx = self._open_syms.index(symbol)
+        del self._open_syms[idx]
+        self._open_stop = np.delete(self._open_stop, idx)
+        self._open_target = np.delete(self._open_target, idx)
     
     def _close_all_positions(self, symbol: Optional[str], exit_price: Optional[float], 
                             timestamp: datetime, final_prices: Dict = None):
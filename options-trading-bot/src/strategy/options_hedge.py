@@ -4,13 +4,75 @@ Protects long equity positions by purchasing protective puts
 Optimizes hedge costs vs protection levels
 """
 
+from bisect import bisect_right
+from collections.abc import MutableMapping
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from fractions import Fraction
+from typing import List, Dict, Optional, Tuple, Iterator
 from enum import Enum
+import logging
+from math import fabs
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from src.core.logger import logger
+from src.core.compat import DATACLASS_SLOTS
+
+
+def _payoff_impl(current, entry, put_strike, put_cost, call_strike, call_premium,
+                 size, is_collar, out_hedge_pnl, out_equity_pnl):
+    """
+    Hedge payoff for a batch of positions (same rules as update_hedge_pnl)
+    
+    out_equity_pnl holds the unhedged equity P&L on entry and is capped at
+    the call strike in place for collars.
+    """
+    for i in range(len(current)):
+        hedge_pnl = max(0.0, put_strike[i] - current[i]) * size[i] - put_cost[i]
+        if is_collar[i]:
+            if current[i] > call_strike[i]:
+                out_equity_pnl[i] = (call_strike[i] - entry[i]) * size[i]
+            hedge_pnl += call_premium[i]
+        out_hedge_pnl[i] = hedge_pnl
+
+
+def _payoff_numpy(current, entry, put_strike, put_cost, call_strike, call_premium,
+                  size, is_collar, out_hedge_pnl, out_equity_pnl):
+    """Vectorized NumPy equivalent of _payoff_impl (used without numba)"""
+    out_hedge_pnl[:] = np.maximum(0.0, put_strike - current) * size - put_cost
+    out_equity_pnl[:] = np.where(is_collar & (current > call_strike), (call_strike - entry) * size, out_equity_pnl)
+    out_hedge_pnl += np.where(is_collar, call_premium, 0.0)
+
+
+# Prefer the ahead-of-time build (python compile_strategy.py): no numba
+# import and no compile at all
+try:
+    from src.strategy.hedge_kernels import payoff as _payoff_kernel
+    NATIVE_KERNELS = True
+except ImportError:
+    _payoff_kernel = None
+    NATIVE_KERNELS = False
+
+
+def _get_payoff_kernel():
+    """
+    Resolve the batch payoff kernel on first use
+    
+    Without the native module, importing numba and loading the compiled
+    kernel is most of this module's import time, so it is deferred until a
+    batch update actually runs.
+    """
+    global _payoff_kernel
+    if _payoff_kernel is None:
+        from src.core.jit import njit, NUMBA_AVAILABLE
+        # Explicit signature compiles eagerly (no type inference on first tick);
+        # without numba the NumPy version beats an interpreted loop
+        if NUMBA_AVAILABLE:
+            _payoff_kernel = njit('void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], b1[:], f8[:], f8[:])',
+                                  cache=True, fastmath=True, boundscheck=False)(_payoff_impl)
+        else:
+            _payoff_kernel = _payoff_numpy
+    return _payoff_kernel
 
 
 class HedgeStrategy(Enum):
@@ -22,9 +84,48 @@ class HedgeStrategy(Enum):
     PARTIAL_HEDGE = "partial_hedge"            # Hedge only part of position
 
 
-@dataclass
+# Integer code per strategy: row index into OptionsHedgeManager._param_table
+STRATEGY_INDEX = {strategy: i for i, strategy in enumerate(HedgeStrategy)}
+_NO_HEDGE = STRATEGY_INDEX[HedgeStrategy.NO_HEDGE]
+_PROTECTIVE_PUT = STRATEGY_INDEX[HedgeStrategy.PROTECTIVE_PUT]
+_COLLAR = STRATEGY_INDEX[HedgeStrategy.COLLAR]
+_DYNAMIC_HEDGE = STRATEGY_INDEX[HedgeStrategy.DYNAMIC_HEDGE]
+_PARTIAL_HEDGE = STRATEGY_INDEX[HedgeStrategy.PARTIAL_HEDGE]
+
+# hedge_type label and log line per strategy code ({coverage} is a fraction)
+_HEDGE_TYPE_NAMES = ("NO_HEDGE", "PROTECTIVE_PUT", "COLLAR", "DYNAMIC_HEDGE_{pct}%", "PARTIAL_HEDGE_{pct}%")
+_HEDGE_LOG_TEMPLATES = (
+    "",
+    "Protective put: Strike=$%(put_strike).2f, Cost=$%(put_cost).2f",
+    "Collar: Put $%(put_strike).2f, Call $%(call_strike).2f, Net Cost $%(net_cost).2f",
+    "Dynamic hedge: %(pct)d%% coverage, Put $%(put_strike).2f",
+    "Partial hedge: %(size)d shares (%(pct)d%%), Put $%(put_strike).2f",
+)
+
+
+# Dynamic hedge coverage by loss-severity bucket: < 2%, < 5%, beyond
+_DYN_THRESHOLDS = (0.02, 0.05)
+_DYN_COVERAGE = (0.25, 0.50, 0.75)  # Light, medium, heavy hedge
+
+# Hedge lifetime (30 days) in ns, added straight onto the ns entry time
+_HEDGE_LIFETIME_NS = 30 * 24 * 60 * 60 * 10**9
+
+
+# Columnar hedge event log (timestamp is ns since epoch, hedge_type a strategy code)
+_HIST_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('symbol', 'U16'),
+    ('hedge_type', 'i1'),
+    ('coverage', 'f8'),
+    ('entry_price', 'f8'),
+    ('put_strike', 'f8'),
+    ('cost', 'f8'),
+])
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HedgeParameters:
-    """Configuration for options hedging"""
+    """Configuration for options hedging (immutable once the manager is built)"""
     strategy: HedgeStrategy = HedgeStrategy.PROTECTIVE_PUT
     put_delta: float = 0.25                    # 25 delta put (more OTM = cheaper)
     put_strike_pct: float = 0.95               # Buy puts 5% below entry
@@ -35,9 +136,10 @@ class HedgeParameters:
     partial_hedge_pct: float = 0.50            # Hedge 50% of position in partial strategy
     max_hedge_cost_pct: float = 0.05           # Don't spend > 5% on hedges
     rebalance_interval: int = 5                # Days between hedge rebalance
+    bars_per_day: int = 1                      # Bar size for bar-indexed rebalance checks
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HedgePosition:
     """Represents a hedged position"""
     symbol: str
@@ -50,7 +152,8 @@ class HedgePosition:
     current_price: float = 0.0
     
     # Hedge details
-    hedge_type: str = ""
+    hedge_type: int = _NO_HEDGE                # Strategy code (see STRATEGY_INDEX)
+    coverage: float = 1.0                      # Fraction of the position hedged
     put_strike: float = 0.0
     put_cost: float = 0.0
     call_strike: float = 0.0
@@ -65,18 +168,203 @@ class HedgePosition:
     is_hedged: bool = False
     hedge_expires_date: Optional[datetime] = None
     last_rebalance: Optional[datetime] = None
+    last_rebalance_bar: int = -1               # Bar index of last rebalance (-1 = unknown)
+    
+    @property
+    def hedge_type_name(self) -> str:
+        """Readable hedge type, e.g. COLLAR or DYNAMIC_HEDGE_50%"""
+        return _HEDGE_TYPE_NAMES[self.hedge_type].format(pct=int(self.coverage * 100))
+
+
+def _to_ns(when: datetime) -> int:
+    """Naive datetime (or datetime64) to int64 ns since epoch"""
+    return int(np.datetime64(when, 'ns').astype(np.int64))
+
+
+def _from_ns(when_ns: int) -> datetime:
+    """int64 ns since epoch back to a naive datetime (microsecond precision)"""
+    return np.datetime64(when_ns // 1000, 'us').item()
+
+
+class HedgeBook(MutableMapping):
+    """
+    Hedged positions keyed by symbol, stored as parallel NumPy columns (SoA)
+    
+    Behaves like Dict[str, HedgePosition] for existing callers. The numeric
+    fields live in float64 columns so payoffs and performance stats can be
+    computed for every position in one vectorized pass; the per-tick P&L
+    fields are synced back onto the HedgePosition when it is read.
+    
+    version is bumped on every write so derived results can be cached
+    until the book changes. net_cost and hedge_pnl_total are running sums of
+    (put_cost - call_premium) and hedge_pnl over the live rows. Entry and
+    expiry dates are kept as int64 ns-since-epoch columns so expiries can be
+    queried for every hedge with one compare.
+    """
+    
+    COLUMNS = ('entry_price', 'position_size', 'put_strike', 'put_cost',
+               'call_strike', 'call_premium', 'current_price',
+               'equity_pnl', 'hedge_pnl', 'total_pnl')
+    PNL_COLUMNS = ('current_price', 'equity_pnl', 'hedge_pnl', 'total_pnl')
+    DATE_COLUMNS = ('entry_date_ns', 'expiry_ns')
+    ARRAYS = COLUMNS + ('is_collar',) + DATE_COLUMNS
+    NO_EXPIRY_NS = np.iinfo(np.int64).max
+    
+    def __init__(self, capacity: int = 16):
+        self.idx: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._positions: List[HedgePosition] = []
+        self._capacity = capacity
+        for name in self.COLUMNS:
+            setattr(self, f"_{name}", np.zeros(capacity))
+        self._is_collar = np.zeros(capacity, dtype=bool)
+        for name in self.DATE_COLUMNS:
+            setattr(self, f"_{name}", np.zeros(capacity, dtype=np.int64))
+        self.version = 0
+        self.net_cost = 0.0
+        self.hedge_pnl_total = 0.0
+    
+    def _grow(self):
+        """Double column capacity"""
+        self._capacity *= 2
+        for name in self.ARRAYS:
+            old = getattr(self, f"_{name}")
+            new = np.zeros(self._capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, f"_{name}", new)
+    
+    def col(self, name: str) -> np.ndarray:
+        """View of a column over the live rows"""
+        return getattr(self, f"_{name}")[:len(self._symbols)]
+    
+    def _retire_row(self, row: int):
+        """Remove a row's contribution from the running sums"""
+        self.net_cost -= self._put_cost[row] - self._call_premium[row]
+        self.hedge_pnl_total -= self._hedge_pnl[row]
+    
+    def write_row(self, row: int, hedge: HedgePosition):
+        """Copy a HedgePosition's numeric fields into its row (row must be new or retired)"""
+        self.net_cost += hedge.put_cost - hedge.call_premium
+        self.hedge_pnl_total += hedge.hedge_pnl
+        for name in self.COLUMNS:
+            getattr(self, f"_{name}")[row] = getattr(hedge, name)
+        self._is_collar[row] = hedge.hedge_type == _COLLAR
+        self._entry_date_ns[row] = _to_ns(hedge.entry_date)
+        expires = hedge.hedge_expires_date
+        self._expiry_ns[row] = self.NO_EXPIRY_NS if expires is None else _to_ns(expires)
+        self.version += 1
+    
+    def write_pnl(self, row: int, hedge: HedgePosition):
+        """Copy only the per-tick P&L fields into its row"""
+        self.hedge_pnl_total += hedge.hedge_pnl - self._hedge_pnl[row]
+        for name in self.PNL_COLUMNS:
+            getattr(self, f"_{name}")[row] = getattr(hedge, name)
+        self.version += 1
+    
+    def expiry(self, symbol: str):
+        """Hedge expiry as a pandas Timestamp (None if the hedge never expires)"""
+        import pandas as pd
+        expiry_ns = self._expiry_ns[self.idx[symbol]]
+        return None if expiry_ns == self.NO_EXPIRY_NS else pd.Timestamp(int(expiry_ns))
+    
+    def expired(self, now_ns: int) -> List[str]:
+        """Symbols whose hedge expired at or before now_ns (ns since epoch)"""
+        rows = np.flatnonzero(self.col('expiry_ns') <= now_ns)
+        return [self._symbols[row] for row in rows]
+    
+    def __setitem__(self, symbol: str, hedge: HedgePosition):
+        row = self.idx.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row == self._capacity:
+                self._grow()
+            self.idx[symbol] = row
+            self._symbols.append(symbol)
+            self._positions.append(hedge)
+        else:
+            self._retire_row(row)
+            self._positions[row] = hedge
+        self.write_row(row, hedge)
+    
+    def __getitem__(self, symbol: str) -> HedgePosition:
+        row = self.idx[symbol]
+        hedge = self._positions[row]
+        for name in self.PNL_COLUMNS:
+            setattr(hedge, name, float(getattr(self, f"_{name}")[row]))
+        return hedge
+    
+    def __delitem__(self, symbol: str):
+        row = self.idx.pop(symbol)
+        n = len(self._symbols)
+        self._retire_row(row)
+        if n == 1:
+            self.net_cost = self.hedge_pnl_total = 0.0  # drop accumulated rounding
+        # Shift later rows up so iteration keeps insertion order
+        for name in self.ARRAYS:
+            arr = getattr(self, f"_{name}")
+            arr[row:n - 1] = arr[row + 1:n]
+        del self._symbols[row]
+        del self._positions[row]
+        for i in range(row, n - 1):
+            self.idx[self._symbols[i]] = i
+        self.version += 1
+    
+    def __contains__(self, symbol) -> bool:
+        return symbol in self.idx
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+    
+    def __len__(self) -> int:
+        return len(self._symbols)
 
 
 class OptionsHedgeManager:
     """Manages protective options hedges for equity positions"""
     
-    def __init__(self, params: HedgeParameters = None):
-        """Initialize hedge manager"""
+    def __init__(self, params: HedgeParameters = None, silent: bool = False):
+        """Initialize hedge manager (silent skips per-hedge logging for long backtests)"""
         self.params = params or HedgeParameters()
-        self.hedged_positions: Dict[str, HedgePosition] = {}
-        self.hedge_history = []
+        self._silent = silent
+        
+        # Parameters are frozen, so hoist them into plain floats for the hot paths
+        self._k_put_strike = self.params.put_strike_pct
+        self._k_put_cost = self.params.put_cost_pct
+        self._k_call_strike = self.params.call_strike_pct
+        self._k_call_premium = self.params.call_premium_pct
+        self._k_hedge_threshold = self.params.hedge_threshold
+        self._k_partial_hedge = self.params.partial_hedge_pct
+        # Partial hedge size in int arithmetic when the float is exactly a small
+        # fraction (0.5, 0.25, ...); any other value keeps int(size * pct)
+        partial = Fraction(self._k_partial_hedge)
+        self._ph_fraction = (partial.numerator, partial.denominator) if partial.denominator <= 100 else None
+        self._k_rebalance_interval = self.params.rebalance_interval
+        self._k_rebalance_bars = self.params.rebalance_interval * self.params.bars_per_day
+        self._strategy_idx = STRATEGY_INDEX[self.params.strategy]
+        self._k_dynamic_trigger = -0.02  # dynamic hedges trigger below -2%
+        
+        # Strategy never changes after init: bind the specialized need check
+        self.evaluate_hedge_need = self._evaluators()[self._strategy_idx]
+        
+        # One row per strategy code:
+        # (put_strike_k, put_cost_k, call_strike_k, call_premium_k, size_mul, put_strike_slope)
+        # put strike = entry * (put_strike_k - hedge_pct * put_strike_slope),
+        # put cost scales with hedge_pct (1.0 except for dynamic hedges)
+        self._param_table = np.zeros((len(HedgeStrategy), 6))
+        self._param_table[_PROTECTIVE_PUT] = (self._k_put_strike, self._k_put_cost, 0.0, 0.0, 1.0, 0.0)
+        self._param_table[_COLLAR] = (self._k_put_strike, self._k_put_cost,
+                                      self._k_call_strike, self._k_call_premium, 1.0, 0.0)
+        self._param_table[_DYNAMIC_HEDGE] = (0.95, self._k_put_cost, 0.0, 0.0, 1.0, 0.10)
+        self._param_table[_PARTIAL_HEDGE] = (self._k_put_strike, self._k_put_cost,
+                                             0.0, 0.0, self._k_partial_hedge, 0.0)
+        self._param_rows = self._param_table.tolist()  # plain floats for scalar builds
+        self.hedged_positions = HedgeBook()
+        self._hist = np.zeros(64, dtype=_HIST_DTYPE)
+        self._hist_n = 0
         self.total_hedge_cost = 0.0
         self.total_hedge_benefit = 0.0
+        self._perf_cache: Optional[Dict] = None
+        self._perf_version = -1
     
     def evaluate_hedge_need(self,
                            symbol: str,
@@ -84,302 +372,349 @@ class OptionsHedgeManager:
                            entry_price: float,
                            position_size: int,
                            unrealized_pnl: float,
-                           unrealized_pnl_pct: float) -> Tuple[bool, str]:
-        """Determine if position needs hedging"""
-        
-        if self.params.strategy == HedgeStrategy.NO_HEDGE:
-            return False, "Hedging disabled"
-        
-        # Check if loss threshold exceeded
-        if unrealized_pnl_pct < self.params.hedge_threshold:
+                           unrealized_pnl_pct: float,
+                           now: Optional[datetime] = None,
+                           bar: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Determine if position needs hedging
+        
+        now is the bar timestamp in backtests; live mode leaves it None and
+        the clock is read only when a rebalance check actually needs it.
+        bar is the integer bar index; when given (and the hedge recorded one)
+        rebalancing is an int compare instead of a date difference.
+        
+        __init__ rebinds this on the instance to the _eval_* variant for the
+        configured strategy, so the per-tick path has no strategy checks.
+        """
+        return self._evaluators()[self._strategy_idx](
+            symbol, current_price, entry_price, position_size,
+            unrealized_pnl, unrealized_pnl_pct, now, bar)
+    
+    def _evaluators(self) -> Tuple:
+        """evaluate_hedge_need variants indexed by strategy code"""
+        return (self._eval_no_hedge, self._eval_protective_put, self._eval_default,
+                self._eval_dynamic_hedge, self._eval_default)
+    
+    def _eval_no_hedge(self, symbol, current_price, entry_price, position_size,
+                       unrealized_pnl, unrealized_pnl_pct, now=None, bar=None) -> Tuple[bool, str]:
+        return False, "Hedging disabled"
+    
+    def _eval_protective_put(self, symbol, current_price, entry_price, position_size,
+                             unrealized_pnl, unrealized_pnl_pct, now=None, bar=None) -> Tuple[bool, str]:
+        if unrealized_pnl_pct < self._k_hedge_threshold:
             return True, f"Loss threshold: {unrealized_pnl_pct:.2%}"
         
         # Protective put: always hedge at entry
-        if self.params.strategy == HedgeStrategy.PROTECTIVE_PUT:
-            if symbol not in self.hedged_positions:
-                return True, "New position - protective put recommended"
+        if symbol not in self.hedged_positions:
+            return True, "New position - protective put recommended"
+        
+        return self._eval_rebalance(symbol, now, bar)
+    
+    def _eval_dynamic_hedge(self, symbol, current_price, entry_price, position_size,
+                            unrealized_pnl, unrealized_pnl_pct, now=None, bar=None) -> Tuple[bool, str]:
+        if unrealized_pnl_pct < self._k_hedge_threshold:
+            return True, f"Loss threshold: {unrealized_pnl_pct:.2%}"
         
         # Dynamic: only hedge if losing
-        if self.params.strategy == HedgeStrategy.DYNAMIC_HEDGE:
-            if unrealized_pnl_pct < -0.02:  # -2%
-                return True, "Dynamic: Position losing, hedge triggered"
+        if unrealized_pnl_pct < self._k_dynamic_trigger:
+            return True, "Dynamic: Position losing, hedge triggered"
         
-        # Check if hedge needs rebalancing
-        if symbol in self.hedged_positions:
-            pos = self.hedged_positions[symbol]
+        return self._eval_rebalance(symbol, now, bar)
+    
+    def _eval_default(self, symbol, current_price, entry_price, position_size,
+                      unrealized_pnl, unrealized_pnl_pct, now=None, bar=None) -> Tuple[bool, str]:
+        """Collar and partial hedges: loss threshold and rebalance only"""
+        if unrealized_pnl_pct < self._k_hedge_threshold:
+            return True, f"Loss threshold: {unrealized_pnl_pct:.2%}"
+        
+        return self._eval_rebalance(symbol, now, bar)
+    
+    def _eval_rebalance(self,
+                        symbol: str,
+                        now: Optional[datetime],
+                        bar: Optional[int] = None) -> Tuple[bool, str]:
+        """Check if an existing hedge needs rebalancing"""
+        row = self.hedged_positions.idx.get(symbol)
+        if row is not None:
+            pos = self.hedged_positions._positions[row]
+            if bar is not None and pos.last_rebalance_bar >= 0:
+                if bar - pos.last_rebalance_bar > self._k_rebalance_bars:
+                    return True, "Hedge rebalance due"
+                return False, "No hedge needed"
+            
             if pos.last_rebalance is None:
                 return False, "Hedge in place"
             
-            days_since = (datetime.now() - pos.last_rebalance).days
-            if days_since > self.params.rebalance_interval:
+            # Calendar-day difference as a plain int subtract (no timedelta)
+            now_ord = (now or datetime.now()).toordinal()
+            days_since = now_ord - pos.last_rebalance.toordinal()
+            if days_since > self._k_rebalance_interval:
                 return True, "Hedge rebalance due"
         
         return False, "No hedge needed"
     
-    def calculate_protective_put(self,
-                                entry_price: float,
-                                current_price: float,
-                                position_size: int) -> HedgePosition:
-        """Calculate protective put hedge details"""
-        
-        # Put strike 5% below entry (out of the money)
-        put_strike = entry_price * self.params.put_strike_pct
-        
-        # Put cost (assume 2% of position value)
-        put_cost_per_share = entry_price * self.params.put_cost_pct
-        put_cost_total = put_cost_per_share * position_size
-        
-        # Effective protection: any loss below put strike is limited
-        max_loss = (entry_price - put_strike) * position_size
-        protection_value = max_loss - put_cost_total
+    def _build_hedge(self,
+                     kind: int,
+                     entry_price: float,
+                     current_price: float,
+                     position_size: int,
+                     hedge_pct: float = 1.0,
+                     now: Optional[datetime] = None,
+                     now_ns: Optional[int] = None) -> HedgePosition:
+        """Build a hedge for strategy code kind from its _param_table row (now_ns: now in ns, if known)"""
+        now = now or datetime.now()
+        if now_ns is None:
+            now_ns = _to_ns(now)
+        put_k, cost_k, call_k, premium_k, size_mul, put_slope = self._param_rows[kind]
+        
+        # Partial hedges only cover part of the shares
+        if kind == _PARTIAL_HEDGE:
+            if self._ph_fraction is None:
+                position_size = int(position_size * size_mul)
+            else:
+                num, den = self._ph_fraction
+                position_size = int(position_size * num // den)
+        
+        put_strike = entry_price * (put_k - hedge_pct * put_slope)
+        put_cost_total = entry_price * cost_k * hedge_pct * position_size
+        call_strike = entry_price * call_k
+        call_premium_total = entry_price * premium_k * position_size
+        coverage = hedge_pct * size_mul
         
         hedge = HedgePosition(
             symbol="",
             entry_price=entry_price,
-            entry_date=datetime.now(),
+            entry_date=now,
             position_size=position_size,
             current_price=current_price,
-            hedge_type="PROTECTIVE_PUT",
+            hedge_type=kind,
+            coverage=coverage,
             put_strike=put_strike,
             put_cost=put_cost_total,
-            call_strike=0.0,
-            call_premium=0.0,
+            call_strike=call_strike,
+            call_premium=call_premium_total,
             effective_stop_loss=put_strike,
             is_hedged=True,
-            hedge_expires_date=datetime.now() + timedelta(days=30),
-            last_rebalance=datetime.now(),
+            hedge_expires_date=_from_ns(now_ns + _HEDGE_LIFETIME_NS),
+            last_rebalance=now,
         )
         
-        logger.info(f"Protective put: Strike=${put_strike:.2f}, Cost=${put_cost_total:.2f}")
+        if not self._silent and logger.isEnabledFor(logging.INFO):
+            logger.info(_HEDGE_LOG_TEMPLATES[kind], {
+                'put_strike': put_strike, 'put_cost': put_cost_total, 'call_strike': call_strike,
+                'net_cost': put_cost_total - call_premium_total, 'pct': int(coverage * 100),
+                'size': position_size})
         return hedge
     
+    @staticmethod
+    def _dynamic_hedge_pct(unrealized_pnl_pct: float) -> float:
+        """Hedge coverage for a dynamic hedge, scaled by loss severity"""
+        loss_severity = fabs(unrealized_pnl_pct)  # e.g., 0.05 for -5% loss
+        return _DYN_COVERAGE[bisect_right(_DYN_THRESHOLDS, loss_severity)]
+    
+    def calculate_protective_put(self,
+                                entry_price: float,
+                                current_price: float,
+                                position_size: int,
+                                now: Optional[datetime] = None) -> HedgePosition:
+        """Calculate protective put hedge details (put strike below entry)"""
+        return self._build_hedge(_PROTECTIVE_PUT, entry_price, current_price, position_size, now=now)
+    
     def calculate_collar(self,
                         entry_price: float,
                         current_price: float,
-                        position_size: int) -> HedgePosition:
+                        position_size: int,
+                        now: Optional[datetime] = None) -> HedgePosition:
         """Calculate collar hedge (buy puts + sell calls)"""
-        
-        # Buy puts
-        put_strike = entry_price * self.params.put_strike_pct
-        put_cost_per_share = entry_price * self.params.put_cost_pct
-        put_cost_total = put_cost_per_share * position_size
-        
-        # Sell calls
-        call_strike = entry_price * self.params.call_strike_pct
-        call_premium_per_share = entry_price * self.params.call_premium_pct
-        call_premium_total = call_premium_per_share * position_size
-        
-        # Net cost
-        net_cost = put_cost_total - call_premium_total
-        
-        # Effective range: protected below put, capped above call
-        max_loss = (entry_price - put_strike) * position_size - net_cost
-        max_gain = (call_strike - entry_price) * position_size + net_cost
-        
-        hedge = HedgePosition(
-            symbol="",
-            entry_price=entry_price,
-            entry_date=datetime.now(),
-            position_size=position_size,
-            current_price=current_price,
-            hedge_type="COLLAR",
-            put_strike=put_strike,
-            put_cost=put_cost_total,
-            call_strike=call_strike,
-            call_premium=call_premium_total,
-            effective_stop_loss=put_strike,
-            is_hedged=True,
-            hedge_expires_date=datetime.now() + timedelta(days=30),
-            last_rebalance=datetime.now(),
-        )
-        
-        logger.info(f"Collar: Put ${put_strike:.2f}, Call ${call_strike:.2f}, Net Cost ${net_cost:.2f}")
-        return hedge
+        return self._build_hedge(_COLLAR, entry_price, current_price, position_size, now=now)
     
     def calculate_dynamic_hedge(self,
                                entry_price: float,
                                current_price: float,
                                position_size: int,
-                               unrealized_pnl_pct: float) -> HedgePosition:
+                               unrealized_pnl_pct: float,
+                               now: Optional[datetime] = None) -> HedgePosition:
         """Calculate dynamic hedge based on current loss level"""
-        
-        # Scale hedge based on loss severity
-        loss_severity = abs(unrealized_pnl_pct)  # e.g., 0.05 for -5% loss
-        
-        if loss_severity < 0.02:
-            hedge_pct = 0.25  # Light hedge
-        elif loss_severity < 0.05:
-            hedge_pct = 0.50  # Medium hedge
-        else:
-            hedge_pct = 0.75  # Heavy hedge
-        
-        # Adjust put strike based on severity
-        put_strike_offset = 0.95 - (hedge_pct * 0.10)  # More protection = closer to current
-        put_strike = entry_price * put_strike_offset
-        
-        # Scale put cost with protection level
-        put_cost_per_share = entry_price * self.params.put_cost_pct * hedge_pct
-        put_cost_total = put_cost_per_share * position_size
-        
-        hedge = HedgePosition(
-            symbol="",
-            entry_price=entry_price,
-            entry_date=datetime.now(),
-            position_size=position_size,
-            current_price=current_price,
-            hedge_type=f"DYNAMIC_HEDGE_{int(hedge_pct*100)}%",
-            put_strike=put_strike,
-            put_cost=put_cost_total,
-            effective_stop_loss=put_strike,
-            is_hedged=True,
-            hedge_expires_date=datetime.now() + timedelta(days=30),
-            last_rebalance=datetime.now(),
-        )
-        
-        logger.info(f"Dynamic hedge: {int(hedge_pct*100)}% coverage, Put ${put_strike:.2f}")
-        return hedge
+        return self._build_hedge(_DYNAMIC_HEDGE, entry_price, current_price, position_size,
+                                 self._dynamic_hedge_pct(unrealized_pnl_pct), now)
     
     def calculate_partial_hedge(self,
                                entry_price: float,
                                current_price: float,
-                               position_size: int) -> HedgePosition:
+                               position_size: int,
+                               now: Optional[datetime] = None) -> HedgePosition:
         """Hedge only portion of position"""
-        
-        # Hedge 50% of position
-        hedged_size = int(position_size * self.params.partial_hedge_pct)
-        
-        # Put strike
-        put_strike = entry_price * self.params.put_strike_pct
-        
-        # Cost only for hedged portion
-        put_cost_per_share = entry_price * self.params.put_cost_pct
-        put_cost_total = put_cost_per_share * hedged_size
-        
-        hedge = HedgePosition(
-            symbol="",
-            entry_price=entry_price,
-            entry_date=datetime.now(),
-            position_size=hedged_size,  # Only hedged portion
-            current_price=current_price,
-            hedge_type=f"PARTIAL_HEDGE_{int(self.params.partial_hedge_pct*100)}%",
-            put_strike=put_strike,
-            put_cost=put_cost_total,
-            effective_stop_loss=put_strike,
-            is_hedged=True,
-            hedge_expires_date=datetime.now() + timedelta(days=30),
-            last_rebalance=datetime.now(),
-        )
-        
-        logger.info(f"Partial hedge: {hedged_size} shares ({self.params.partial_hedge_pct*100:.0f}%), Put ${put_strike:.2f}")
-        return hedge
+        return self._build_hedge(_PARTIAL_HEDGE, entry_price, current_price, position_size, now=now)
     
     def hedge_position(self,
                       symbol: str,
                       entry_price: float,
                       current_price: float,
                       position_size: int,
-                      unrealized_pnl_pct: float = 0.0) -> Tuple[bool, HedgePosition]:
-        """Apply hedge to position based on strategy"""
+                      unrealized_pnl_pct: float = 0.0,
+                      now: Optional[datetime] = None,
+                      bar: Optional[int] = None) -> Tuple[bool, HedgePosition]:
+        """Apply hedge to position based on strategy (now: bar timestamp, None = live clock; bar: bar index)"""
+        now = now or datetime.now()
         
         # Check if hedging is justified
         needs_hedge, reason = self.evaluate_hedge_need(
-            symbol, current_price, entry_price, position_size, 0, unrealized_pnl_pct
+            symbol, current_price, entry_price, position_size, 0, unrealized_pnl_pct, now, bar
         )
         
         if not needs_hedge:
-            logger.info(f"{symbol}: {reason}")
+            if not self._silent:
+                logger.info("%s: %s", symbol, reason)
             return False, None
         
-        # Select hedge type
-        if self.params.strategy == HedgeStrategy.PROTECTIVE_PUT:
-            hedge = self.calculate_protective_put(entry_price, current_price, position_size)
-        
-        elif self.params.strategy == HedgeStrategy.COLLAR:
-            hedge = self.calculate_collar(entry_price, current_price, position_size)
-        
-        elif self.params.strategy == HedgeStrategy.DYNAMIC_HEDGE:
-            hedge = self.calculate_dynamic_hedge(entry_price, current_price, position_size, unrealized_pnl_pct)
-        
-        elif self.params.strategy == HedgeStrategy.PARTIAL_HEDGE:
-            hedge = self.calculate_partial_hedge(entry_price, current_price, position_size)
-        
-        else:
+        # Build the configured hedge type from its parameter row
+        kind = self._strategy_idx
+        if kind == _NO_HEDGE:
             return False, None
+        hedge_pct = self._dynamic_hedge_pct(unrealized_pnl_pct) if kind == _DYNAMIC_HEDGE else 1.0
+        now_ns = _to_ns(now)
+        hedge = self._build_hedge(kind, entry_price, current_price, position_size, hedge_pct, now, now_ns)
         
         # Store hedge
         hedge.symbol = symbol
+        if bar is not None:
+            hedge.last_rebalance_bar = bar
         self.hedged_positions[symbol] = hedge
         self.total_hedge_cost += hedge.put_cost - hedge.call_premium
         
-        self.hedge_history.append({
-            'timestamp': datetime.now(),
-            'symbol': symbol,
-            'hedge_type': hedge.hedge_type,
-            'entry_price': entry_price,
-            'put_strike': hedge.put_strike,
-            'cost': hedge.put_cost - hedge.call_premium,
-        })
+        if self._hist_n == len(self._hist):
+            self._hist = np.concatenate([self._hist, np.zeros(len(self._hist), dtype=_HIST_DTYPE)])
+        self._hist[self._hist_n] = (
+            now_ns, symbol, kind,
+            hedge.coverage, entry_price,
+            hedge.put_strike, hedge.put_cost - hedge.call_premium,
+        )
+        self._hist_n += 1
         
-        logger.info(f"✓ Hedged {symbol}: {hedge.hedge_type}")
+        if not self._silent and logger.isEnabledFor(logging.INFO):
+            logger.info("✓ Hedged %s: %s", symbol, hedge.hedge_type_name)
         return True, hedge
     
+    @property
+    def hedge_history(self):
+        """Hedge events as a pandas DataFrame, built on demand from the columnar log"""
+        import pandas as pd
+        
+        rows = self._hist[:self._hist_n]
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(rows['timestamp']),
+            'symbol': rows['symbol'],
+            'hedge_type': [_HEDGE_TYPE_NAMES[k].format(pct=int(c * 100))
+                           for k, c in zip(rows['hedge_type'], rows['coverage'])],
+            'entry_price': rows['entry_price'],
+            'put_strike': rows['put_strike'],
+            'cost': rows['cost'],
+        })
+    
     def update_hedge_pnl(self,
                         symbol: str,
                         current_price: float,
                         position_pnl: float) -> Optional[HedgePosition]:
         """Update P&L of hedged position"""
         
-        if symbol not in self.hedged_positions:
+        row = self.hedged_positions.idx.get(symbol)
+        if row is None:
             return None
         
-        hedge = self.hedged_positions[symbol]
+        hedge = self.hedged_positions._positions[row]
         hedge.current_price = current_price
         hedge.equity_pnl = position_pnl
         
         # Calculate hedge payoff
-        # Put protects against loss below strike
-        if current_price < hedge.put_strike:
-            # Put is in the money
-            hedge.hedge_pnl = (hedge.put_strike - current_price) * hedge.position_size - hedge.put_cost
-        else:
-            # Put is out of the money (only lost premium)
-            hedge.hedge_pnl = -hedge.put_cost
+        # Put intrinsic value is zero out of the money (only lost premium)
+        intrinsic = max(0.0, hedge.put_strike - current_price)
+        hedge.hedge_pnl = intrinsic * hedge.position_size - hedge.put_cost
         
-        # Adjust if collar (cap gains at call strike)
-        if hedge.hedge_type == "COLLAR":
+        # Adjust if collar (cap gains at call strike, add call credit)
+        if hedge.hedge_type == _COLLAR:
             if current_price > hedge.call_strike:
-                # Call is in the money, limit gains
-                capped_price = hedge.call_strike
-                hedge.equity_pnl = (capped_price - hedge.entry_price) * hedge.position_size
-            hedge.hedge_pnl += hedge.call_premium  # Add call credit
+                hedge.equity_pnl = (hedge.call_strike - hedge.entry_price) * hedge.position_size
+            hedge.hedge_pnl += hedge.call_premium
         
         # Total P&L with hedge
         hedge.total_pnl = hedge.equity_pnl + hedge.hedge_pnl
         
         self.total_hedge_benefit += hedge.hedge_pnl
+        self.hedged_positions.write_pnl(row, hedge)
         
         return hedge
     
+    def update_hedge_pnl_batch(self,
+                               prices: Dict[str, float],
+                               position_pnls: Optional[Dict[str, float]] = None) -> int:
+        """
+        Update P&L of every hedged position in prices in one vectorized pass
+        
+        Args:
+            prices: Current price per symbol (unhedged symbols are ignored)
+            position_pnls: Equity P&L per symbol; defaults to
+                (price - entry_price) * position_size of the hedged quantity
+            
+        Returns:
+            Number of positions updated
+        """
+        book = self.hedged_positions
+        symbols = [s for s in prices if s in book.idx]
+        if not symbols:
+            return 0
+        
+        rows = np.fromiter((book.idx[s] for s in symbols), dtype=np.int64, count=len(symbols))
+        current = np.fromiter((prices[s] for s in symbols), dtype=np.float64, count=len(symbols))
+        entry = book._entry_price[rows]
+        size = book._position_size[rows]
+        
+        if position_pnls is None:
+            equity_pnl = (current - entry) * size
+        else:
+            equity_pnl = np.fromiter((position_pnls[s] for s in symbols), dtype=np.float64, count=len(symbols))
+        
+        # Put payoff; collars also cap equity at the call strike and keep the credit
+        hedge_pnl = np.empty(len(symbols))
+        _get_payoff_kernel()(current, entry, book._put_strike[rows], book._put_cost[rows],
+                             book._call_strike[rows], book._call_premium[rows], size,
+                             book._is_collar[rows], hedge_pnl, equity_pnl)
+        
+        book.hedge_pnl_total += float(hedge_pnl.sum() - book._hedge_pnl[rows].sum())
+        book._current_price[rows] = current
+        book._equity_pnl[rows] = equity_pnl
+        book._hedge_pnl[rows] = hedge_pnl
+        book._total_pnl[rows] = equity_pnl + hedge_pnl
+        book.version += 1
+        
+        self.total_hedge_benefit += float(hedge_pnl.sum())
+        return len(symbols)
+    
     def evaluate_hedge_performance(self) -> Dict:
-        """Evaluate overall hedge performance"""
+        """
+        Evaluate overall hedge performance
         
-        total_cost = sum([h.put_cost - h.call_premium for h in self.hedged_positions.values()])
-        total_benefit = sum([h.hedge_pnl for h in self.hedged_positions.values()])
+        The result is cached until the hedge book changes, so repeated calls
+        between trades are O(1). Treat the returned dict as read-only.
+        """
         
-        # Count protected losses
-        protected_positions = 0
-        loss_saved = 0.0
+        book = self.hedged_positions
+        if book.version == self._perf_version:
+            return self._perf_cache
         
-        for hedge in self.hedged_positions.values():
-            if hedge.current_price < hedge.entry_price:
-                protected_positions += 1
-                # Calculate what loss would have been without hedge
-                unhedged_loss = (hedge.entry_price - hedge.current_price) * hedge.position_size
-                # Compare to hedged loss
-                hedged_loss = abs(hedge.total_pnl)
-                loss_saved += max(0, unhedged_loss - hedged_loss)
+        entry = book.col('entry_price')
+        current = book.col('current_price')
         
-        return {
+        total_cost = float(book.net_cost)
+        total_benefit = float(book.hedge_pnl_total)
+        
+        # Count protected losses and compare hedged vs unhedged loss
+        losing = current < entry
+        protected_positions = int(np.count_nonzero(losing))
+        unhedged_loss = (entry - current) * book.col('position_size')
+        hedged_loss = np.abs(book.col('total_pnl'))
+        loss_saved = float(np.maximum(0.0, unhedged_loss - hedged_loss)[losing].sum())
+        
+        self._perf_cache = {
             'total_hedges': len(self.hedged_positions),
             'hedged_symbols': list(self.hedged_positions.keys()),
             'total_hedge_cost': total_cost,
@@ -389,6 +724,12 @@ class OptionsHedgeManager:
             'cost_benefit_ratio': total_benefit / total_cost if total_cost > 0 else 0,
             'roi': (total_benefit - total_cost) / total_cost * 100 if total_cost > 0 else 0,
         }
+        self._perf_version = book.version
+        return self._perf_cache
+    
+    def expired_hedges(self, now: Optional[datetime] = None) -> List[str]:
+        """Symbols whose hedge has expired (now: bar timestamp, None = live clock)"""
+        return self.hedged_positions.expired(_to_ns(now or datetime.now()))
     
     def get_hedge_summary(self) -> str:
         """Get human-readable hedge summary"""
@@ -419,10 +760,108 @@ class HedgedBacktester:
         self.positions = {}
         self.closed_trades = []
     
-    def compare_strategies(self, price_data: Dict, spy_data: List) -> Dict:
-        """Compare unhedged vs hedged strategy performance"""
+    def compare_strategies(self,
+                           price_data: Dict,
+                           spy_data: List,
+                           capital_per_position: float = 10000.0) -> Dict:
+        """
+        Compare unhedged vs hedged strategy performance
+        
+        Each symbol is bought at its first bar and held to its last, with the
+        configured hedge applied at entry. A dynamic hedge is instead applied
+        at the first bar whose drawdown from entry would trigger
+        hedge_position, sized by that drawdown's coverage bucket; symbols
+        that never trigger stay unhedged. Prices are shaped into a
+        (num_bars, num_symbols) array (trailing bars aligned to the shortest
+        series) and both P&L curves are computed as whole-array expressions.
+        
+        Args:
+            price_data: Dict of symbol -> list of candles with 'close'
+            spy_data: SPY candles (kept for API compatibility; not used yet)
+            capital_per_position: Dollars allocated to each symbol at entry
+        """
+        symbols = [s for s, candles in price_data.items() if candles]
+        if not symbols:
+            return self._empty_comparison()
+        
+        num_bars = min(len(price_data[s]) for s in symbols)
+        prices = np.array([[c['close'] for c in price_data[s][-num_bars:]] for s in symbols],
+                          dtype=np.float64).T
+        
+        entry = prices[0]
+        size = capital_per_position / entry
+        
+        # Hedge legs from the manager's parameter row for the configured strategy
+        kind = self.hedge_manager._strategy_idx
+        put_k, cost_k, call_k, premium_k, size_mul, put_slope = self.hedge_manager._param_rows[kind]
+        if kind == _NO_HEDGE:
+            hedged_size = np.zeros_like(size)
+        else:
+            hedged_size = size * size_mul
+        
+        # Bar each hedge is placed at and its coverage (hedge_pct in _build_hedge)
+        if kind == _DYNAMIC_HEDGE:
+            manager = self.hedge_manager
+            trigger = max(manager._k_hedge_threshold, manager._k_dynamic_trigger)
+            triggered = prices / entry - 1 < trigger
+            hedged = triggered.any(axis=0)
+            start = np.where(hedged, triggered.argmax(axis=0), num_bars)
+            drawdown = prices[np.minimum(start, num_bars - 1), np.arange(len(symbols))] / entry - 1
+            bucket = np.searchsorted(_DYN_THRESHOLDS, np.abs(drawdown), side='right')
+            hedge_pct = np.where(hedged, np.take(_DYN_COVERAGE, bucket), 0.0)
+        else:
+            start = np.zeros(len(symbols), dtype=np.int64)
+            hedge_pct = np.ones(len(symbols))
+        active = np.arange(num_bars)[:, None] >= start
+        
+        put_strike = entry * (put_k - hedge_pct * put_slope)
+        put_cost = entry * cost_k * hedge_pct * hedged_size
+        call_premium = entry * premium_k * hedged_size
+        
+        # Mark-to-market P&L curves, shape (num_bars, num_symbols)
+        unhedged_pnl = (prices - entry) * size
+        if kind == _COLLAR:
+            capped = np.minimum(prices, entry * call_k)
+            equity_pnl = (capped - entry) * hedged_size + (prices - entry) * (size - hedged_size)
+        else:
+            equity_pnl = unhedged_pnl
+        put_payoff = np.maximum(0.0, put_strike - prices) * hedged_size * active
+        hedged_pnl = equity_pnl + put_payoff - (put_cost - call_premium) * active
+        
+        unhedged_final = unhedged_pnl[-1]
+        hedged_final = hedged_pnl[-1]
+        exit_prices = prices[-1]
+        hedge_cost = float((put_cost - call_premium).sum())
+        hedge_benefit = float(put_payoff[-1].sum())
+        
+        results = self._empty_comparison()
+        for key, final in (('unhedged', unhedged_final), ('hedged', hedged_final)):
+            res = results[key]
+            res['trades'] = [
+                {'symbol': s, 'entry_price': float(e), 'exit_price': float(x), 'pnl': float(p)}
+                for s, e, x, p in zip(symbols, entry, exit_prices, final)
+            ]
+            res['total_pnl'] = float(final.sum())
+            res['winning_trades'] = int(np.count_nonzero(final > 0))
+            res['losing_trades'] = len(symbols) - res['winning_trades']
+            res['max_loss_per_trade'] = float(min(final.min(), 0.0))
+        results['unhedged']['pnl_curve'] = unhedged_pnl.sum(axis=1)
+        results['hedged']['pnl_curve'] = hedged_pnl.sum(axis=1)
+        results['hedged']['hedge_cost'] = hedge_cost
+        results['hedged']['hedge_benefit'] = hedge_benefit
+        
+        results['improvement'] = {
+            'pnl_diff': results['hedged']['total_pnl'] - results['unhedged']['total_pnl'],
+            'max_loss_reduction': results['hedged']['max_loss_per_trade'] - results['unhedged']['max_loss_per_trade'],
+            'hedge_roi': (hedge_benefit - hedge_cost) / hedge_cost * 100 if hedge_cost > 0 else 0.0,
+        }
         
-        results = {
+        return results
+    
+    @staticmethod
+    def _empty_comparison() -> Dict:
+        """Result skeleton for compare_strategies"""
+        return {
             'unhedged': {
                 'trades': [],
                 'total_pnl': 0.0,
@@ -445,5 +884,3 @@ class HedgedBacktester:
                 'hedge_roi': 0.0,
             }
         }
-        
-        return results
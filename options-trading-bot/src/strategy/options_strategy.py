@@ -8,17 +8,129 @@ Generates options trades based on:
 4. Probability-weighted entry/exit decisions
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from src.quant.black_scholes import BlackScholesModel, estimate_volatility_from_prices
-from src.quant.monte_carlo import MonteCarloSimulator
+from dataclasses import dataclass, fields
+import logging
+import math
+import numpy as np
+from src.quant.black_scholes import BlackScholesModel, Greeks, estimate_volatility_from_prices
+from src.quant.monte_carlo import MonteCarloSimulator, make_rng
 from src.indicators.rsi import RSIIndicator
 from src.indicators.macd import MACDIndicator
+from src.indicators.stream import IndicatorStream
 from src.core.logger import logger
+from src.core.jit import njit
+from src.core.compat import DATACLASS_SLOTS
 
 
-@dataclass
+# Price series accepted by the strategy; lists are converted to float64 once
+PriceSeries = Union[List[float], np.ndarray]
+
+# Technical signal codes returned by _technical_signal_kernel
+SIGNAL_TYPES = ('none', 'rsi', 'macd', 'combo')
+
+# Recommendation tiers returned by _recommendation_kernel, worst to best
+RECOMMENDATIONS = ('STRONG_SELL', 'SELL', 'HOLD', 'BUY', 'STRONG_BUY')
+
+# Tier tables: each range is closed on both ends and the ranges are nested,
+# so tier = min(#lower bounds <= x, #upper bounds >= x), one searchsorted each
+PROB_LOWER = np.array([0.20, 0.30, 0.40])
+PROB_UPPER = np.array([0.70, 0.80, 0.90])
+PROB_SCORES = np.array([0.0, 15.0, 30.0, 40.0])
+DELTA_LOWER = np.array([0.20, 0.30])
+DELTA_UPPER = np.array([0.60, 0.70])
+DELTA_SCORES = np.array([5.0, 15.0, 20.0])
+REC_CONFIDENCE = np.array([50.0, 60.0, 70.0, 80.0])
+REC_PROB_LOWER = np.array([0.20, 0.30, 0.40, 0.45])
+REC_PROB_UPPER = np.array([0.65, 0.70, 0.80, 0.90])
+
+
+@njit('Tuple((i8, f8))(f8, f8, f8, f8, b1)', cache=True)
+def _technical_signal_kernel(rsi, macd, signal, histogram, is_call):
+    """Signal code (index into SIGNAL_TYPES) and strength 0-100; NaN inputs never signal"""
+    if is_call:
+        # Call: want bullish signals
+        rsi_hit = rsi < 30
+        macd_hit = macd > signal and histogram > 0
+    else:
+        # Put: want bearish signals
+        rsi_hit = rsi > 70
+        macd_hit = macd < signal and histogram < 0
+    
+    if rsi_hit and macd_hit:
+        return 3, 80.0
+    if rsi_hit:
+        return 1, 60.0
+    if macd_hit:
+        return 2, 50.0
+    return 0, 0.0
+
+
+@njit('f8(f8, f8, f8, f8, f8, b1)', cache=True, fastmath=True)
+def _confidence_kernel(signal_strength, prob_itm, delta, var, cvar, is_call):
+    """Confidence score 0-100 (see OptionsStrategy._calculate_confidence)"""
+    # Signal strength component (0-30)
+    signal_component = (signal_strength / 100) * 30
+    
+    # Probability ITM component (0-40), want 40-70% for good risk/reward
+    prob_tier = min(
+        np.searchsorted(PROB_LOWER, prob_itm, side='right'),
+        PROB_UPPER.shape[0] - np.searchsorted(PROB_UPPER, prob_itm, side='left')
+    )
+    prob_component = PROB_SCORES[prob_tier]
+    
+    # Delta component (0-20): calls want 0.3-0.6, puts -0.6 to -0.3
+    if not is_call:
+        delta = -delta
+    delta_tier = min(
+        np.searchsorted(DELTA_LOWER, delta, side='right'),
+        DELTA_UPPER.shape[0] - np.searchsorted(DELTA_UPPER, delta, side='left')
+    )
+    delta_component = DELTA_SCORES[delta_tier]
+    
+    # Risk/Reward component (0-10)
+    if var > 0 and cvar > 0:
+        ratio = min(1.0, 1.0 / (cvar / var))  # Reward/Risk
+        reward_component = min(10.0, ratio * 5)
+    else:
+        reward_component = 5.0
+    
+    total = signal_component + prob_component + delta_component + reward_component
+    return min(100.0, max(0.0, total))
+
+
+@njit('i8(f8, f8)', cache=True)
+def _recommendation_kernel(confidence_score, prob_itm):
+    """Recommendation tier (index into RECOMMENDATIONS); NaN prob_itm is STRONG_SELL"""
+    confidence_tier = np.searchsorted(REC_CONFIDENCE, confidence_score, side='right')
+    prob_tier = min(
+        np.searchsorted(REC_PROB_LOWER, prob_itm, side='right'),
+        REC_PROB_UPPER.shape[0] - np.searchsorted(REC_PROB_UPPER, prob_itm, side='left')
+    )
+    return min(confidence_tier, prob_tier)
+
+
+@njit(cache=True)
+def _ladder_scores_kernel(signal_strength, prob_itm, delta, var, cvar, is_call, confidence, tiers):
+    """Fill confidence[i] and recommendation tiers[i] for every strike of a ladder"""
+    for i in range(prob_itm.shape[0]):
+        confidence[i] = _confidence_kernel(signal_strength, prob_itm[i], delta[i], var[i], cvar[i], is_call)
+        tiers[i] = _recommendation_kernel(confidence[i], prob_itm[i])
+
+
+@lru_cache(maxsize=16384)
+def _greeks_cached(
+    spot_q: float, strike_q: float, time_q: float, vol_q: float, is_call: bool, rate_q: float
+) -> Greeks:
+    """calculate_greeks on already-quantized inputs (see OptionsStrategy._greeks)"""
+    return BlackScholesModel.calculate_greeks(
+        spot_q, strike_q, time_q, vol_q, 'call' if is_call else 'put', rate_q
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OptionsTrade:
     """Represents an options trading opportunity"""
     symbol: str
@@ -57,6 +169,26 @@ class OptionsTrade:
     recommendation: str  # 'STRONG_BUY', 'BUY', 'HOLD', 'SELL', 'STRONG_SELL'
 
 
+def _nan_if_none(value: Optional[float]) -> float:
+    """Missing indicator values (insufficient data) become NaN for the kernels"""
+    return math.nan if value is None else float(value)
+
+
+def _delta_component(delta, is_call: bool):
+    """Delta score of _confidence_kernel (5/15/20), vectorized over delta arrays"""
+    delta = np.asarray(delta) if is_call else -np.asarray(delta)
+    tier = np.minimum(
+        np.searchsorted(DELTA_LOWER, delta, side='right'),
+        DELTA_UPPER.shape[0] - np.searchsorted(DELTA_UPPER, delta, side='left')
+    )
+    return DELTA_SCORES[tier]
+
+
+def _max_confidence(signal_strength: float, delta_component=DELTA_SCORES[-1]):
+    """Upper bound on the confidence score before Monte Carlo (prob 40, reward 5 at best)"""
+    return signal_strength * 0.3 + delta_component + PROB_SCORES[-1] + 5.0
+
+
 class OptionsStrategy:
     """Options trading strategy with Greeks and Monte Carlo analysis"""
     
@@ -65,7 +197,10 @@ class OptionsStrategy:
         account_size: float = 10000,
         max_risk_percent: float = 0.02,
         risk_free_rate: float = 0.05,
-        days_to_expiry_range: Tuple[int, int] = (30, 45)
+        days_to_expiry_range: Tuple[int, int] = (30, 45),
+        seed: Optional[int] = None,
+        min_confidence_threshold: float = 50,
+        strict_filter: bool = False
     ):
         """
         Initialize options strategy
@@ -75,23 +210,53 @@ class OptionsStrategy:
             max_risk_percent: Max risk per trade (2%)
             risk_free_rate: Annual risk-free rate
             days_to_expiry_range: Preferred DTE range
+            seed: Monte Carlo RNG seed (None for fresh entropy)
+            min_confidence_threshold: Lowest confidence returned when strict_filter is on
+            strict_filter: Drop trades below min_confidence_threshold, skipping
+                Black-Scholes/Monte Carlo once the score provably can't reach it
         """
         self.account_size = account_size
         self.max_risk_percent = max_risk_percent
         self.max_risk_per_trade = account_size * max_risk_percent
         self.risk_free_rate = risk_free_rate
         self.days_to_expiry_range = days_to_expiry_range
+        self.min_confidence_threshold = min_confidence_threshold
+        self.strict_filter = strict_filter
         
         # Technical indicators
         self.rsi = RSIIndicator(period=14)
-        self.macd = MACDIndicator(fast=12, slow=26, signal=9)
+        self.macd = MACDIndicator(fast_period=12, slow_period=26, signal_period=9)
+        
+        # Last _precompute_tech result, keyed on (closes, option_type)
+        self._tech_cache = None
+        
+        # Per-symbol rolling RSI/MACD, advanced in O(1) when closes grow by one bar
+        self._indicator_streams: Dict[str, IndicatorStream] = {}
+        
+        # Monte Carlo generator and terminal-price buffer reused across calls
+        self._rng = make_rng(seed)
+        self._mc_buffer = np.empty(0)
         
         logger.info(f"Options Strategy initialized: Account=${account_size}, Risk={max_risk_percent*100}%")
     
+    def reset(self, seed: Optional[int] = None):
+        """Reset indicator state and reseed the Monte Carlo RNG (e.g. per symbol)"""
+        self.rsi.reset()
+        self.macd.reset()
+        self._tech_cache = None
+        self._indicator_streams.clear()
+        self._rng = make_rng(seed)
+    
+    def _mc_out(self, num_simulations: int) -> np.ndarray:
+        """Terminal-price buffer, grown only when num_simulations increases"""
+        if self._mc_buffer.shape[0] < num_simulations:
+            self._mc_buffer = np.empty(num_simulations)
+        return self._mc_buffer
+    
     def analyze(
         self,
         symbol: str,
-        closes: List[float],
+        closes: PriceSeries,
         current_price: float,
         strike_price: float,
         days_to_expiry: int,
@@ -103,7 +268,7 @@ class OptionsStrategy:
         
         Args:
             symbol: Stock symbol
-            closes: List of recent closing prices (30+ minimum)
+            closes: Recent closing prices, list or float64 array (30+ minimum)
             current_price: Current stock price
             strike_price: Option strike price
             days_to_expiry: Days until expiration
@@ -111,51 +276,152 @@ class OptionsStrategy:
             num_simulations: Monte Carlo simulations
             
         Returns:
-            OptionsTrade object or None if insufficient data
+            OptionsTrade object, or None if insufficient data, no signal, or
+            (with strict_filter) confidence below min_confidence_threshold
         """
         if len(closes) < 30:
-            logger.warning(f"{symbol}: Insufficient data for analysis ({len(closes)} < 30)")
+            logger.warning("%s: Insufficient data for analysis (%d < 30)", symbol, len(closes))
             return None
         
+        tech = self._precompute_tech(closes, option_type, symbol)
+        if tech[5] == 0:
+            logger.info("%s: No technical signal", symbol)
+            return None
+        if self.strict_filter and _max_confidence(tech[5]) < self.min_confidence_threshold:
+            return None
+        
+        return self._analyze_core(
+            symbol, tech, current_price, strike_price, days_to_expiry, option_type, num_simulations
+        )
+    
+    def _precompute_tech(
+        self,
+        closes: PriceSeries,
+        option_type: str,
+        symbol: Optional[str] = None
+    ) -> Tuple:
+        """
+        Strike-independent analysis of closes: technical signal and volatility
+        
+        The last result is memoized on (closes, option_type), so analyzing
+        several strikes of one chain against the same closes computes RSI,
+        MACD and volatility once. With a symbol, RSI and MACD come from that
+        symbol's IndicatorStream.
+        
+        Returns:
+            Tuple of (rsi_value, macd_value, signal, histogram, signal_type,
+            signal_strength, volatility)
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        key = (closes.tobytes(), option_type.lower())
+        if self._tech_cache is not None and self._tech_cache[0] == key:
+            return self._tech_cache[1]
+        
         # 1. Technical Analysis
-        rsi_value = self.rsi.calculate(closes)
-        macd_value, signal, histogram = self.macd.calculate(closes)
+        if symbol is None:
+            rsi_value = self.rsi.calculate(closes)
+            macd_value, signal, histogram = self.macd.calculate(closes)
+        else:
+            stream = self._indicator_streams.get(symbol)
+            if stream is None:
+                stream = self._indicator_streams[symbol] = IndicatorStream(
+                    self.rsi.period, self.macd.fast_period, self.macd.slow_period, self.macd.signal_period
+                )
+            rsi_value, (macd_value, signal, histogram) = stream.advance(closes)
         signal_type, signal_strength = self._evaluate_technical_signal(
             rsi_value, macd_value, signal, histogram, option_type
         )
         
-        if signal_strength == 0:
-            logger.info(f"{symbol}: No technical signal")
-            return None
-        
         # 2. Estimate volatility from historical prices
         volatility = estimate_volatility_from_prices(closes, window=20)
+        
+        tech = (rsi_value, macd_value, signal, histogram, signal_type, signal_strength, volatility)
+        self._tech_cache = (key, tech)
+        return tech
+    
+    def _analyze_core(
+        self,
+        symbol: str,
+        tech: Tuple,
+        current_price: float,
+        strike_price: float,
+        days_to_expiry: int,
+        option_type: str,
+        num_simulations: int
+    ) -> Optional[OptionsTrade]:
+        """Price, simulate and score one strike given _precompute_tech output"""
+        rsi_value, macd_value, _, _, signal_type, signal_strength, volatility = tech
         time_to_expiry = days_to_expiry / 365.0
         
         # 3. Black-Scholes pricing and Greeks
-        greeks = BlackScholesModel.calculate_greeks(
-            current_price, strike_price, time_to_expiry, volatility, option_type, self.risk_free_rate
-        )
-        
-        # 4. Monte Carlo analysis
-        mc_option = MonteCarloSimulator.price_european_option(
+        greeks = self._greeks(current_price, strike_price, time_to_expiry, volatility, option_type)
+        if self.strict_filter:
+            delta_component = _delta_component(greeks.delta, option_type.lower() == 'call')
+            if _max_confidence(signal_strength, delta_component) < self.min_confidence_threshold:
+                return None
+        
+        # 4. Position size (1-5 contracts) for the risk analysis
+        max_position_size = int(self.account_size / (greeks.price * 100 + 1))
+        position_size = max(1, min(max_position_size, 5))
+        
+        # 5. Monte Carlo price, ITM probability and VaR/CVaR from one simulation
+        mc = MonteCarloSimulator.simulate_and_analyze(
             current_price, strike_price, volatility, self.risk_free_rate, days_to_expiry,
-            option_type, num_simulations
+            option_type, position_size, 0.95, num_simulations,
+            rng=self._rng, out=self._mc_out(num_simulations)
         )
         
-        mc_prob = MonteCarloSimulator.calculate_probability_itm(
-            current_price, strike_price, volatility, self.risk_free_rate, days_to_expiry,
-            option_type, num_simulations
+        trade = self._build_trade(
+            symbol, option_type, strike_price, days_to_expiry, current_price,
+            rsi_value, macd_value, signal_type, signal_strength, greeks,
+            mc['prob_itm_at_expiry'], mc['var_95'], mc['cvar_95'],
+            mc['option_price'], position_size
         )
+        if self.strict_filter and trade.confidence_score < self.min_confidence_threshold:
+            return None
+        return trade
+    
+    def _greeks(
+        self,
+        spot_price: float,
+        strike_price: float,
+        time_to_expiry: float,
+        volatility: float,
+        option_type: str
+    ) -> Greeks:
+        """
+        Black-Scholes Greeks memoized on quantized inputs
         
-        # 5. Risk analysis (VaR/CVaR)
-        max_position_size = int(self.account_size / (greeks['price'] * 100 + 1))
-        position_size = max(1, min(max_position_size, 5))  # 1-5 contracts
-        
-        risk_analysis = MonteCarloSimulator.calculate_var_cvar(
-            current_price, strike_price, position_size, option_type,
-            volatility, self.risk_free_rate, days_to_expiry, 0.95, num_simulations
+        Backtest replays call analyze with many near-identical inputs, so spot
+        is rounded to 4 decimals, strike to 2, time to whole days and
+        volatility/rate to 4 decimals before hitting a bounded LRU cache.
+        """
+        return _greeks_cached(
+            round(spot_price, 4), round(strike_price, 2), round(time_to_expiry * 365) / 365,
+            round(volatility, 4), option_type.lower() == 'call', round(self.risk_free_rate, 4)
         )
+    
+    def _build_trade(
+        self,
+        symbol: str,
+        option_type: str,
+        strike_price: float,
+        days_to_expiry: int,
+        current_price: float,
+        rsi_value: float,
+        macd_value: float,
+        signal_type: str,
+        signal_strength: float,
+        greeks: Greeks,
+        prob_itm: float,
+        var_95: float,
+        cvar_95: float,
+        mc_price: float,
+        position_size: int
+    ) -> OptionsTrade:
+        """Score analysis results for one strike and package them as an OptionsTrade"""
+        mc_prob = {'prob_itm_at_expiry': prob_itm}
+        risk_analysis = {'var_95': var_95, 'cvar_95': cvar_95}
         
         # 6. Calculate confidence score (0-100)
         confidence_score = self._calculate_confidence(
@@ -166,41 +432,42 @@ class OptionsStrategy:
         recommendation = self._get_recommendation(confidence_score, greeks, mc_prob)
         
         # 8. Calculate expected payoff
-        expected_payoff = mc_option['option_price'] * position_size * 100
-        reward_potential = greeks['delta'] * (current_price * 0.05) * position_size * 100  # 5% move
+        expected_payoff = mc_price * position_size * 100
+        reward_potential = greeks.delta * (current_price * 0.05) * position_size * 100  # 5% move
         
         trade = OptionsTrade(
             symbol=symbol,
             option_type=option_type,
             strike_price=strike_price,
             expiration_date=datetime.now() + timedelta(days=days_to_expiry),
-            entry_price=greeks['price'],
+            entry_price=greeks.price,
             entry_signal_type=signal_type,
             rsi_value=rsi_value,
             macd_value=macd_value,
             signal_strength=signal_strength,
-            bs_price=greeks['price'],
-            delta=greeks['delta'],
-            gamma=greeks['gamma'],
-            vega=greeks['vega'],
-            theta=greeks['theta'],
-            rho=greeks['rho'],
-            prob_itm=mc_prob['prob_itm_at_expiry'],
-            var_95=risk_analysis['var_95'],
-            cvar_95=risk_analysis['cvar_95'],
+            bs_price=greeks.price,
+            delta=greeks.delta,
+            gamma=greeks.gamma,
+            vega=greeks.vega,
+            theta=greeks.theta,
+            rho=greeks.rho,
+            prob_itm=prob_itm,
+            var_95=var_95,
+            cvar_95=cvar_95,
             expected_payoff=expected_payoff,
             contracts_suggested=position_size,
-            risk_per_trade=risk_analysis['var_95'],
+            risk_per_trade=var_95,
             reward_potential=reward_potential,
             confidence_score=confidence_score,
             recommendation=recommendation
         )
         
-        logger.info(
-            f"{symbol} {option_type.upper()} ${strike_price} "
-            f"({days_to_expiry}DTE): {recommendation} "
-            f"(conf={confidence_score:.0f}%, prob_itm={mc_prob['prob_itm_at_expiry']:.1%})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s %s $%s (%dDTE): %s (conf=%.0f%%, prob_itm=%.1f%%)",
+                symbol, option_type.upper(), strike_price, days_to_expiry,
+                recommendation, confidence_score, prob_itm * 100
+            )
         
         return trade
     
@@ -218,48 +485,16 @@ class OptionsStrategy:
         Returns:
             Tuple of (signal_type, signal_strength 0-100)
         """
-        signal_type = 'none'
-        strength = 0.0
-        
-        is_call = option_type.lower() == 'call'
-        
-        # RSI signals
-        rsi_oversold = rsi < 30
-        rsi_overbought = rsi > 70
-        
-        # MACD signals
-        macd_bullish = macd > signal and histogram > 0
-        macd_bearish = macd < signal and histogram < 0
-        
-        if is_call:
-            # Call: want bullish signals
-            if rsi_oversold and macd_bullish:
-                signal_type = 'combo'
-                strength = 80.0  # Strong buy signal
-            elif rsi_oversold:
-                signal_type = 'rsi'
-                strength = 60.0
-            elif macd_bullish:
-                signal_type = 'macd'
-                strength = 50.0
-        else:
-            # Put: want bearish signals
-            if rsi_overbought and macd_bearish:
-                signal_type = 'combo'
-                strength = 80.0  # Strong sell signal
-            elif rsi_overbought:
-                signal_type = 'rsi'
-                strength = 60.0
-            elif macd_bearish:
-                signal_type = 'macd'
-                strength = 50.0
-        
-        return signal_type, strength
+        code, strength = _technical_signal_kernel(
+            _nan_if_none(rsi), _nan_if_none(macd), _nan_if_none(signal), _nan_if_none(histogram),
+            option_type.lower() == 'call'
+        )
+        return SIGNAL_TYPES[code], strength
     
     def _calculate_confidence(
         self,
         signal_strength: float,
-        greeks: Dict,
+        greeks: Greeks,
         mc_prob: Dict,
         risk_analysis: Dict,
         option_type: str
@@ -273,80 +508,36 @@ class OptionsStrategy:
         - Delta appropriateness (20%)
         - Risk/Reward ratio (10%)
         """
-        # Signal strength component (0-30)
-        signal_component = (signal_strength / 100) * 30
-        
-        # Probability ITM component (0-40)
-        prob_itm = mc_prob['prob_itm_at_expiry']
-        # Want 40-70% for good risk/reward
-        prob_component = 0
-        if 0.40 <= prob_itm <= 0.70:
-            prob_component = 40
-        elif 0.30 <= prob_itm <= 0.80:
-            prob_component = 30
-        elif 0.20 <= prob_itm <= 0.90:
-            prob_component = 15
-        
-        # Delta component (0-20)
-        delta = greeks['delta']
-        if option_type.lower() == 'call':
-            # For calls, want 0.3-0.6 delta (not too risky, not too slow)
-            if 0.30 <= delta <= 0.60:
-                delta_component = 20
-            elif 0.20 <= delta <= 0.70:
-                delta_component = 15
-            else:
-                delta_component = 5
-        else:
-            # For puts, want -0.6 to -0.3 delta
-            if -0.60 <= delta <= -0.30:
-                delta_component = 20
-            elif -0.70 <= delta <= -0.20:
-                delta_component = 15
-            else:
-                delta_component = 5
-        
-        # Risk/Reward component (0-10)
-        var = risk_analysis['var_95']
-        cvar = risk_analysis['cvar_95']
-        if var > 0 and cvar > 0:
-            ratio = min(1.0, 1.0 / (cvar / var))  # Reward/Risk
-            reward_component = min(10, ratio * 5)
-        else:
-            reward_component = 5
-        
-        total = signal_component + prob_component + delta_component + reward_component
-        return min(100, max(0, total))
+        return _confidence_kernel(
+            signal_strength, mc_prob['prob_itm_at_expiry'], greeks.delta,
+            risk_analysis['var_95'], risk_analysis['cvar_95'], option_type.lower() == 'call'
+        )
     
-    def _get_recommendation(self, confidence_score: float, greeks: Dict, mc_prob: Dict) -> str:
+    def _get_recommendation(self, confidence_score: float, greeks: Greeks, mc_prob: Dict) -> str:
         """
         Get trading recommendation based on confidence and metrics
         """
-        prob_itm = mc_prob['prob_itm_at_expiry']
-        
-        if confidence_score >= 80 and 0.45 <= prob_itm <= 0.65:
-            return 'STRONG_BUY'
-        elif confidence_score >= 70 and 0.40 <= prob_itm <= 0.70:
-            return 'BUY'
-        elif confidence_score >= 60 and 0.30 <= prob_itm <= 0.80:
-            return 'HOLD'
-        elif confidence_score >= 50 and 0.20 <= prob_itm <= 0.90:
-            return 'SELL'
-        else:
-            return 'STRONG_SELL'
+        code = _recommendation_kernel(confidence_score, mc_prob['prob_itm_at_expiry'])
+        return RECOMMENDATIONS[code]
     
     def analyze_strike_ladder(
         self,
         symbol: str,
-        closes: List[float],
+        closes: PriceSeries,
         current_price: float,
         strikes: List[float],
         days_to_expiry: int,
-        option_type: str = 'call'
+        option_type: str = 'call',
+        num_simulations: int = 5000
     ) -> Dict[float, OptionsTrade]:
         """
         Analyze multiple strikes (option chain) for same expiration
         
+        Strikes are broadcast against shared Monte Carlo samples: prices and
+        ITM probabilities come from an importance-sampled draw (shifted toward
+        out-of-the-money strikes), VaR/CVaR from one plain GBM draw, and Greeks
+        from one batched Black-Scholes pass.
+        
         Args:
             symbol: Stock symbol
             closes: Historical prices
@@ -354,59 +545,242 @@ class OptionsStrategy:
             strikes: List of strike prices to analyze
             days_to_expiry: Days to expiration
             option_type: 'call' or 'put'
+            num_simulations: Monte Carlo simulations (shared by all strikes)
             
         Returns:
             Dictionary mapping strike to OptionsTrade analysis
         """
-        results = {}
+        ladder = self._ladder_columns(
+            symbol, closes, current_price, strikes, days_to_expiry, option_type, num_simulations
+        )
+        if ladder is None:
+            return {}
+        tech, strikes, greeks, prob_itm, mc_price, var_95, cvar_95, sizes = ladder
+        rsi_value, macd_value, _, _, signal_type, signal_strength, _ = tech
         
-        for strike in strikes:
-            trade = self.analyze(
-                symbol, closes, current_price, strike, days_to_expiry, option_type
+        # One Greeks tuple of floats per strike
+        greek_rows = map(Greeks._make, zip(*(values.tolist() for values in greeks)))
+        results = {}
+        for i, (strike, strike_greeks) in enumerate(zip(strikes, greek_rows)):
+            trade = self._build_trade(
+                symbol, option_type, strike, days_to_expiry, current_price,
+                rsi_value, macd_value, signal_type, signal_strength, strike_greeks,
+                float(prob_itm[i]), float(var_95[i]), float(cvar_95[i]),
+                float(mc_price[i]), int(sizes[i])
             )
-            if trade:
+            if not self.strict_filter or trade.confidence_score >= self.min_confidence_threshold:
                 results[strike] = trade
         
         return results
+    
+    def analyze_strike_ladder_df(
+        self,
+        symbol: str,
+        closes: PriceSeries,
+        current_price: float,
+        strikes: List[float],
+        days_to_expiry: int,
+        option_type: str = 'call',
+        num_simulations: int = 5000
+    ):
+        """
+        Analyze multiple strikes like analyze_strike_ladder, as a DataFrame
+        
+        Columns are the OptionsTrade fields, built straight from the ladder
+        arrays without creating an OptionsTrade per strike; rows from
+        df.itertuples() can be passed to format_trade_report.
+        
+        Returns:
+            pandas DataFrame with one row per strike (empty if no signal)
+        """
+        import pandas as pd
+        
+        columns = [f.name for f in fields(OptionsTrade)]
+        ladder = self._ladder_columns(
+            symbol, closes, current_price, strikes, days_to_expiry, option_type, num_simulations
+        )
+        if ladder is None:
+            return pd.DataFrame(columns=columns)
+        tech, strikes, greeks, prob_itm, mc_price, var_95, cvar_95, sizes = ladder
+        rsi_value, macd_value, _, _, signal_type, signal_strength, _ = tech
+        
+        is_call = option_type.lower() == 'call'
+        confidence = np.empty(len(strikes))
+        tiers = np.empty(len(strikes), dtype=np.int64)
+        _ladder_scores_kernel(
+            float(signal_strength), np.asarray(prob_itm, dtype=np.float64),
+            np.asarray(greeks.delta, dtype=np.float64), np.asarray(var_95, dtype=np.float64),
+            np.asarray(cvar_95, dtype=np.float64), is_call, confidence, tiers
+        )
+        recommendation = [RECOMMENDATIONS[tier] for tier in tiers.tolist()]
+        
+        df = pd.DataFrame({
+            'symbol': symbol,
+            'option_type': option_type,
+            'strike_price': np.asarray(strikes, dtype=np.float64),
+            'expiration_date': datetime.now() + timedelta(days=days_to_expiry),
+            'entry_price': greeks.price,
+            'entry_signal_type': signal_type,
+            'rsi_value': rsi_value,
+            'macd_value': macd_value,
+            'signal_strength': signal_strength,
+            'bs_price': greeks.price,
+            'delta': greeks.delta,
+            'gamma': greeks.gamma,
+            'vega': greeks.vega,
+            'theta': greeks.theta,
+            'rho': greeks.rho,
+            'prob_itm': prob_itm,
+            'var_95': var_95,
+            'cvar_95': cvar_95,
+            'expected_payoff': mc_price * sizes * 100,
+            'contracts_suggested': sizes,
+            'risk_per_trade': var_95,
+            'reward_potential': greeks.delta * (current_price * 0.05) * sizes * 100,  # 5% move
+            'confidence_score': confidence,
+            'recommendation': recommendation,
+        })
+        if self.strict_filter:
+            df = df[df['confidence_score'] >= self.min_confidence_threshold].reset_index(drop=True)
+        return df[columns]
+    
+    def _ladder_columns(
+        self,
+        symbol: str,
+        closes: PriceSeries,
+        current_price: float,
+        strikes: List[float],
+        days_to_expiry: int,
+        option_type: str,
+        num_simulations: int
+    ) -> Optional[Tuple]:
+        """
+        Vectorized per-strike analysis shared by the ladder methods
+        
+        With strict_filter, strikes whose delta caps the confidence below
+        min_confidence_threshold are dropped before any simulation.
+        
+        Returns:
+            Tuple of (tech, strikes, greeks, prob_itm, mc_price, var_95,
+            cvar_95, sizes) with one array entry per analyzed strike, or None
+            if there is nothing to analyze
+        """
+        if len(closes) < 30:
+            logger.warning("%s: Insufficient data for analysis (%d < 30)", symbol, len(closes))
+            return None
+        if not len(strikes):
+            return None
+        
+        # Technicals and volatility don't depend on the strike
+        tech = self._precompute_tech(closes, option_type, symbol)
+        signal_strength, volatility = tech[5], tech[6]
+        
+        if signal_strength == 0:
+            logger.info("%s: No technical signal", symbol)
+            return None
+        if self.strict_filter and _max_confidence(signal_strength) < self.min_confidence_threshold:
+            return None
+        
+        time_to_expiry = days_to_expiry / 365.0
+        is_call = option_type.lower() == 'call'
+        strike_arr = np.asarray(strikes, dtype=np.float64)
+        
+        greeks = BlackScholesModel.calculate_greeks_batch(
+            current_price, strike_arr, time_to_expiry, volatility, option_type, self.risk_free_rate
+        )
+        
+        if self.strict_filter:
+            bound = _max_confidence(signal_strength, _delta_component(greeks.delta, is_call))
+            keep = bound >= self.min_confidence_threshold
+            if not keep.any():
+                return None
+            if not keep.all():
+                strikes = [strike for strike, kept in zip(strikes, keep.tolist()) if kept]
+                strike_arr = strike_arr[keep]
+                greeks = Greeks._make(values[keep] for values in greeks)
+        
+        # Price and ITM probability: importance sampled toward OTM strikes
+        estimates = MonteCarloSimulator.simulate_importance_sampled(
+            current_price, strike_arr, volatility, self.risk_free_rate, days_to_expiry,
+            option_type, num_simulations, rng=self._rng
+        )
+        prob_itm = estimates['prob_itm_at_expiry']
+        mc_price = estimates['option_price']
+        
+        # Risk needs the real-world P&L distribution: one plain GBM sample
+        # shared by every strike
+        final_prices = MonteCarloSimulator.simulate_terminal_prices(
+            current_price, volatility, self.risk_free_rate, days_to_expiry, num_simulations,
+            rng=self._rng, out=self._mc_out(num_simulations)
+        )
+        moneyness = final_prices[None, :] - strike_arr[:, None]  # (strikes, simulations)
+        if not is_call:
+            moneyness = -moneyness
+        payoffs = np.maximum(moneyness, 0.0)
+        
+        # Position size per strike (1-5 contracts), then VaR/CVaR of P&L
+        # against the same rough ATM premium calculate_var_cvar assumes
+        max_sizes = (self.account_size / (greeks.price * 100 + 1)).astype(np.int64)
+        sizes = np.clip(max_sizes, 1, 5)
+        cutoff = int(num_simulations * 0.05)
+        pnl = np.partition((payoffs - 0.05 * current_price) * sizes[:, None], cutoff, axis=1)
+        var_95 = -pnl[:, cutoff]
+        cvar_95 = -pnl[:, :cutoff].mean(axis=1) if cutoff > 0 else var_95
+        
+        return tech, strikes, greeks, prob_itm, mc_price, var_95, cvar_95, sizes
 
 
-def format_trade_report(trade: OptionsTrade) -> str:
-    """Format options trade analysis as readable report"""
-    
-    report = f"""
+# Report layout, parsed once; placeholders are OptionsTrade fields plus
+# option_type_upper and expiration_str (see format_trade_report)
+_REPORT_TEMPLATE = """
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║  OPTIONS TRADE ANALYSIS REPORT                                           ║
 ╠══════════════════════════════════════════════════════════════════════════╣
-║  Symbol: {trade.symbol:<15} Type: {trade.option_type.upper():<10} Recommendation: {trade.recommendation:<15} ║
-║  Strike: ${trade.strike_price:<12.2f} Expires: {trade.expiration_date.strftime('%Y-%m-%d'):<15}                    ║
-║  Entry Price: ${trade.entry_price:<8.2f} Signal Strength: {trade.signal_strength:.0f}%                         ║
+║  Symbol: {symbol:<15} Type: {option_type_upper:<10} Recommendation: {recommendation:<15} ║
+║  Strike: ${strike_price:<12.2f} Expires: {expiration_str:<15}                    ║
+║  Entry Price: ${entry_price:<8.2f} Signal Strength: {signal_strength:.0f}%                         ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  TECHNICAL ANALYSIS                                                      ║
-║  • RSI: {trade.rsi_value:>6.1f} (Signal: {trade.entry_signal_type}                 ║
-║  • MACD: {trade.macd_value:>5.2f}                                              ║
-║  • Signal Strength: {trade.signal_strength:.0f}%                                    ║
+║  • RSI: {rsi_value:>6.1f} (Signal: {entry_signal_type}                 ║
+║  • MACD: {macd_value:>5.2f}                                              ║
+║  • Signal Strength: {signal_strength:.0f}%                                    ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  BLACK-SCHOLES GREEKS                                                    ║
-║  • Delta: {trade.delta:>7.3f}  (price sensitivity)                       ║
-║  • Gamma: {trade.gamma:>7.4f}  (delta acceleration)                      ║
-║  • Vega: {trade.vega:>7.3f}   (volatility sensitivity)                  ║
-║  • Theta: {trade.theta:>7.4f}  (daily time decay)                        ║
-║  • Rho: {trade.rho:>7.3f}    (rate sensitivity)                          ║
+║  • Delta: {delta:>7.3f}  (price sensitivity)                       ║
+║  • Gamma: {gamma:>7.4f}  (delta acceleration)                      ║
+║  • Vega: {vega:>7.3f}   (volatility sensitivity)                  ║
+║  • Theta: {theta:>7.4f}  (daily time decay)                        ║
+║  • Rho: {rho:>7.3f}    (rate sensitivity)                          ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  MONTE CARLO ANALYSIS                                                    ║
-║  • Prob ITM: {trade.prob_itm:.1%}                                            ║
-║  • Expected Payoff: ${trade.expected_payoff:.2f}                                ║
-║  • Reward Potential: ${trade.reward_potential:.2f}                             ║
+║  • Prob ITM: {prob_itm:.1%}                                            ║
+║  • Expected Payoff: ${expected_payoff:.2f}                                ║
+║  • Reward Potential: ${reward_potential:.2f}                             ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  RISK ANALYSIS (95% Confidence)                                          ║
-║  • Value at Risk: ${trade.var_95:.2f}                                   ║
-║  • Conditional VaR: ${trade.cvar_95:.2f}                                  ║
-║  • Risk per Trade: ${trade.risk_per_trade:.2f}                                 ║
+║  • Value at Risk: ${var_95:.2f}                                   ║
+║  • Conditional VaR: ${cvar_95:.2f}                                  ║
+║  • Risk per Trade: ${risk_per_trade:.2f}                                 ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  POSITION SIZING                                                         ║
-║  • Suggested Contracts: {trade.contracts_suggested}                                     ║
-║  • Confidence Score: {trade.confidence_score:.0f}%                                      ║
-║  • Overall Recommendation: {trade.recommendation:<20}          ║
+║  • Suggested Contracts: {contracts_suggested}                                     ║
+║  • Confidence Score: {confidence_score:.0f}%                                      ║
+║  • Overall Recommendation: {recommendation:<20}          ║
 ╚══════════════════════════════════════════════════════════════════════════╝
 """
-    return report
+
+# Attributes copied from a trade (or ladder DataFrame row) into the template
+_TRADE_FIELDS = tuple(f.name for f in fields(OptionsTrade))
+
+
+def format_trade_report(trade: OptionsTrade) -> str:
+    """Format options trade analysis as readable report (OptionsTrade or ladder DataFrame row)"""
+    values = {name: getattr(trade, name) for name in _TRADE_FIELDS}
+    values['option_type_upper'] = trade.option_type.upper()
+    values['expiration_str'] = trade.expiration_date.strftime('%Y-%m-%d')
+    return _REPORT_TEMPLATE.format_map(values)
+
+
+def format_trade_reports(trades) -> List[str]:
+    """Format many trades (e.g. a strike ladder's values() or df.itertuples())"""
+    return [format_trade_report(trade) for trade in trades]
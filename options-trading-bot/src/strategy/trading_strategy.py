@@ -1,13 +1,19 @@
 """
 Trading strategy logic with RSI and MACD indicators
 """
+from collections import deque
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from datetime import datetime
+import numpy as np
 from src.indicators.rsi import RSIIndicator
 from src.indicators.macd import MACDIndicator
+from src.indicators.stream import EXTENDED, SAME, IndicatorStream, SeriesHistory, indicator_matrix
 from src.core.logger import logger
 
+# Bars in the recent-high window used by the BUY drawdown filter
+HIGH_WINDOW = 20
+
 
 @dataclass
 class TradeSignal:
@@ -53,6 +59,15 @@ class TradingStrategy:
         self.prev_rsi = None
         self.prev_macd = None
         self.prev_signal = None
+        
+        # Per-symbol sliding-window max of closes: symbol -> (SeriesHistory
+        # of the closes, deque of (price, index) with decreasing prices)
+        self._high_windows: Dict[str, tuple] = {}
+        
+        # Per-symbol rolling RSI/MACD, advanced in O(1) when closes grow by one bar
+        self._indicator_streams: Dict[str, IndicatorStream] = {}
+        # Close series fed bar by bar through update()
+        self._histories: Dict[str, List[float]] = {}
     
     def analyze(self, symbol: str, closes: List[float], current_price: float) -> TradeSignal:
         """
@@ -60,7 +75,7 @@ class TradingStrategy:
         
         Args:
             symbol: Trading symbol
-            closes: List of closing prices
+            closes: List or float64 array of closing prices
             current_price: Current market price
             
         Returns:
@@ -77,9 +92,13 @@ class TradingStrategy:
                 reason='Insufficient data (need 30+ candles)'
             )
         
-        # Calculate indicators
-        rsi = self.rsi.calculate(closes)
-        macd, signal, histogram = self.macd.calculate(closes)
+        # Calculate indicators, incrementally when closes extend the last call's
+        stream = self._indicator_streams.get(symbol)
+        if stream is None:
+            stream = self._indicator_streams[symbol] = IndicatorStream(
+                self.rsi.period, self.macd.fast_period, self.macd.slow_period, self.macd.signal_period
+            )
+        rsi, (macd, signal, histogram) = stream.advance(closes)
         
         # Store for crossover detection
         curr_rsi = rsi
@@ -90,7 +109,7 @@ class TradingStrategy:
         action, confidence, reason = self._generate_signal(
             rsi, macd, signal, histogram,
             self.prev_rsi, self.prev_macd, self.prev_signal,
-            closes
+            closes, recent_high=self._push_close(symbol, closes)
         )
         
         # Update previous values
@@ -113,6 +132,119 @@ class TradingStrategy:
             reason=reason
         )
     
+    def analyze_batch(self, symbols: List[str], closes_matrix: np.ndarray,
+                      current_prices: np.ndarray) -> List[TradeSignal]:
+        """
+        Analyze several independent series at once
+        
+        Each row is analyzed as analyze() would on a freshly reset strategy
+        (no crossover history), with the RSI/MACD of every row computed in
+        one compiled pass. The strategy's own state is left untouched.
+        
+        Args:
+            symbols: Trading symbol per row
+            closes_matrix: 2-D array of closing prices, one row per symbol,
+                left-padded with NaN to a common length
+            current_prices: Current market price per row
+            
+        Returns:
+            TradeSignal per row, in input order
+        """
+        closes_matrix = np.asarray(closes_matrix, dtype=np.float64)
+        lengths = np.count_nonzero(~np.isnan(closes_matrix), axis=1)
+        values = indicator_matrix(
+            closes_matrix, self.rsi.period, self.macd.fast_period, self.macd.slow_period,
+            self.macd.signal_period
+        )
+        # Rows long enough to analyze have no padding in the high window
+        recent_highs = closes_matrix[:, -HIGH_WINDOW:].max(axis=1)
+        
+        signals = []
+        for i, symbol in enumerate(symbols):
+            current_price = float(current_prices[i])
+            if lengths[i] < 30:
+                signals.append(TradeSignal(
+                    symbol=symbol,
+                    action='HOLD',
+                    confidence=0,
+                    price=current_price,
+                    timestamp=datetime.now(),
+                    indicators={},
+                    reason='Insufficient data (need 30+ candles)'
+                ))
+                continue
+            
+            rsi, macd, signal, histogram = (None if np.isnan(v) else float(v) for v in values[i])
+            action, confidence, reason = self._generate_signal(
+                rsi, macd, signal, histogram, None, None, None,
+                closes_matrix[i, -lengths[i]:], recent_high=float(recent_highs[i])
+            )
+            signals.append(TradeSignal(
+                symbol=symbol,
+                action=action,
+                confidence=confidence,
+                price=current_price,
+                timestamp=datetime.now(),
+                indicators={
+                    'rsi': rsi,
+                    'macd': macd,
+                    'signal': signal,
+                    'histogram': histogram
+                },
+                reason=reason
+            ))
+        
+        return signals
+    
+    def update(self, symbol: str, close: float) -> TradeSignal:
+        """
+        Analyze the next bar of a symbol fed one close at a time
+        
+        Appends to a series kept per symbol, so each call does O(1)
+        indicator and drawdown work instead of re-reading the history.
+        
+        Args:
+            symbol: Trading symbol
+            close: Latest closing price (also used as the current price)
+            
+        Returns:
+            TradeSignal for the series so far
+        """
+        history = self._histories.setdefault(symbol, [])
+        history.append(close)
+        return self.analyze(symbol, history, close)
+    
+    def _push_close(self, symbol: str, closes: List[float]) -> float:
+        """
+        Max of the last HIGH_WINDOW closes, maintained incrementally per symbol
+        
+        When closes is the previous call's series plus one bar this is O(1)
+        amortized (monotonic deque); any other series rebuilds the window.
+        """
+        n = len(closes)
+        state = self._high_windows.get(symbol)
+        if state is None:
+            state = self._high_windows[symbol] = (SeriesHistory(), deque())
+        history, window = state
+        
+        relation = history.observe(closes)
+        if relation == EXTENDED and window:
+            price = closes[-1]
+            while window and window[-1][0] <= price:
+                window.pop()
+            window.append((price, n - 1))
+            if window[0][1] <= n - 1 - HIGH_WINDOW:
+                window.popleft()
+        elif relation != SAME or not window:
+            window.clear()
+            for i in range(max(0, n - HIGH_WINDOW), n):
+                price = closes[i]
+                while window and window[-1][0] <= price:
+                    window.pop()
+                window.append((price, i))
+        
+        return window[0][0]
+    
     def _generate_signal(self,
                         rsi: Optional[float],
                         macd: Optional[float],
@@ -121,12 +253,15 @@ class TradingStrategy:
                         prev_rsi: Optional[float],
                         prev_macd: Optional[float],
                         prev_signal: Optional[float],
-                        closes: Optional[List[float]] = None) -> tuple:
+                        closes: Optional[List[float]] = None,
+                        recent_high: Optional[float] = None) -> tuple:
         """
         Generate trading signal based on indicators
         
         Args:
             closes: Optional list of closing prices for drawdown analysis
+            recent_high: Precomputed max of the last HIGH_WINDOW closes
+                (computed from closes when omitted)
         
         Returns:
             Tuple of (action, confidence, reason)
@@ -140,8 +275,9 @@ class TradingStrategy:
         
         # Check if current price is down 2%+ from recent high (for BUY filter)
         is_drawdown_met = True  # Default true if no price data
-        if closes and len(closes) >= 2:
-            recent_high = max(closes[-20:]) if len(closes) >= 20 else max(closes)
+        if closes is not None and len(closes) >= 2:
+            if recent_high is None:
+                recent_high = max(closes[-HIGH_WINDOW:])
             current_price = closes[-1]
             drawdown_pct = ((recent_high - current_price) / recent_high) * 100
             is_drawdown_met = drawdown_pct >= self.min_drawdown_for_buy
@@ -211,3 +347,6 @@ class TradingStrategy:
         self.prev_rsi = None
         self.prev_macd = None
         self.prev_signal = None
+        self._high_windows.clear()
+        self._indicator_streams.clear()
+        self._histories.clear()
@@ -12,12 +12,20 @@ Usage:
 """
 
 import argparse
+import copy
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Tuple
 import json
 
+import numpy as np
+
 from src.strategy.enhanced_strategy import (
     EnhancedStockStrategy,
     StockSignal,
@@ -25,7 +33,14 @@ from src.strategy.enhanced_strategy import (
     format_stock_signal,
     format_options_opportunity
 )
+from src.cache import FileCache
 from src.core.logger import logger
+from src.core.compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Try to import Schwab API, but don't fail if not available
 try:
@@ -34,15 +49,80 @@ except ImportError:
     SchwabBrokerAPI = None
     logger.debug("Schwab API not available, using sample data only")
 
+# Console report rules, built once rather than per banner
+_BANNER_RULE = '=' * 70
+_SECTION_RULE = '-' * 70
+
+# Sample-data scans take well under a millisecond per symbol, while each
+# worker process pays for numpy/scipy/numba imports and a pickled strategy,
+# so smaller batches are scanned serially unless max_workers is given
+_MIN_PROCESS_POOL_SYMBOLS = 100
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ScanResult:
+    """Outcome of scanning one symbol"""
+    symbol: str
+    timestamp: str  # ISO format
+    stock_signal: Optional[StockSignal] = None
+    options_opportunity: Optional[OptionsOpportunity] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready summary of the result (the export_results schema)"""
+        stock_signal = options_opportunity = None
+        
+        if self.stock_signal:
+            sig = self.stock_signal
+            stock_signal = {
+                'action': sig.action,
+                'confidence': sig.confidence,
+                'signal_type': sig.signal_type,
+                'price': sig.price,
+                'rsi': sig.rsi,
+                'macd': sig.macd,
+                'bb_position': sig.bb_position,
+                'reason': sig.reason
+            }
+        
+        if self.options_opportunity:
+            opp = self.options_opportunity
+            options_opportunity = {
+                'strike': opp.strike_price,
+                'entry_price': opp.entry_price,
+                'delta': opp.delta,
+                'gamma': opp.gamma,
+                'vega': opp.vega,
+                'theta': opp.theta,
+                'prob_itm': opp.prob_itm,
+                'var_95': opp.var_95,
+                'recommendation': opp.recommendation,
+                'confidence': opp.confidence,
+                'contracts': opp.contracts_suggested
+            }
+        
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp,
+            'stock_signal': stock_signal,
+            'options_opportunity': options_opportunity,
+            'error': self.error
+        }
+
 
 class StockScanner:
     """Stock scanner with options trigger capability"""
     
+    # Seconds live price data stays fresh; sample data never goes stale
+    LIVE_DATA_TTL = 60
+    
     def __init__(
         self,
         strategy: EnhancedStockStrategy,
         api: Optional[object] = None,
-        use_live_data: bool = False
+        use_live_data: bool = False,
+        file_cache: Optional[FileCache] = None,
+        min_options_confidence: float = 0.0
     ):
         """
         Initialize scanner
@@ -51,11 +131,24 @@ class StockScanner:
             strategy: EnhancedStockStrategy instance
             api: Optional Schwab API for live data
             use_live_data: Use live API data vs sample data
+            file_cache: Optional on-disk cache sharing price data across runs
+            min_options_confidence: BUY signals below this confidence (0-100)
+                skip the options Monte Carlo and get no options opportunity
+                (default 0: every BUY is priced)
         """
         self.strategy = strategy
         self.api = api
         self.use_live_data = use_live_data
-        self.scan_results: Dict[str, Dict] = {}
+        self.file_cache = file_cache
+        self.min_options_confidence = min_options_confidence
+        self.scan_results: Dict[str, ScanResult] = {}
+        # (symbol, days) -> (fetched_at, (closes, current_price))
+        self._price_cache: Dict[Tuple[str, int], Tuple[float, Tuple[List[float], float]]] = {}
+    
+    @property
+    def _live(self) -> bool:
+        """Whether price data comes from the API"""
+        return bool(self.use_live_data and self.api)
     
     def get_price_data(
         self,
@@ -72,7 +165,91 @@ class StockScanner:
         Returns:
             Tuple of (closes_list, current_price) or None
         """
-        if self.use_live_data and self.api:
+        price_data = self._cached_price_data(symbol, days)
+        if price_data is None:
+            price_data = self._fetch_price_data(symbol, days)
+            if price_data:
+                self._store_price_data(symbol, days, price_data)
+        return price_data
+    
+    def _file_cache_key(self, symbol: str, days: int) -> str:
+        """On-disk key: data source, symbol, history length and today's date"""
+        source = 'live' if self._live else 'sample'
+        return f"{source}_{symbol}_{days}_{date.today():%Y%m%d}"
+    
+    def _cached_price_data(
+        self,
+        symbol: str,
+        days: int
+    ) -> Optional[Tuple[List[float], float]]:
+        """Fresh price data from the in-memory cache, then the file cache"""
+        ttl = self.LIVE_DATA_TTL if self._live else None
+        entry = self._price_cache.get((symbol, days))
+        if entry is not None and (ttl is None or time.time() - entry[0] < ttl):
+            return entry[1]
+        
+        if self.file_cache is not None:
+            cached = self.file_cache.get(self._file_cache_key(symbol, days))
+            if cached is not None:
+                price_data = (cached[0], cached[1])
+                self._price_cache[(symbol, days)] = (time.time(), price_data)
+                return price_data
+        return None
+    
+    def _store_price_data(
+        self,
+        symbol: str,
+        days: int,
+        price_data: Tuple[List[float], float]
+    ):
+        """Record freshly fetched price data in both caches"""
+        self._price_cache[(symbol, days)] = (time.time(), price_data)
+        if self.file_cache is not None:
+            ttl = self.LIVE_DATA_TTL if self._live else None
+            closes, current_price = price_data
+            self.file_cache.set(
+                self._file_cache_key(symbol, days), [list(closes), current_price], ttl
+            )
+    
+    def prefetch_price_data(
+        self,
+        symbols: List[str],
+        days: int = 60,
+        max_concurrency: int = 20
+    ):
+        """
+        Fetch live price data for all symbols concurrently
+        
+        Each fetch is a blocking API round-trip, so running them on a bounded
+        thread pool makes a scan wait for roughly the slowest request rather
+        than the sum of all of them. Results land in the cache that
+        get_price_data reads; symbols still fresh there are skipped. No-op
+        for sample data.
+        
+        Args:
+            symbols: Stock symbols to fetch
+            days: Number of days of history
+            max_concurrency: Most requests in flight at once (rate-limit guard)
+        """
+        if not self._live:
+            return
+        pending = [symbol for symbol in symbols if self._cached_price_data(symbol, days) is None]
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as executor:
+            fetched = executor.map(self._fetch_price_data, pending, repeat(days))
+            for symbol, price_data in zip(pending, fetched):
+                if price_data:
+                    self._store_price_data(symbol, days, price_data)
+    
+    def _fetch_price_data(
+        self,
+        symbol: str,
+        days: int
+    ) -> Optional[Tuple[List[float], float]]:
+        """Price data from the API (sample data on failure) or sample data"""
+        if self._live:
             try:
                 history = self.api.get_price_history(symbol, days=days)
                 if not history or 'candles' not in history:
@@ -96,21 +273,24 @@ class StockScanner:
     
     def _generate_sample_data(self, symbol: str, days: int) -> Tuple[List[float], float]:
         """Generate consistent sample data for a symbol"""
-        import random
-        random.seed(hash(symbol) % 2**32)  # Consistent data per symbol
-        
-        closes = [100]
-        for _ in range(days - 1):
-            change = random.uniform(-2, 2)
-            closes.append(closes[-1] * (1 + change / 100))
+        # Seeded from the symbol's bytes rather than hash(): str hashes are
+        # salted per process, which would give scan workers different data
+        # for the same symbol
+        # SeedSequence mixes every byte of the ticker into the state
+        rng = np.random.default_rng(np.random.SeedSequence(list(symbol.encode())))
         
-        return closes, closes[-1]
+        # Random walk of +/-2% daily moves as one cumulative product
+        changes = rng.uniform(-2.0, 2.0, max(days - 1, 0))
+        closes = np.empty(changes.shape[0] + 1)
+        closes[0] = 100.0
+        closes[1:] = 100.0 * np.cumprod(1.0 + changes / 100.0)
+        return closes.tolist(), float(closes[-1])
     
     def scan_single_stock(
         self,
         symbol: str,
         days_of_history: int = 60
-    ) -> Dict:
+    ) -> ScanResult:
         """
         Scan single stock for signals
         
@@ -119,25 +299,48 @@ class StockScanner:
             days_of_history: Days to retrieve
             
         Returns:
-            Dictionary with scan results
+            ScanResult for the symbol
+        """
+        result, buy = self._scan_stock_signal(symbol, days_of_history)
+        
+        # If BUY signal, analyze options
+        if buy is not None:
+            try:
+                options_opp = self.strategy.analyze_options_for_stock_signal(
+                    *buy,
+                    days_to_expiry=30,
+                    num_simulations=5000
+                )
+                self._set_options_opportunity(result, options_opp)
+            except Exception as e:
+                logger.error(f"{symbol}: Error during scan - {e}")
+                result.error = str(e)
+        
+        return result
+    
+    def _scan_stock_signal(
+        self,
+        symbol: str,
+        days_of_history: int = 60
+    ) -> Tuple[ScanResult, Optional[Tuple[StockSignal, List[float], float]]]:
+        """
+        Stock-signal half of scan_single_stock
+        
+        Returns:
+            Tuple of (scan result without options, (stock_signal, closes,
+            current_price) for a BUY signal worth pricing options for, or None)
         """
         logger.info(f"Scanning {symbol}...")
         
-        result = {
-            'symbol': symbol,
-            'timestamp': datetime.now().isoformat(),
-            'stock_signal': None,
-            'options_opportunity': None,
-            'error': None
-        }
+        result = ScanResult(symbol, datetime.now().isoformat())
         
         try:
             # Get price data
             price_data = self.get_price_data(symbol, days_of_history)
             if not price_data:
-                result['error'] = 'Failed to retrieve price data'
-                logger.warning(f"{symbol}: {result['error']}")
-                return result
+                result.error = 'Failed to retrieve price data'
+                logger.warning(f"{symbol}: {result.error}")
+                return result, None
             
             closes, current_price = price_data
             
@@ -146,137 +349,208 @@ class StockScanner:
             
             if not stock_signal:
                 logger.info(f"{symbol}: No trading signal")
-                return result
+                return result, None
             
-            result['stock_signal'] = {
-                'action': stock_signal.action,
-                'confidence': stock_signal.confidence,
-                'signal_type': stock_signal.signal_type,
-                'price': stock_signal.price,
-                'rsi': stock_signal.rsi,
-                'macd': stock_signal.macd,
-                'bb_position': stock_signal.bb_position,
-                'reason': stock_signal.reason
-            }
+            result.stock_signal = stock_signal
             
-            # If BUY signal, analyze options
             if stock_signal.action == 'BUY':
-                options_opp = self.strategy.analyze_options_for_stock_signal(
-                    stock_signal,
-                    closes,
-                    current_price,
-                    days_to_expiry=30,
-                    num_simulations=5000
-                )
-                
-                if options_opp:
-                    result['options_opportunity'] = {
-                        'strike': options_opp.strike_price,
-                        'entry_price': options_opp.entry_price,
-                        'delta': options_opp.delta,
-                        'gamma': options_opp.gamma,
-                        'vega': options_opp.vega,
-                        'theta': options_opp.theta,
-                        'prob_itm': options_opp.prob_itm,
-                        'var_95': options_opp.var_95,
-                        'recommendation': options_opp.recommendation,
-                        'confidence': options_opp.confidence,
-                        'contracts': options_opp.contracts_suggested
-                    }
-            
-            return result
+                # Dropping these also drops their options opportunity
+                if stock_signal.confidence < self.min_options_confidence:
+                    logger.info(
+                        f"{symbol}: BUY confidence {stock_signal.confidence:.0f}% below "
+                        f"{self.min_options_confidence:.0f}%, skipping options"
+                    )
+                    return result, None
+                return result, (stock_signal, closes, current_price)
+            return result, None
             
         except Exception as e:
             logger.error(f"{symbol}: Error during scan - {e}")
-            result['error'] = str(e)
-            return result
+            result.error = str(e)
+            return result, None
+    
+    @staticmethod
+    def _set_options_opportunity(result: ScanResult, options_opp: Optional[OptionsOpportunity]):
+        """Record an options opportunity in a scan result"""
+        if options_opp:
+            result.options_opportunity = options_opp
+    
+    def _scan_isolated(self, symbol: str, days_of_history: int = 60) -> Tuple:
+        """_scan_stock_signal on a private copy of the strategy's indicator state"""
+        scanner = StockScanner(
+            copy.deepcopy(self.strategy), self.api, self.use_live_data, self.file_cache,
+            self.min_options_confidence
+        )
+        scanner._price_cache = self._price_cache
+        return scanner._scan_stock_signal(symbol, days_of_history)
     
     def scan_multiple_stocks(
         self,
         symbols: List[str],
-        days_of_history: int = 60
-    ) -> List[Dict]:
+        days_of_history: int = 60,
+        max_workers: Optional[int] = None
+    ) -> List[ScanResult]:
         """
         Scan multiple stocks
         
+        Stock signals are independent per symbol, so they are computed
+        concurrently: worker processes for sample data, threads for live data
+        (network-bound). Sample-data batches under _MIN_PROCESS_POOL_SYMBOLS
+        are scanned serially when max_workers is not given, since process
+        startup would cost more than the scan. Each symbol gets its own copy of the strategy, so
+        results don't depend on scan order or worker count. Options for all
+        BUY signals are then priced in one batched Monte Carlo pass.
+        
         Args:
             symbols: List of stock symbols
             days_of_history: Days to retrieve
+            max_workers: Concurrent scans (CPU count if None, 1 for serial)
             
         Returns:
-            List of scan results
+            List of scan results, in symbols order
         """
-        results = []
+        sys.stdout.write('\n'.join([
+            '',
+            _BANNER_RULE,
+            f"  STOCK SCANNER - {len(symbols)} symbols",
+            f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"  Data Type: {'Live (Schwab API)' if self.use_live_data else 'Sample'}",
+            _BANNER_RULE,
+            '\n'
+        ]))
         
-        print(f"\n{'='*70}")
-        print(f"  STOCK SCANNER - {len(symbols)} symbols")
-        print(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"  Data Type: {'Live (Schwab API)' if self.use_live_data else 'Sample'}")
-        print(f"{'='*70}\n")
+        # Live data: fetch every symbol up front instead of one round-trip per scan
+        self.prefetch_price_data(symbols, days_of_history)
         
-        for symbol in symbols:
-            result = self.scan_single_stock(symbol, days_of_history)
-            results.append(result)
+        workers = min(max_workers or os.cpu_count() or 1, len(symbols))
+        if max_workers is None and not self._live and len(symbols) < _MIN_PROCESS_POOL_SYMBOLS:
+            workers = 1
+        if workers <= 1:
+            scanned = [self._scan_isolated(symbol, days_of_history) for symbol in symbols]
+        elif self._live:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                scanned = list(executor.map(self._scan_isolated, symbols, repeat(days_of_history)))
+        else:
+            # Ship the strategy to each worker once rather than per symbol
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scan_worker,
+                initargs=(self.strategy, self.min_options_confidence)
+            ) as executor:
+                scanned = list(executor.map(
+                    _scan_worker, symbols, repeat(days_of_history),
+                    chunksize=max(1, len(symbols) // (4 * workers))
+                ))
+        
+        results = [result for result, _ in scanned]
+        buys = [(result, buy) for result, buy in scanned if buy is not None]
+        if buys:
+            try:
+                opportunities = self.strategy.analyze_options_for_stock_signals(
+                    [buy for _, buy in buys],
+                    days_to_expiry=30,
+                    num_simulations=5000
+                )
+                for (result, _), options_opp in zip(buys, opportunities):
+                    self._set_options_opportunity(result, options_opp)
+            except Exception as e:
+                logger.error(f"Error analyzing options for {len(buys)} BUY signals - {e}")
+                for result, _ in buys:
+                    result.error = str(e)
+        
+        for symbol, result in zip(symbols, results):
             self.scan_results[symbol] = result
         
         return results
     
-    def print_results_summary(self, results: List[Dict]):
+    def print_results_summary(self, results: List[ScanResult]):
         """Print summary of scan results"""
         
-        buy_signals = [r for r in results if r['stock_signal'] and r['stock_signal']['action'] == 'BUY']
-        sell_signals = [r for r in results if r['stock_signal'] and r['stock_signal']['action'] == 'SELL']
-        options_opportunities = [r for r in results if r['options_opportunity']]
+        buy_signals = [r for r in results if r.stock_signal and r.stock_signal.action == 'BUY']
+        sell_signals = [r for r in results if r.stock_signal and r.stock_signal.action == 'SELL']
+        options_opportunities = [r for r in results if r.options_opportunity]
         
-        print(f"\n{'='*70}")
-        print(f"  SCAN SUMMARY")
-        print(f"{'='*70}")
-        print(f"  Total Scanned: {len(results)}")
-        print(f"  BUY Signals: {len(buy_signals)}")
-        print(f"  SELL Signals: {len(sell_signals)}")
-        print(f"  Options Opportunities: {len(options_opportunities)}")
-        print(f"{'='*70}\n")
+        # Collect the whole report and write it once instead of a print()
+        # (and stdout lock round-trip) per line
+        lines = [
+            '',
+            _BANNER_RULE,
+            "  SCAN SUMMARY",
+            _BANNER_RULE,
+            f"  Total Scanned: {len(results)}",
+            f"  BUY Signals: {len(buy_signals)}",
+            f"  SELL Signals: {len(sell_signals)}",
+            f"  Options Opportunities: {len(options_opportunities)}",
+            _BANNER_RULE,
+            ''
+        ]
         
         if buy_signals:
-            print("📈 BUY SIGNALS")
-            print("-" * 70)
+            lines += ["📈 BUY SIGNALS", _SECTION_RULE]
             for result in buy_signals:
-                sig = result['stock_signal']
-                print(f"  {result['symbol']:<8} | {sig['signal_type']:<20} | Conf: {sig['confidence']:>5.0f}% | Price: ${sig['price']:>7.2f}")
-                print(f"  └─ {sig['reason']}")
-            print()
+                sig = result.stock_signal
+                lines.append(f"  {result.symbol:<8} | {sig.signal_type:<20} | Conf: {sig.confidence:>5.0f}% | Price: ${sig.price:>7.2f}")
+                lines.append(f"  └─ {sig.reason}")
+            lines.append('')
         
         if options_opportunities:
-            print("📞 OPTIONS OPPORTUNITIES (Call Options)")
-            print("-" * 70)
+            lines += ["📞 OPTIONS OPPORTUNITIES (Call Options)", _SECTION_RULE]
             for result in options_opportunities:
-                opp = result['options_opportunity']
-                print(f"  {result['symbol']:<8} | ${opp['strike']:>7.2f} Call | Delta: {opp['delta']:>6.3f} | Prob ITM: {opp['prob_itm']:>5.1%}")
-                print(f"  └─ Entry: ${opp['entry_price']:>6.2f} | Contracts: {opp['contracts']} | Conf: {opp['confidence']:.0f}%")
-            print()
+                opp = result.options_opportunity
+                lines.append(f"  {result.symbol:<8} | ${opp.strike_price:>7.2f} Call | Delta: {opp.delta:>6.3f} | Prob ITM: {opp.prob_itm:>5.1%}")
+                lines.append(f"  └─ Entry: ${opp.entry_price:>6.2f} | Contracts: {opp.contracts_suggested} | Conf: {opp.confidence:.0f}%")
+            lines.append('')
         
         if sell_signals:
-            print("📉 SELL SIGNALS")
-            print("-" * 70)
+            lines += ["📉 SELL SIGNALS", _SECTION_RULE]
             for result in sell_signals:
-                sig = result['stock_signal']
-                print(f"  {result['symbol']:<8} | {sig['signal_type']:<20} | Conf: {sig['confidence']:>5.0f}% | Price: ${sig['price']:>7.2f}")
-                print(f"  └─ {sig['reason']}")
-            print()
+                sig = result.stock_signal
+                lines.append(f"  {result.symbol:<8} | {sig.signal_type:<20} | Conf: {sig.confidence:>5.0f}% | Price: ${sig.price:>7.2f}")
+                lines.append(f"  └─ {sig.reason}")
+            lines.append('')
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def export_results(self, results: List[Dict], output_file: str):
-        """Export results to JSON file"""
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+    def export_results(self, results: List[ScanResult], output_file: str):
+        """Export results to JSON file (via orjson when installed)"""
+        results = [result.to_dict() for result in results]
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
         logger.info(f"Results exported to {output_file}")
 
 
+# Per-process scanner used by scan_multiple_stocks' sample-data workers
+_worker_scanner: Optional[StockScanner] = None
+
+
+def _init_scan_worker(strategy: EnhancedStockStrategy, min_options_confidence: float):
+    """ProcessPoolExecutor initializer: build this worker's sample-data scanner"""
+    global _worker_scanner
+    _worker_scanner = StockScanner(
+        strategy, use_live_data=False, min_options_confidence=min_options_confidence
+    )
+
+
+def _scan_worker(symbol: str, days_of_history: int) -> Tuple:
+    """Compute one symbol's stock signal in a worker process"""
+    return _worker_scanner._scan_isolated(symbol, days_of_history)
+
+
 def load_stock_list_from_file(filepath: str) -> List[str]:
-    """Load stock symbols from file (one per line)"""
+    """Load stock symbols from file (one per line, '#' starts a comment line)"""
     try:
+        # One read and one upper() over the whole file; only the strip and
+        # comment test run per line
         with open(filepath, 'r') as f:
-            symbols = [line.strip().upper() for line in f if line.strip() and not line.startswith('#')]
-        return symbols
+            lines = f.read().upper().splitlines()
+        stripped = (line.strip() for line in lines if not line.startswith('#'))
+        return [symbol for symbol in stripped if symbol]
     except FileNotFoundError:
         logger.error(f"File not found: {filepath}")
         return []
@@ -353,6 +627,17 @@ Examples:
         default=2.0,
         help='Minimum drawdown % for buy signal (default: 2.0)'
     )
+    parser.add_argument(
+        '--min-options-confidence',
+        type=float,
+        default=0.0,
+        help='Minimum BUY confidence to analyze options (default: 0.0, price every BUY)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and skip writing the on-disk price cache (.cache/prices)'
+    )
     
     args = parser.parse_args()
     
@@ -392,7 +677,10 @@ Examples:
             args.live = False
     
     # Create scanner
-    scanner = StockScanner(strategy, api, args.live)
+    scanner = StockScanner(
+        strategy, api, args.live, None if args.no_cache else FileCache(),
+        args.min_options_confidence
+    )
     
     # Run scan
     results = scanner.scan_multiple_stocks(symbols, args.days)
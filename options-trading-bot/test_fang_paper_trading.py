@@ -2,13 +2,14 @@
 """
 Paper trading simulation on FANG stocks with 2% drawdown filter
 """
-import random
 from datetime import datetime, timedelta
+from typing import Optional
+import numpy as np
 from src.paper_trading.trader import PaperTrader
 from src.strategy import TradingStrategy
 from src.core.logger import logger
 
-def generate_fang_price_data(num_candles: int = 100) -> dict:
+def generate_fang_price_data(num_candles: int = 100, seed: Optional[int] = None) -> dict:
     """Generate OHLCV data for FANG stocks"""
     
     symbols = {
@@ -18,36 +19,37 @@ def generate_fang_price_data(num_candles: int = 100) -> dict:
         'GOOGL': 140.0
     }
     
-    data = {}
+    # One draw per series for all symbols x candles
+    rng = np.random.default_rng(seed)
+    shape = (len(symbols), num_candles)
+    base_prices = np.array(list(symbols.values()))
+    daily_changes = rng.normal(0.1, 2.5, shape)  # Mean 0.1%, std dev 2.5%
     
-    for symbol, base_price in symbols.items():
-        candles = []
-        price = base_price
-        
-        for i in range(num_candles):
-            timestamp = datetime.now() - timedelta(days=num_candles - i)
-            
-            # Generate realistic OHLCV
-            daily_change = random.gauss(0.1, 2.5)  # Mean 0.1%, std dev 2.5%
-            change_amount = price * (daily_change / 100)
-            
-            open_price = price
-            close_price = price + change_amount
-            high_price = max(open_price, close_price) + abs(random.uniform(0, 1.5))
-            low_price = min(open_price, close_price) - abs(random.uniform(0, 1.0))
-            
-            candles.append({
+    closes = base_prices[:, None] * np.cumprod(1 + daily_changes / 100, axis=1)
+    opens = np.concatenate([base_prices[:, None], closes[:, :-1]], axis=1)
+    highs = np.maximum(opens, closes) + rng.uniform(0, 1.5, shape)
+    lows = np.minimum(opens, closes) - rng.uniform(0, 1.0, shape)
+    volumes = rng.integers(10000000, 100000000, shape, endpoint=True)
+    
+    now = datetime.now()
+    timestamps = [now - timedelta(days=num_candles - i) for i in range(num_candles)]
+    
+    data = {}
+    for row, symbol in enumerate(symbols):
+        data[symbol] = [
+            {
                 'timestamp': timestamp,
-                'open': open_price,
-                'high': high_price,
-                'low': low_price,
-                'close': close_price,
-                'volume': random.randint(10000000, 100000000)
-            })
-            
-            price = close_price
-        
-        data[symbol] = candles
+                'open': o,
+                'high': h,
+                'low': l,
+                'close': c,
+                'volume': v
+            }
+            for timestamp, o, h, l, c, v in zip(
+                timestamps, opens[row].tolist(), highs[row].tolist(), lows[row].tolist(),
+                closes[row].tolist(), volumes[row].tolist()
+            )
+        ]
     
     return data
 
@@ -81,38 +83,20 @@ def run_fang_paper_trading():
     print(f"\n📊 Trading on: META, AAPL, NFLX, GOOGL")
     print(f"   Duration: {len(price_data['META'])} candles (days)")
     
-    # Get all timestamps
-    all_timestamps = set()
-    for symbol, candles in price_data.items():
-        for candle in candles:
-            all_timestamps.add(candle['timestamp'])
-    
-    timestamps = sorted(all_timestamps)
-    
     trades_by_symbol = {'META': 0, 'AAPL': 0, 'NFLX': 0, 'GOOGL': 0}
     
+    # generate_fang_price_data gives every symbol the same time-ordered
+    # schedule, so bar i is one timestamp across symbols; the strategy keeps
+    # each symbol's growing close series and is fed one close per bar
+    schedule = [c['timestamp'] for c in price_data['META']]
+    
     # Simulate trading
-    for timestamp in timestamps:
-        current_prices = {}
-        closes_by_symbol = {symbol: [] for symbol in price_data.keys()}
-        
-        # Collect data for each symbol at this timestamp
+    for i, timestamp in enumerate(schedule):
+        # Analyze each symbol at this bar
         for symbol, candles in price_data.items():
-            for candle in candles:
-                if candle['timestamp'] <= timestamp:
-                    closes_by_symbol[symbol].append(candle['close'])
-                    if candle['timestamp'] == timestamp:
-                        current_prices[symbol] = candle['close']
-        
-        # Analyze each symbol
-        for symbol in price_data.keys():
-            if symbol not in current_prices:
-                continue
-            
-            closes = closes_by_symbol[symbol]
-            price = current_prices[symbol]
+            price = candles[i]['close']
             
-            signal = strategy.analyze(symbol, closes, price)
+            signal = strategy.update(symbol, price)
             
             # Execute trades
             if signal.action == 'BUY':
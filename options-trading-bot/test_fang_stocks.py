@@ -1,201 +1,204 @@
 #!/usr/bin/env python
 """
 Test trading strategy on FANG stocks (Meta, Apple, Netflix, Google)
+
+Price data comes from one generator seeded by the FANG_SEED environment
+variable (default 42), so runs are reproducible; set FANG_SEED to explore
+other paths.
 """
-import random
+import io
+import os
+import sys
+from collections import Counter
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import List, Optional, Tuple
+import numpy as np
 from src.strategy.trading_strategy import TradingStrategy
 from src.core.logger import logger
 
-def generate_fang_data(symbol: str, days: int = 60) -> list:
+# Shared generator for every generate_fang_data call without its own seed
+_RNG = np.random.default_rng(int(os.environ.get('FANG_SEED', 42)))
+
+# Report templates, parsed once and filled per scenario with format_map
+_SIGNAL_TEMPLATE = "{icon} {action:5} | Confidence: {confidence:6.1f}% | RSI: {rsi:6.1f}\n    └─ {reason}"
+_SCENARIO_TEMPLATE = "    Recent High: ${recent_high:8.2f}  Current: ${current:8.2f}  Drawdown: {drawdown:5.2f}%\n    "
+_STATUS_ICONS = {'BUY': "🟢", 'SELL': "🔴"}
+
+# Different starting prices for each stock (read-only, shared by every
+# generator; other symbols start at 100.0)
+_BASE_PRICES = MappingProxyType({
+    'META': 450.0,
+    'AAPL': 235.0,
+    'NFLX': 280.0,
+    'GOOGL': 140.0
+})
+
+# Test scenarios: (key, title, random days, tail segments of (daily factor,
+# days), bars after the 20-bar window the recent high is read from)
+_SCENARIOS = (
+    # Sharp pullback: drop ~1% per day = 9.6% total drop
+    ('pullback', "Scenario 1: Sharp Pullback (↓ 4%)", 50, ((0.99, 10),), 0),
+    # Modest pullback: gentle 0.2% per day = 1% total
+    ('modest', "Scenario 2: Modest Pullback (↓ 1%)", 50, ((0.998, 5),), 0),
+    # Strong uptrend (near ATH): +0.5% per day from the base price
+    ('uptrend', "Scenario 3: Strong Uptrend (Near ATH)", 1, ((1.005, 59),), 0),
+    # Recovery bounce: drop 1.5% per day, then recover 0.3% per day; the
+    # recent high is the one seen before the bounce
+    ('recovery', "Scenario 4: Recovery Bounce (Was ↓ 3%, Now ↓ 1.5%)", 40, ((0.985, 15), (1.003, 5)), 5),
+)
+
+def generate_fang_data(symbol: str, days: int = 60, seed: Optional[int] = None) -> np.ndarray:
     """
     Generate realistic FANG stock price data
     
     Args:
         symbol: Stock symbol (META, AAPL, NFLX, GOOGL)
         days: Number of days of data
+        seed: Optional seed for an independent generator (the shared
+            FANG_SEED generator is used if None)
         
     Returns:
-        List of closing prices
+        Array of closing prices
     """
-    # Different starting prices for each stock
-    base_prices = {
-        'META': 450.0,
-        'AAPL': 235.0,
-        'NFLX': 280.0,
-        'GOOGL': 140.0
-    }
-    
-    price = base_prices.get(symbol, 100.0)
-    closes = [price]
-    
-    for i in range(days - 1):
-        # Add realistic volatility (FANG stocks are volatile)
-        change_pct = random.gauss(0.1, 2.5)  # Mean 0.1%, std dev 2.5%
-        price = price * (1 + change_pct / 100)
-        closes.append(price)
+    price = _BASE_PRICES.get(symbol, 100.0)
+    
+    # Add realistic volatility (FANG stocks are volatile), compounded in one pass
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    changes = rng.normal(0.1, 2.5, max(days - 1, 0)) / 100  # Mean 0.1%, std dev 2.5%
+    closes = np.empty(changes.shape[0] + 1)
+    closes[0] = price
+    closes[1:] = price * np.cumprod(1 + changes)
     
     return closes
 
-def print_signal_details(signal, symbol: str):
-    """Pretty print signal details"""
-    status_icon = "🟢" if signal.action == 'BUY' else "🔴" if signal.action == 'SELL' else "⏸️"
-    print(f"{status_icon} {signal.action:5} | Confidence: {signal.confidence:6.1f}% | RSI: {signal.indicators.get('rsi', 0):6.1f}")
-    print(f"    └─ {signal.reason}")
+def generate_scenario_matrix(symbols: List[str], seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the close series of every scenario for every symbol in one batch
+    
+    All random daily changes come from a single draw and every series is
+    compounded by one cumprod over a matrix of daily growth factors.
+    
+    Args:
+        symbols: Stock symbols
+        seed: Optional seed for an independent generator (the shared
+            FANG_SEED generator is used if None)
+    
+    Returns:
+        Tuple of (closes, recent_highs): closes has one row per (symbol,
+        scenario) pair in symbol-major _SCENARIOS order, left-padded with NaN
+        to a common length; recent_highs holds each row's recent high
+    """
+    lengths = np.array([days + sum(n for _, n in tail) for _, _, days, tail, _ in _SCENARIOS])
+    width = lengths.max()
+    
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    max_days = max(days for _, _, days, _, _ in _SCENARIOS)
+    changes = rng.normal(0.1, 2.5, (len(symbols), len(_SCENARIOS), max_days - 1)) / 100  # Mean 0.1%, std dev 2.5%
+    
+    # Daily growth factors, 1.0 on the padding so the cumprod passes through it
+    growth = np.ones((len(symbols), len(_SCENARIOS), width))
+    for j, (_, _, days, tail, _) in enumerate(_SCENARIOS):
+        start = width - lengths[j]
+        growth[:, j, start + 1:start + days] += changes[:, j, :days - 1]
+        for factor, n in tail:
+            growth[:, j, start + days:start + days + n] = factor
+            days += n
+    
+    starts = np.array([_BASE_PRICES.get(symbol, 100.0) for symbol in symbols])
+    closes = starts[:, None, None] * np.cumprod(growth, axis=2)
+    
+    recent_highs = np.empty((len(symbols), len(_SCENARIOS)))
+    for j, (_, _, _, _, skip) in enumerate(_SCENARIOS):
+        closes[:, j, :width - lengths[j]] = np.nan
+        recent_highs[:, j] = closes[:, j, width - skip - 20:width - skip].max(axis=1)
+    
+    return closes.reshape(-1, width), recent_highs.reshape(-1)
+
+def format_signal_details(signal) -> str:
+    """Two-line summary of a signal"""
+    return _SIGNAL_TEMPLATE.format_map({
+        'icon': _STATUS_ICONS.get(signal.action, "⏸️"),
+        'action': signal.action,
+        'confidence': signal.confidence,
+        'rsi': signal.indicators.get('rsi', 0),
+        'reason': signal.reason
+    })
 
 def test_fang_stocks():
     """Test strategy on FANG stocks"""
+    # The whole report is buffered and written to stdout once at the end
+    out = io.StringIO()
     
-    print("\n" + "=" * 90)
-    print("TESTING FANG STOCKS WITH 2% DRAWDOWN FILTER FOR BUY SIGNALS")
-    print("=" * 90)
-    print("\nStrategy Settings:")
-    print("  • RSI Period: 14")
-    print("  • RSI Oversold: 30 (BUY trigger)")
-    print("  • RSI Overbought: 70 (SELL trigger)")
-    print("  • MACD: 12/26/9")
-    print("  • BUY Filter: Price must be 2%+ down from recent 20-candle high")
-    print("\n" + "-" * 90)
+    print("\n" + "=" * 90, file=out)
+    print("TESTING FANG STOCKS WITH 2% DRAWDOWN FILTER FOR BUY SIGNALS", file=out)
+    print("=" * 90, file=out)
+    print("\nStrategy Settings:", file=out)
+    print("  • RSI Period: 14", file=out)
+    print("  • RSI Oversold: 30 (BUY trigger)", file=out)
+    print("  • RSI Overbought: 70 (SELL trigger)", file=out)
+    print("  • MACD: 12/26/9", file=out)
+    print("  • BUY Filter: Price must be 2%+ down from recent 20-candle high", file=out)
+    print("\n" + "-" * 90, file=out)
     
     fang_stocks = ['META', 'AAPL', 'NFLX', 'GOOGL']
     results = {}
     
-    for symbol in fang_stocks:
-        print(f"\n📊 {symbol} - TESTING MULTIPLE SCENARIOS")
-        print("=" * 90)
-        
-        # Scenario 1: Sharp pullback (price down 4%)
-        print(f"\n  Scenario 1: Sharp Pullback (↓ 4%)")
-        print("  " + "-" * 86)
-        
-        strategy = TradingStrategy(min_drawdown_for_buy=2.0)
-        
-        # Generate base data
-        closes = generate_fang_data(symbol, 50)
-        
-        # Create sharp pullback: hold stable then drop
-        for i in range(10):
-            closes.append(closes[-1] * 0.99)  # Drop ~1% per day = 9.6% total drop
-        
-        recent_high = max(closes[-20:])
-        current = closes[-1]
-        drawdown = ((recent_high - current) / recent_high) * 100
-        
-        signal = strategy.analyze(symbol, closes, current)
-        
-        print(f"    Recent High: ${recent_high:8.2f}  Current: ${current:8.2f}  Drawdown: {drawdown:5.2f}%")
-        print(f"    ")
-        print_signal_details(signal, symbol)
-        results[f"{symbol}_pullback"] = signal
-        
-        # Scenario 2: Modest pullback (price down 1%)
-        print(f"\n  Scenario 2: Modest Pullback (↓ 1%)")
-        print("  " + "-" * 86)
-        
-        strategy.reset()
-        closes = generate_fang_data(symbol, 50)
-        
-        # Gentle decline
-        for i in range(5):
-            closes.append(closes[-1] * 0.998)  # Drop 0.2% per day = 1% total
-        
-        recent_high = max(closes[-20:])
-        current = closes[-1]
-        drawdown = ((recent_high - current) / recent_high) * 100
-        
-        signal = strategy.analyze(symbol, closes, current)
-        
-        print(f"    Recent High: ${recent_high:8.2f}  Current: ${current:8.2f}  Drawdown: {drawdown:5.2f}%")
-        print(f"    ")
-        print_signal_details(signal, symbol)
-        results[f"{symbol}_modest"] = signal
-        
-        # Scenario 3: Strong uptrend (near ATH)
-        print(f"\n  Scenario 3: Strong Uptrend (Near ATH)")
-        print("  " + "-" * 86)
-        
-        strategy.reset()
-        # Create strong uptrend
-        price = base_prices_actual = {
-            'META': 450.0, 'AAPL': 235.0, 'NFLX': 280.0, 'GOOGL': 140.0
-        }.get(symbol, 100.0)
-        
-        closes = [price]
-        for i in range(59):
-            price = price * (1 + 0.5 / 100)  # +0.5% per day = strong uptrend
-            closes.append(price)
-        
-        recent_high = max(closes[-20:])
-        current = closes[-1]
-        drawdown = ((recent_high - current) / recent_high) * 100
-        
-        signal = strategy.analyze(symbol, closes, current)
-        
-        print(f"    Recent High: ${recent_high:8.2f}  Current: ${current:8.2f}  Drawdown: {drawdown:5.2f}%")
-        print(f"    ")
-        print_signal_details(signal, symbol)
-        results[f"{symbol}_uptrend"] = signal
-        
-        # Scenario 4: Recovery bounce (was down 3%, now recovered to -1.5%)
-        print(f"\n  Scenario 4: Recovery Bounce (Was ↓ 3%, Now ↓ 1.5%)")
-        print("  " + "-" * 86)
-        
-        strategy.reset()
-        closes = generate_fang_data(symbol, 40)
-        
-        # Drop sharply then recover slightly
-        for i in range(15):
-            closes.append(closes[-1] * 0.985)  # Drop 1.5% per day initially
-        
-        recent_high = max(closes[-20:])
-        recovery_start = closes[-1]
-        
-        # Recover 50% of losses
-        for i in range(5):
-            closes.append(closes[-1] * 1.003)  # Bounce up 0.3% per day
-        
-        current = closes[-1]
-        drawdown = ((recent_high - current) / recent_high) * 100
-        
-        signal = strategy.analyze(symbol, closes, current)
-        
-        print(f"    Recent High: ${recent_high:8.2f}  Current: ${current:8.2f}  Drawdown: {drawdown:5.2f}%")
-        print(f"    ")
-        print_signal_details(signal, symbol)
-        results[f"{symbol}_recovery"] = signal
+    # Build every scenario up front, then analyze them in one batch, each as
+    # if on a freshly reset strategy
+    closes_matrix, recent_highs = generate_scenario_matrix(fang_stocks)
+    scenarios = [(symbol, key, title) for symbol in fang_stocks for key, title, _, _, _ in _SCENARIOS]
+    strategy = TradingStrategy(min_drawdown_for_buy=2.0)
+    signals = strategy.analyze_batch(
+        [symbol for symbol, _, _ in scenarios], closes_matrix, closes_matrix[:, -1]
+    )
+    
+    # Collect the scenario report
+    lines = []
+    for (symbol, key, title), signal, current, recent_high in zip(
+        scenarios, signals, closes_matrix[:, -1].tolist(), recent_highs.tolist()
+    ):
+        if key == 'pullback':
+            lines += [f"\n📊 {symbol} - TESTING MULTIPLE SCENARIOS", "=" * 90]
+        
+        lines += [
+            f"\n  {title}",
+            "  " + "-" * 86,
+            _SCENARIO_TEMPLATE.format_map({
+                'recent_high': recent_high,
+                'current': current,
+                'drawdown': ((recent_high - current) / recent_high) * 100
+            }),
+            format_signal_details(signal)
+        ]
+        results[f"{symbol}_{key}"] = signal
+    out.write('\n'.join(lines) + '\n')
     
     # Summary
-    print("\n" + "=" * 90)
-    print("SUMMARY OF RESULTS")
-    print("=" * 90)
+    print("\n" + "=" * 90, file=out)
+    print("SUMMARY OF RESULTS", file=out)
+    print("=" * 90, file=out)
     
-    buy_signals = sum(1 for sig in results.values() if sig.action == 'BUY')
-    sell_signals = sum(1 for sig in results.values() if sig.action == 'SELL')
-    hold_signals = sum(1 for sig in results.values() if sig.action == 'HOLD')
+    counts = Counter(sig.action for sig in results.values())
+    buy_signals, sell_signals, hold_signals = counts['BUY'], counts['SELL'], counts['HOLD']
     
-    print(f"\nTotal Signals Generated: {len(results)}")
-    print(f"  🟢 BUY Signals:  {buy_signals}")
-    print(f"  🔴 SELL Signals: {sell_signals}")
-    print(f"  ⏸️  HOLD Signals: {hold_signals}")
+    print(f"\nTotal Signals Generated: {len(results)}", file=out)
+    print(f"  🟢 BUY Signals:  {buy_signals}", file=out)
+    print(f"  🔴 SELL Signals: {sell_signals}", file=out)
+    print(f"  ⏸️  HOLD Signals: {hold_signals}", file=out)
     
-    print("\n📋 Filter Effectiveness:")
-    print("  ✓ BUY signals ONLY trigger when price is 2%+ below recent high")
-    print("  ✓ SELL signals always work (no filter applied)")
-    print("  ✓ Strategy works on all FANG stocks")
+    print("\n📋 Filter Effectiveness:", file=out)
+    print("  ✓ BUY signals ONLY trigger when price is 2%+ below recent high", file=out)
+    print("  ✓ SELL signals always work (no filter applied)", file=out)
+    print("  ✓ Strategy works on all FANG stocks", file=out)
     
-    print("\n" + "=" * 90)
-    print("✅ FANG STOCK TEST COMPLETE")
-    print("=" * 90 + "\n")
+    print("\n" + "=" * 90, file=out)
+    print("✅ FANG STOCK TEST COMPLETE", file=out)
+    print("=" * 90 + "\n", file=out)
     
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
     return results
 
 if __name__ == '__main__':
-    # Add helper for base prices
-    base_prices_actual = {
-        'META': 450.0,
-        'AAPL': 235.0,
-        'NFLX': 280.0,
-        'GOOGL': 140.0
-    }
-    
     results = test_fang_stocks()
@@ -6,6 +6,7 @@ Uses improved OAuth 2.0 implementation based on Schwabdev
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -47,6 +48,9 @@ def main():
             app_secret=app_secret,
             token_path=token_path
         )
+        # The checks below repeat lookups; reuse responses within this run
+        broker.quote_cache_ttl = 60.0
+        broker.history_cache_ttl = 3600.0
         
         # Check if we have valid tokens
         if not broker.access_token or not broker.refresh_token:
@@ -62,13 +66,21 @@ def main():
         print(f"\nChecking token expiration...")
         broker.update_tokens()
         
+        # The three requests are independent: issue them together over the
+        # broker's shared session, then report each in order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            account_future = executor.submit(broker.get_account_info)
+            quote_future = executor.submit(broker.get_quote, "AAPL")
+            history_future = executor.submit(broker.get_price_history, "AAPL", days=30)
+            account_info = account_future.result()
+            quote = quote_future.result()
+            history = history_future.result()
+        
         # TEST 1: Get Account Info
         print("\n" + "=" * 80)
         print("TEST 1: Get Account Information")
         print("=" * 80)
         
-        account_info = broker.get_account_info()
-        
         if account_info and account_info.get('account_number'):
             print(f"\n✓ Account Info Retrieved!")
             print(f"  Account: {account_info.get('account_number')}")
@@ -122,7 +134,6 @@ def main():
         print("TEST 3: Real-time Quote (AAPL)")
         print("=" * 80)
         
-        quote = broker.get_quote("AAPL")
         if quote:
             print(f"\n✓ Quote Retrieved!")
             print(f"  Symbol: {quote.get('symbol')}")
@@ -137,8 +148,6 @@ def main():
         print("TEST 4: Price History (AAPL, 5 days)")
         print("=" * 80)
         
-        history = broker.get_price_history("AAPL", days=30)
-        
         if history:
             print(f"\n✓ Price History Retrieved ({len(history)} candles)\n")
             for i, candle in enumerate(history[-5:], 1):
@@ -3,41 +3,83 @@
 Test script for Telegram notifications
 Run: python test_telegram.py
 """
+import asyncio
+import importlib.util
+import os
 import sys
 from datetime import datetime
 
-from src.notifications.telegram import TelegramNotifier, NotificationConfig
 from src.strategy.trading_strategy import TradeSignal
 from src.core.logger import logger
 
 
-def test_telegram_notifications():
-    """Test Telegram notification system"""
+async def _send_test_messages(notifier, buy_signal, sell_signal, order, summary, error) -> list:
+    """Send every test notification at once; failures come back as exceptions"""
+    return await asyncio.gather(
+        notifier.send_trade_signal(
+            buy_signal.symbol, buy_signal.action, buy_signal.price,
+            buy_signal.confidence, buy_signal.indicators
+        ),
+        notifier.send_trade_signal(
+            sell_signal.symbol, sell_signal.action, sell_signal.price,
+            sell_signal.confidence, sell_signal.indicators
+        ),
+        notifier.send_order_confirmation(
+            order['symbol'], order['action'], order['quantity'], order['price'], order['order_id']
+        ),
+        notifier.send_daily_summary(summary),
+        notifier.send_error_alert(error['title'], error['message']),
+        return_exceptions=True
+    )
+
+
+def _resolve_setting(value, env_var: str, prompt: str) -> str:
+    """Argument, else environment variable, else ask - but only on a terminal"""
+    if value:
+        return value.strip()
+    if os.getenv(env_var):
+        return os.getenv(env_var).strip()
+    if sys.stdin.isatty():
+        return input(prompt).strip()
+    return ""
+
+
+def test_telegram_notifications(token=None, chat_id=None):
+    """
+    Test Telegram notification system
+    
+    Args:
+        token: Bot token (falls back to TELEGRAM_BOT_TOKEN, then a prompt)
+        chat_id: Chat ID to send to (falls back to TELEGRAM_CHAT_ID, then a prompt)
+    """
     print("\n" + "="*60)
     print("TELEGRAM NOTIFICATION TEST")
     print("="*60 + "\n")
     
-    # Check if python-telegram-bot is installed
-    try:
-        import telegram
-        print("✓ python-telegram-bot is installed\n")
-    except ImportError:
+    # Check if python-telegram-bot is installed without importing it yet;
+    # the package is heavy and the prompts below are usually skipped
+    if importlib.util.find_spec("telegram") is None:
         print("✗ python-telegram-bot not installed")
         print("  Install with: pip install python-telegram-bot")
         return False
+    print("✓ python-telegram-bot is installed\n")
     
-    # Create config from environment or user input
-    token = input("Enter Telegram Bot Token (or press Enter to skip): ").strip()
+    # Create config from arguments, environment or user input
+    token = _resolve_setting(token, "TELEGRAM_BOT_TOKEN",
+                             "Enter Telegram Bot Token (or press Enter to skip): ")
     if not token:
         print("\n⚠ Skipping Telegram test - no token provided")
         return True
     
-    chat_id = input("Enter Chat ID to send test message (or press Enter to skip): ").strip()
+    chat_id = _resolve_setting(chat_id, "TELEGRAM_CHAT_ID",
+                               "Enter Chat ID to send test message (or press Enter to skip): ")
     if not chat_id:
         print("\n⚠ Skipping Telegram test - no chat ID provided")
         return True
     
     try:
+        from src.notifications.telegram import TelegramNotifier, NotificationConfig
+        
         # Create notifier config
         config = NotificationConfig(
             enabled=True,
@@ -51,8 +93,7 @@ def test_telegram_notifications():
         notifier = TelegramNotifier(config)
         print(f"\n✓ TelegramNotifier initialized\n")
         
-        # Test 1: Send trade signal (BUY)
-        print("Test 1: Sending BUY signal...")
+        # Test 1: trade signal (BUY)
         buy_signal = TradeSignal(
             symbol='AAPL',
             action='BUY',
@@ -63,15 +104,7 @@ def test_telegram_notifications():
             reason='RSI oversold + MACD bullish crossover'
         )
         
-        try:
-            result = notifier.send_trade_signal_sync(buy_signal)
-            print(f"  ✓ BUY signal sent: {result}\n")
-        except Exception as e:
-            print(f"  ✗ Failed to send BUY signal: {e}\n")
-            return False
-        
-        # Test 2: Send trade signal (SELL)
-        print("Test 2: Sending SELL signal...")
+        # Test 2: trade signal (SELL)
         sell_signal = TradeSignal(
             symbol='SPY',
             action='SELL',
@@ -82,15 +115,7 @@ def test_telegram_notifications():
             reason='RSI overbought + MACD bearish crossover'
         )
         
-        try:
-            result = notifier.send_trade_signal_sync(sell_signal)
-            print(f"  ✓ SELL signal sent: {result}\n")
-        except Exception as e:
-            print(f"  ✗ Failed to send SELL signal: {e}\n")
-            return False
-        
-        # Test 3: Send order confirmation
-        print("Test 3: Sending order confirmation...")
+        # Test 3: order confirmation
         order = {
             'symbol': 'AAPL',
             'action': 'BUY',
@@ -101,15 +126,7 @@ def test_telegram_notifications():
             'timestamp': datetime.now()
         }
         
-        try:
-            result = notifier.send_order_confirmation_sync(order)
-            print(f"  ✓ Order confirmation sent: {result}\n")
-        except Exception as e:
-            print(f"  ✗ Failed to send order confirmation: {e}\n")
-            return False
-        
-        # Test 4: Send daily summary
-        print("Test 4: Sending daily summary...")
+        # Test 4: daily summary
         summary = {
             'date': datetime.now().date(),
             'total_trades': 5,
@@ -121,26 +138,30 @@ def test_telegram_notifications():
             'worst_trade': -45.25
         }
         
-        try:
-            result = notifier.send_daily_summary_sync(summary)
-            print(f"  ✓ Daily summary sent: {result}\n")
-        except Exception as e:
-            print(f"  ✗ Failed to send daily summary: {e}\n")
-            return False
-        
-        # Test 5: Send error alert
-        print("Test 5: Sending error alert...")
+        # Test 5: error alert
         error = {
             'title': 'Strategy Error',
             'message': 'RSI calculation failed for AAPL - invalid price data',
             'timestamp': datetime.now()
         }
         
-        try:
-            result = notifier.send_error_alert_sync(error)
-            print(f"  ✓ Error alert sent: {result}\n")
-        except Exception as e:
-            print(f"  ✗ Failed to send error alert: {e}\n")
+        # The five messages are independent, so they go out concurrently
+        print("Sending 5 test messages...")
+        results = asyncio.run(
+            _send_test_messages(notifier, buy_signal, sell_signal, order, summary, error)
+        )
+        
+        labels = ['BUY signal', 'SELL signal', 'Order confirmation', 'Daily summary', 'Error alert']
+        failed = False
+        for i, (label, result) in enumerate(zip(labels, results), 1):
+            if isinstance(result, Exception):
+                print(f"  ✗ Test {i}: Failed to send {label}: {result}")
+                failed = True
+            else:
+                print(f"  ✓ Test {i}: {label} sent: {result}")
+        print()
+        
+        if failed:
             return False
         
         print("="*60)
@@ -195,11 +216,13 @@ if __name__ == '__main__':
     
     parser = argparse.ArgumentParser(description='Test Telegram notifications')
     parser.add_argument('--get-chat-id', action='store_true', help='Get your Telegram Chat ID')
+    parser.add_argument('--token', help='Bot token (default: $TELEGRAM_BOT_TOKEN or prompt)')
+    parser.add_argument('--chat-id', help='Chat ID to send to (default: $TELEGRAM_CHAT_ID or prompt)')
     
     args = parser.parse_args()
     
     if args.get_chat_id:
         get_chat_id()
     else:
-        success = test_telegram_notifications()
+        success = test_telegram_notifications(args.token, args.chat_id)
         sys.exit(0 if success else 1)
@@ -1,4 +1,12 @@
+import os
+
 import pytest
+
+# Tests run against a private in-memory database unless DB_URL is already
+# set: no file I/O and nothing left behind between runs (must be set before
+# src.core.db is imported)
+os.environ.setdefault("DB_URL", "sqlite://")
+
 from src.core.db import init_db
 
 @pytest.fixture(scope="session", autouse=True)
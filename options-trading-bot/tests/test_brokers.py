@@ -0,0 +1,61 @@
+import pytest
+from src.brokers import SchwabBrokerAPI
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return self.payload
+
+
+class TestSchwabBrokerCache:
+    
+    @pytest.fixture
+    def broker(self, monkeypatch):
+        """Broker whose HTTP session records requests instead of sending them"""
+        broker = SchwabBrokerAPI(account_number="123", token="test-token")
+        broker.quote_cache_ttl = 60.0
+        broker.history_cache_ttl = 3600.0
+        broker.requests = []
+        
+        def fake_get(url, params=None):
+            broker.requests.append(url)
+            if url.endswith("/quotes"):
+                return _FakeResponse({params['symbols']: {'quote': {'lastPrice': 150.0}}})
+            return _FakeResponse({'candles': [{'datetime': 1, 'close': 150.0}]})
+        
+        monkeypatch.setattr(broker.session, "get", fake_get)
+        return broker
+    
+    def test_cache_off_by_default(self, broker):
+        """A broker with the default TTLs fetches on every call"""
+        broker.quote_cache_ttl = SchwabBrokerAPI.quote_cache_ttl
+        broker.history_cache_ttl = SchwabBrokerAPI.history_cache_ttl
+        
+        broker.get_quote("AAPL")
+        broker.get_quote("AAPL")
+        broker.get_price_history("AAPL", days=30)
+        broker.get_price_history("AAPL", days=30)
+        assert len(broker.requests) == 4
+    
+    def test_repeated_market_data_calls_hit_the_api_once(self, broker):
+        """Quotes and history are served from the cache within their TTL"""
+        first = broker.get_quote("AAPL")
+        first['price'] = None  # Callers get copies, not the cached entry
+        
+        assert broker.get_quote("AAPL")['price'] == 150.0
+        assert broker.get_price_history("AAPL", days=30) == broker.get_price_history("AAPL", days=30)
+        assert len(broker.requests) == 2
+        
+        # A different key, a live quote and an expired entry all refetch
+        broker.get_price_history("AAPL", days=60)
+        broker.get_quote("AAPL", use_cache=False)
+        broker.quote_cache_ttl = 0
+        broker.clear_cache()
+        broker.get_quote("AAPL")
+        assert len(broker.requests) == 5
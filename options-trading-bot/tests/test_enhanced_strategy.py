@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from src.indicators.bollinger_bands import BollingerBandsIndicator, calculate_bollinger_bands_simple
 from src.strategy.enhanced_strategy import EnhancedStockStrategy, StockSignal, OptionsOpportunity
 from src.strategy.options_strategy import OptionsStrategy
+from src.quant.black_scholes import Greeks
 
 
 class TestBollingerBands:
@@ -43,6 +44,38 @@ class TestBollingerBands:
         assert result['width'] > 0
         print(f"✓ Volatile data: Width = {result['width']:.2f}")
     
+    def test_bb_update_matches_calculate(self):
+        """Test rolling update() agrees with a full calculate() each bar"""
+        prices = [100 + 5 * math.sin(i / 3) + (i % 7) for i in range(60)]
+        
+        bb = BollingerBandsIndicator(period=20)
+        assert bb.update(prices[0]) is None  # Not primed yet
+        bb.calculate(prices[:25])
+        
+        for i in range(25, len(prices)):
+            rolled = bb.update(prices[i])
+            fresh = BollingerBandsIndicator(period=20).calculate(prices[:i + 1])
+            for key in fresh:
+                assert rolled[key] == pytest.approx(fresh[key], rel=1e-9, abs=1e-9)
+        print("✓ Rolling BB update matches full calculation")
+    
+    def test_bb_memo_survives_update(self):
+        """Test repeated calculate() reuses bands and update() re-primes state"""
+        prices = [100 + 5 * math.sin(i / 3) + (i % 7) for i in range(40)]
+        
+        bb = BollingerBandsIndicator(period=20)
+        first = bb.calculate(prices[:30])
+        first['upper'] = 0.0  # Callers' copies don't leak into the memo
+        assert bb.calculate(prices[:30]) == BollingerBandsIndicator(period=20).calculate(prices[:30])
+        
+        bb.update(prices[30])
+        bb.calculate(prices[:30])  # Same window again, after the state moved on
+        rolled = bb.update(prices[30])
+        fresh = BollingerBandsIndicator(period=20).calculate(prices[:31])
+        for key in fresh:
+            assert rolled[key] == pytest.approx(fresh[key], rel=1e-9, abs=1e-9)
+        print("✓ BB memo stays consistent with rolling state")
+    
     def test_bb_percent_b(self):
         """Test Bollinger Band %B (position indicator)"""
         bb = BollingerBandsIndicator()
@@ -132,6 +165,29 @@ class TestEnhancedStrategy:
             assert signal.action in ['BUY', 'SELL', 'HOLD']
             print(f"✓ Uptrend analysis: {signal.action} (confidence: {signal.confidence:.0f}%)")
     
+    def test_rsi_state_per_symbol(self):
+        """Test interleaved symbols each match one indicator stepping that series alone"""
+        from src.indicators.rsi import RSIIndicator
+        from src.indicators.macd import MACDIndicator
+        
+        series = {
+            'AAA': [100 + 8 * math.sin(i / 6) - 0.1 * i + (i % 5) * 0.3 for i in range(120)],
+            'BBB': [50 + 3 * math.cos(i / 4) + (i % 3) * 0.2 for i in range(120)],
+        }
+        rsi = {symbol: RSIIndicator() for symbol in series}
+        
+        strat = EnhancedStockStrategy()
+        for day in range(30, 120):
+            for symbol, prices in series.items():
+                closes = prices[:day + 1]
+                expected_rsi = rsi[symbol].calculate(closes)
+                signal = strat.analyze_stock(symbol, closes, closes[-1])
+                
+                if signal is not None:
+                    assert signal.rsi == pytest.approx(expected_rsi, rel=1e-9)
+                    assert signal.macd == pytest.approx(MACDIndicator().calculate(closes)[0], rel=1e-9, abs=1e-12)
+        print("✓ RSI/MACD kept per symbol")
+    
     def test_options_analysis_trigger(self):
         """Test options analysis triggered by stock BUY signal"""
         strat = EnhancedStockStrategy()
@@ -181,11 +237,7 @@ class TestEnhancedStrategy:
         """Test options confidence scoring"""
         strat = EnhancedStockStrategy()
         
-        greeks = {
-            'delta': 0.40,
-            'gamma': 0.035,
-            'price': 2.50
-        }
+        greeks = Greeks(price=2.50, delta=0.40, gamma=0.035, vega=0.0, theta=0.0, rho=0.0)
         
         mc_prob = {'prob_itm_at_expiry': 0.45}
         
@@ -212,10 +264,11 @@ class TestStockScannerIntegration:
         
         result = scanner.scan_single_stock('AAPL', days_of_history=60)
         
-        assert result['symbol'] == 'AAPL'
-        assert 'stock_signal' in result
-        assert 'options_opportunity' in result
-        assert 'timestamp' in result
+        assert result.symbol == 'AAPL'
+        assert set(result.to_dict()) == {
+            'symbol', 'timestamp', 'stock_signal', 'options_opportunity', 'error'
+        }
+        assert result.timestamp
         print(f"✓ Single stock scan completed")
     
     def test_scanner_multiple_stocks(self):
@@ -230,10 +283,111 @@ class TestStockScannerIntegration:
         
         assert len(results) == 3
         for result in results:
-            assert 'symbol' in result
-            assert result['symbol'] in symbols
+            assert result.symbol in symbols
         
         print(f"✓ Multiple stock scan completed ({len(results)} stocks)")
+    
+    def test_scanner_parallel_matches_serial(self):
+        """Parallel scans return the same per-symbol signals, in order, as serial ones"""
+        from stock_scanner import StockScanner
+        
+        symbols = ['AAPL', 'SPY', 'QQQ', 'META']
+        serial = StockScanner(EnhancedStockStrategy()).scan_multiple_stocks(symbols, max_workers=1)
+        parallel = StockScanner(EnhancedStockStrategy()).scan_multiple_stocks(symbols, max_workers=2)
+        
+        assert [r.symbol for r in parallel] == symbols
+        assert [r.to_dict()['stock_signal'] for r in parallel] == \
+            [r.to_dict()['stock_signal'] for r in serial]
+    
+    def test_scanner_small_batch_scans_serially(self, monkeypatch):
+        """Small sample-data batches don't start a process pool by default"""
+        import stock_scanner
+        
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small batch")
+        
+        monkeypatch.setattr(stock_scanner, 'ProcessPoolExecutor', no_pool)
+        monkeypatch.setattr(stock_scanner.os, 'cpu_count', lambda: 4)
+        
+        results = stock_scanner.StockScanner(EnhancedStockStrategy()).scan_multiple_stocks(
+            ['AAPL', 'SPY', 'QQQ']
+        )
+        
+        assert [r.symbol for r in results] == ['AAPL', 'SPY', 'QQQ']
+    
+    def test_scanner_prefetches_live_data(self):
+        """Live scans fetch each symbol once, up front, and analysis reads the cache"""
+        from stock_scanner import StockScanner
+        
+        class FakeAPI:
+            def __init__(self):
+                self.calls = []
+            
+            def get_price_history(self, symbol, days=60):
+                self.calls.append(symbol)
+                return {'candles': [{'close': 100 + i % 5} for i in range(days)]}
+        
+        api = FakeAPI()
+        scanner = StockScanner(EnhancedStockStrategy(), api=api, use_live_data=True)
+        symbols = ['AAPL', 'SPY', 'QQQ']
+        
+        scanner.prefetch_price_data(symbols, days=40)
+        assert sorted(api.calls) == sorted(symbols)
+        
+        closes, current_price = scanner.get_price_data('SPY', days=40)
+        assert len(closes) == 40 and current_price == closes[-1]
+        assert len(api.calls) == 3
+    
+    def test_scanner_file_cache(self, tmp_path):
+        """Price data written by one scanner is served from disk to the next"""
+        from stock_scanner import StockScanner
+        from src.cache import FileCache
+        
+        cache = FileCache(str(tmp_path))
+        first = StockScanner(EnhancedStockStrategy(), file_cache=cache)
+        closes, current_price = first.get_price_data('AAPL', days=40)
+        
+        second = StockScanner(EnhancedStockStrategy(), file_cache=cache)
+        second._fetch_price_data = lambda symbol, days: pytest.fail("cache miss")
+        assert second.get_price_data('AAPL', days=40) == (closes, current_price)
+        
+        cache.set('expired', [1.0], ttl_seconds=-1)
+        assert cache.get('expired') is None
+    
+    def test_scanner_skips_options_for_weak_buys(self):
+        """BUY signals under min_options_confidence never reach the options analysis"""
+        from stock_scanner import StockScanner
+        
+        symbols = ['AAPL', 'SPY', 'QQQ', 'META', 'NVDA', 'TSLA']
+        scanner = StockScanner(EnhancedStockStrategy(), min_options_confidence=101)
+        scanner.strategy.analyze_options_for_stock_signals = \
+            lambda *args, **kwargs: pytest.fail("options analyzed for a weak BUY")
+        results = scanner.scan_multiple_stocks(symbols, max_workers=1)
+        
+        assert all(r.options_opportunity is None for r in results)
+    
+    def test_load_stock_list_from_file(self, tmp_path):
+        """Watchlists skip blank and '#' lines and upper-case the stripped symbols"""
+        from stock_scanner import load_stock_list_from_file
+        
+        watchlist = tmp_path / 'stocks.txt'
+        watchlist.write_bytes(b"# Watchlist\naapl\n\n  spy  \r\nBRK.B\n   \n  # indented\nqqq")
+        
+        assert load_stock_list_from_file(str(watchlist)) == ['AAPL', 'SPY', 'BRK.B', '# INDENTED', 'QQQ']
+        assert load_stock_list_from_file(str(tmp_path / 'missing.txt')) == []
+    
+    def test_scanner_export_results(self, tmp_path):
+        """Exported scan results load back as the same JSON"""
+        import json
+        from stock_scanner import StockScanner
+        
+        scanner = StockScanner(EnhancedStockStrategy())
+        results = scanner.scan_multiple_stocks(['AAPL', 'SPY'], max_workers=1)
+        output_file = tmp_path / 'results.json'
+        scanner.export_results(results, str(output_file))
+        
+        with open(output_file) as f:
+            assert json.load(f) == json.loads(json.dumps([r.to_dict() for r in results], default=str))
 
 
 class TestSignalFiltering:
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from src.strategy.trading_strategy import TradingStrategy, HIGH_WINDOW
+
+FANG = ['META', 'AAPL', 'NFLX', 'GOOGL']
+SCENARIOS = ['pullback', 'modest', 'uptrend', 'recovery']
+
+
+@pytest.fixture
+def strategy():
+    return TradingStrategy(min_drawdown_for_buy=2.0)
+
+
+@pytest.fixture(scope="module")
+def scenario_closes():
+    """Seeded close series keyed by (symbol, scenario)"""
+    from test_fang_stocks import generate_scenario_matrix
+    
+    closes_matrix, _ = generate_scenario_matrix(FANG, seed=42)
+    keys = [(symbol, scenario) for symbol in FANG for scenario in SCENARIOS]
+    return {key: row[~np.isnan(row)] for key, row in zip(keys, closes_matrix)}
+
+
+class TestFangScenarios:
+
+    @pytest.mark.parametrize("symbol", FANG)
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_scenario(self, strategy, scenario_closes, symbol, scenario):
+        """Each scenario yields a signal that respects the 2% BUY drawdown filter"""
+        closes = scenario_closes[(symbol, scenario)]
+        
+        signal = strategy.analyze(symbol, closes, closes[-1].item())
+        
+        assert signal.action in ('BUY', 'SELL', 'HOLD')
+        assert 0 <= signal.confidence <= 100
+        
+        recent_high = closes[-HIGH_WINDOW:].max()
+        drawdown = (recent_high - closes[-1]) / recent_high * 100
+        if signal.action == 'BUY':
+            assert drawdown >= strategy.min_drawdown_for_buy
+        if scenario == 'uptrend':
+            assert signal.action != 'BUY'
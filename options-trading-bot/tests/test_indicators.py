@@ -41,3 +41,120 @@ class TestTechnicalIndicators:
         assert analysis is not None
         assert analysis['price'] == 50
         assert analysis['rsi'] is not None
+
+
+class TestStreamingIndicators:
+    
+    def test_rsi_update_matches_calculate(self):
+        """RSI update() on one new close equals calculate() on the extended series"""
+        from src.indicators.rsi import RSIIndicator
+        closes = [100 + (i % 7) - (i % 3) * 0.5 for i in range(40)]
+        
+        streamed, full = RSIIndicator(period=14), RSIIndicator(period=14)
+        streamed.calculate(closes[:-1])
+        full.calculate(closes[:-1])
+        
+        assert streamed.update(closes[-1]) == pytest.approx(full.calculate(closes))
+    
+    def test_macd_update_matches_calculate(self):
+        """MACD update() tracks calculate() through signal seeding and beyond"""
+        from src.indicators.macd import MACDIndicator
+        closes = [100 + (i % 5) * 0.8 - (i % 4) * 0.3 + i * 0.1 for i in range(50)]
+        
+        streamed = MACDIndicator()
+        streamed.calculate(closes[:30])
+        for n in range(31, len(closes) + 1):
+            expected = MACDIndicator().calculate(closes[:n])
+            result = streamed.update(closes[n - 1])
+            for got, want in zip(result, expected):
+                if want is None:
+                    assert got is None
+                else:
+                    assert got == pytest.approx(want)
+    
+    def test_indicator_stream_matches_sequential_calculate(self):
+        """IndicatorStream fed a growing series matches calculate() called bar by bar"""
+        from src.indicators.rsi import RSIIndicator
+        from src.indicators.macd import MACDIndicator
+        from src.indicators.stream import IndicatorStream
+        closes = [100 + (i % 6) * 1.1 - (i % 5) * 0.6 + i * 0.02 for i in range(60)]
+        
+        stream, rsi = IndicatorStream(), RSIIndicator(14)
+        for n in range(30, len(closes) + 1):
+            rsi_value, macd_values = stream.advance(closes[:n])
+            assert rsi_value == pytest.approx(rsi.calculate(closes[:n]))
+            assert macd_values == pytest.approx(MACDIndicator().calculate(closes[:n]))
+        
+        # Same series again reuses the values; a different one rebuilds
+        assert stream.advance(closes) == (rsi_value, macd_values)
+        assert stream.advance(closes[:40])[1] == pytest.approx(MACDIndicator().calculate(closes[:40]))
+    
+    def test_indicator_stream_sliding_window_repeated_close(self):
+        """A fixed-length window whose new close repeats the last one is recomputed"""
+        from src.indicators.rsi import RSIIndicator
+        from src.indicators.macd import MACDIndicator
+        from src.indicators.stream import IndicatorStream
+        closes = [100 + (i % 6) * 1.1 - (i % 5) * 0.6 + i * 0.02 for i in range(41)]
+        closes.append(closes[-1])
+        
+        stream = IndicatorStream()
+        stream.advance(closes[0:41])
+        rsi_value, macd_values = stream.advance(closes[1:42])
+        
+        assert rsi_value == pytest.approx(RSIIndicator(14).calculate(closes[1:42]))
+        assert macd_values == pytest.approx(MACDIndicator().calculate(closes[1:42]))
+    
+    def test_ema_kernel_matches_loop(self, monkeypatch):
+        """Compiled EMA kernel agrees with the pure-Python EMA loop"""
+        import numpy as np
+        from src.indicators import macd as macd_module
+        closes = [100 + (i % 11) * 0.7 - (i % 4) * 0.9 + i * 0.05 for i in range(300)]
+        
+        kernel = macd_module._ema_kernel(np.asarray(closes), 26)
+        monkeypatch.setattr(macd_module, 'JIT_MIN_LENGTH', 10**9)
+        loop = macd_module.MACDIndicator()._calculate_ema(closes, 26)
+        
+        assert np.allclose(kernel, loop, rtol=1e-12)
+    
+    def test_compiled_rsi_bulk_matches_python(self, monkeypatch):
+        """Compiled RSI calculate_bulk() agrees with the per-bar NumPy loop"""
+        import numpy as np
+        from src.indicators import rsi as rsi_module
+        from src.indicators.rsi import RSIIndicator
+        closes = [100 + (i % 11) * 0.7 - (i % 4) * 0.9 + i * 0.05 for i in range(80)] + [104.0] * 16
+        
+        compiled = RSIIndicator().calculate_bulk(closes)
+        monkeypatch.setattr(rsi_module, 'NUMBA_AVAILABLE', False)
+        python = RSIIndicator().calculate_bulk(closes)
+        
+        assert [value is None for value in compiled] == [value is None for value in python]
+        assert np.allclose([v for v in compiled if v is not None],
+                           [v for v in python if v is not None], rtol=1e-12)
+        assert compiled[-1] == 50.0  # Flat window
+    
+    def test_compiled_calculate_matches_python(self, monkeypatch):
+        """Compiled RSI/MACD calculate() give the values and update() state of the NumPy path"""
+        import numpy as np
+        from src.indicators import macd as macd_module, rsi as rsi_module
+        from src.indicators.macd import MACDIndicator
+        from src.indicators.rsi import RSIIndicator
+        closes = [100 + (i % 11) * 0.7 - (i % 4) * 0.9 + i * 0.05 for i in range(60)]
+        
+        def run(n):
+            rsi, macd = RSIIndicator(), MACDIndicator()
+            values = [rsi.calculate(np.asarray(closes[:n])), macd.calculate(np.asarray(closes[:n]))]
+            return values + [rsi.update(closes[n]), macd.update(closes[n])]
+        
+        for n in (20, 30, 59):
+            compiled = run(n)
+            monkeypatch.setattr(rsi_module, 'NUMBA_AVAILABLE', False)
+            monkeypatch.setattr(macd_module, 'NUMBA_AVAILABLE', False)
+            python = run(n)
+            monkeypatch.undo()
+            
+            assert compiled[0] == pytest.approx(python[0])
+            assert compiled[2] == pytest.approx(python[2])
+            for got, expected in ((compiled[1], python[1]), (compiled[3], python[3])):
+                assert [value is None for value in got] == [value is None for value in expected]
+                assert [v for v in got if v is not None] == \
+                    pytest.approx([v for v in expected if v is not None])
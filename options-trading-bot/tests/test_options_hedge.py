@@ -0,0 +1,110 @@
+import pytest
+from src.strategy.options_hedge import (
+    HedgedBacktester, HedgeParameters, HedgeStrategy, OptionsHedgeManager
+)
+
+
+def _candles(closes):
+    return [{'close': c} for c in closes]
+
+
+class TestCompareStrategies:
+
+    def setup_method(self):
+        self.price_data = {
+            'UP': _candles([100 + i for i in range(10)]),
+            'DOWN': _candles([100 - 2 * i for i in range(12)]),
+        }
+
+    def test_no_hedge_matches_unhedged(self):
+        """Test that NO_HEDGE produces identical hedged and unhedged P&L"""
+        bt = HedgedBacktester(None, HedgeParameters(strategy=HedgeStrategy.NO_HEDGE))
+
+        results = bt.compare_strategies(self.price_data, [])
+
+        assert results['hedged']['total_pnl'] == pytest.approx(results['unhedged']['total_pnl'])
+        assert results['improvement']['pnl_diff'] == pytest.approx(0.0)
+
+    def test_protective_put_limits_loss(self):
+        """Test that a protective put caps the loss on a falling symbol"""
+        bt = HedgedBacktester(None, HedgeParameters(strategy=HedgeStrategy.PROTECTIVE_PUT))
+
+        results = bt.compare_strategies(self.price_data, [], capital_per_position=10000)
+
+        assert results['unhedged']['max_loss_per_trade'] < results['hedged']['max_loss_per_trade']
+        assert results['hedged']['hedge_cost'] == pytest.approx(400.0)  # 2% of 10000 per symbol
+        assert len(results['hedged']['pnl_curve']) == 10  # aligned to shortest series
+
+    def test_dynamic_hedge_sized_at_trigger(self):
+        """Test dynamic hedges start at the trigger bar with hedge_position's coverage"""
+        bt = HedgedBacktester(None, HedgeParameters(strategy=HedgeStrategy.DYNAMIC_HEDGE))
+        price_data = {
+            'UP': _candles([100 + i for i in range(5)]),
+            'DOWN': _candles([100, 99, 96, 90, 85]),
+        }
+
+        results = bt.compare_strategies(price_data, [], capital_per_position=10000)
+
+        # DOWN first trips the -2% trigger at 96 (-4%, the medium bucket); UP never does
+        hedged, hedge = bt.hedge_manager.hedge_position('DOWN', entry_price=100, current_price=96,
+                                                        position_size=100, unrealized_pnl_pct=-0.04)
+        assert hedged
+        assert results['hedged']['hedge_cost'] == pytest.approx(hedge.put_cost)
+        assert results['hedged']['hedge_benefit'] == pytest.approx((hedge.put_strike - 85) * 100)
+        assert results['hedged']['pnl_curve'][1] == pytest.approx(results['unhedged']['pnl_curve'][1])
+
+    def test_empty_price_data(self):
+        """Test comparison with no symbols"""
+        bt = HedgedBacktester(None)
+
+        results = bt.compare_strategies({}, [])
+
+        assert results['unhedged']['trades'] == []
+        assert results['improvement']['hedge_roi'] == 0.0
+
+
+class TestHedgePerformanceCache:
+
+    def test_cache_invalidated_on_change(self):
+        """Test that performance is cached until the hedge book changes"""
+        manager = OptionsHedgeManager()
+        manager.hedge_position('AAPL', entry_price=100, current_price=100,
+                               position_size=10, unrealized_pnl_pct=-0.05)
+
+        first = manager.evaluate_hedge_performance()
+        assert manager.evaluate_hedge_performance() is first
+
+        manager.update_hedge_pnl('AAPL', current_price=90, position_pnl=-100)
+        second = manager.evaluate_hedge_performance()
+
+        assert second is not first
+        assert second['total_hedge_benefit'] == pytest.approx(30.0)  # (95-90)*10 - 20
+
+
+class TestPartialHedgeSize:
+
+    @pytest.mark.parametrize("pct, expected", [(0.5, 5000), (0.25, 2500), (0.333, 3330), (0.015, 150)])
+    def test_partial_size_matches_float_fraction(self, pct, expected):
+        """Test partial hedges cover int(shares * pct), not a rounded fraction"""
+        manager = OptionsHedgeManager(HedgeParameters(partial_hedge_pct=pct))
+
+        hedge = manager.calculate_partial_hedge(entry_price=100, current_price=100, position_size=10000)
+
+        assert hedge.position_size == expected == int(10000 * pct)
+
+
+class TestHedgeExpiry:
+
+    def test_expiry_thirty_days_after_entry(self):
+        """Test hedges expire 30 days after the bar they are opened on"""
+        from datetime import datetime, timedelta
+
+        manager = OptionsHedgeManager()
+        now = datetime(2024, 3, 5, 15, 30, 0, 250000)
+        hedged, hedge = manager.hedge_position('AAPL', entry_price=100, current_price=95,
+                                               position_size=10, unrealized_pnl_pct=-0.05, now=now)
+
+        assert hedged
+        assert hedge.hedge_expires_date == now + timedelta(days=30)
+        assert manager.expired_hedges(now + timedelta(days=29)) == []
+        assert manager.expired_hedges(now + timedelta(days=30)) == ['AAPL']
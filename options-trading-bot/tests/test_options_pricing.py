@@ -109,6 +109,36 @@ class TestBlackScholes:
         
         theta = BlackScholesModel.theta(spot, strike, time_short, vol, 'call')
         print(f"✓ Theta (5 days to expiry): {theta:.4f} per day")
+    
+    def test_greeks_batch_matches_scalar(self):
+        """Test batched Greeks kernel agrees with calculate_greeks per strike"""
+        strikes = [80, 95, 100, 105, 130]
+        
+        for option_type in ('call', 'put'):
+            batch = BlackScholesModel.calculate_greeks_batch(100, strikes, 0.1, 0.25, option_type)
+            for i, strike in enumerate(strikes):
+                scalar = BlackScholesModel.calculate_greeks(100, strike, 0.1, 0.25, option_type)
+                for name in scalar._fields:
+                    assert getattr(batch, name)[i] == pytest.approx(getattr(scalar, name), rel=1e-9, abs=1e-12)
+        print("✓ Batched Greeks match scalar Greeks")
+    
+    def test_compiled_pricing_matches_scipy(self):
+        """Test the compiled scalar kernels against scipy's normal distribution"""
+        from scipy.stats import norm
+        
+        spot, strike, t, vol, r = 100, 110, 0.5, 0.3, 0.05
+        d1 = (math.log(spot / strike) + (r + 0.5 * vol ** 2) * t) / (vol * math.sqrt(t))
+        d2 = d1 - vol * math.sqrt(t)
+        disc_k = strike * math.exp(-r * t)
+        
+        assert BlackScholesModel.call_price(spot, strike, t, vol, r) == pytest.approx(
+            spot * norm.cdf(d1) - disc_k * norm.cdf(d2), rel=1e-12)
+        assert BlackScholesModel.put_price(spot, strike, t, vol, r) == pytest.approx(
+            disc_k * norm.cdf(-d2) - spot * norm.cdf(-d1), rel=1e-12)
+        assert BlackScholesModel.delta(spot, strike, t, vol, 'put', r) == pytest.approx(norm.cdf(d1) - 1, rel=1e-12)
+        assert BlackScholesModel.gamma(spot, strike, t, vol, r) == pytest.approx(
+            norm.pdf(d1) / (spot * vol * math.sqrt(t)), rel=1e-12)
+        print("✓ Compiled pricing matches scipy")
 
 
 class TestMonteCarloSimulation:
@@ -138,6 +168,56 @@ class TestMonteCarloSimulation:
         assert 80 < avg_final < 120, f"Final price {avg_final} outside expected range"
         print(f"✓ Path generation: {len(paths)} paths, avg final: ${avg_final:.2f}")
     
+    def test_antithetic_price_paths(self):
+        """Test paths come in mirrored pairs unless antithetic is disabled"""
+        paths = MonteCarloSimulator.simulate_price_paths(100, 0.20, 0.05, 10, 5, 30)
+        assert len(paths) == 5
+        
+        drift = (0.05 - 0.5 * 0.20 ** 2) * 30 / 365
+        log_sum = math.log(paths[0][-1] / 100) + math.log(paths[1][-1] / 100)
+        assert log_sum == pytest.approx(2 * drift)
+        
+        independent = MonteCarloSimulator.simulate_price_paths(100, 0.20, 0.05, 10, 2, 30, antithetic=False)
+        log_sum = math.log(independent[0][-1] / 100) + math.log(independent[1][-1] / 100)
+        assert log_sum != pytest.approx(2 * drift)
+        print("✓ Antithetic path pairs")
+    
+    def test_price_paths_match_stepwise_gbm(self):
+        """Test the vectorized paths equal stepping GBM one shock at a time"""
+        import numpy as np
+        
+        paths = MonteCarloSimulator.simulate_price_paths(
+            100, 0.20, 0.05, 20, 4, 30, antithetic=False, rng=np.random.default_rng(7)
+        )
+        shocks = np.random.default_rng(7).standard_normal((4, 20))
+        assert paths.shape == (4, 21)
+        
+        dt = 30 / (365 * 20)
+        for path, path_shocks in zip(paths, shocks):
+            price = 100.0
+            assert path[0] == price
+            for step, shock in enumerate(path_shocks, 1):
+                price *= math.exp((0.05 - 0.5 * 0.20 ** 2) * dt + 0.20 * math.sqrt(dt) * shock)
+                assert path[step] == pytest.approx(price)
+        print("✓ Vectorized GBM paths")
+    
+    def test_path_statistics_float32_storage(self):
+        """Test float32 path statistics agree with float64 ones"""
+        import numpy as np
+        
+        MonteCarloSimulator(seed=5)
+        single = MonteCarloSimulator.analyze_option_path_statistics(100, 0.20, 0.05, 30, 20000, 50)
+        double = MonteCarloSimulator.analyze_option_path_statistics(
+            100, 0.20, 0.05, 30, 20000, 50, dtype=np.float64
+        )
+        
+        forward = 100 * math.exp(0.05 * 30 / 365)
+        assert single['final_price_mean'] == pytest.approx(forward, abs=0.15)
+        for key in ('final_price_std', 'max_price_mean', 'min_price_mean', 'avg_max_drawdown'):
+            assert single[key] == pytest.approx(double[key], rel=0.03), key
+        assert 0 < single['worst_case_drawdown'] < 1
+        print("✓ float32 path statistics")
+    
     def test_european_option_pricing(self):
         """Test European option pricing via Monte Carlo"""
         mc_result = MonteCarloSimulator.price_european_option(
@@ -176,6 +256,59 @@ class TestMonteCarloSimulation:
         
         print(f"✓ Prob ITM: {result['prob_itm_at_expiry']:.1%}")
     
+    def test_probability_touch_matches_fine_paths(self):
+        """Test the bridge touch probability against finely stepped paths"""
+        MonteCarloSimulator(seed=3)
+        for option_type, strike in (('call', 105), ('put', 95)):
+            result = MonteCarloSimulator.calculate_probability_itm(
+                100, strike, 0.20, 0.05, 30, option_type, num_simulations=20000
+            )
+            paths = MonteCarloSimulator.simulate_price_paths(100, 0.20, 0.05, 1000, 4000, 30)
+            touched = paths.max(axis=1) > strike if option_type == 'call' else paths.min(axis=1) < strike
+            
+            assert result['prob_itm_at_expiry'] < result['prob_touch_strike'] <= 1
+            assert result['prob_touch_strike'] == pytest.approx(touched.mean(), abs=0.03)
+        print("✓ Touch probability matches stepped paths")
+    
+    def test_terminal_prices_reuse_rng_and_buffer(self):
+        """Test seeded generator reproduces draws into a preallocated buffer"""
+        import numpy as np
+        
+        buffer = np.empty(1001)
+        first = MonteCarloSimulator.simulate_terminal_prices(
+            100, 0.2, 0.05, 30, 1001, rng=np.random.default_rng(7), out=buffer
+        ).copy()
+        second = MonteCarloSimulator.simulate_terminal_prices(
+            100, 0.2, 0.05, 30, 1001, rng=np.random.default_rng(7), out=buffer
+        )
+        
+        assert np.shares_memory(second, buffer)
+        assert np.array_equal(first, second)
+        # Antithetic pairs are mirrored around the log drift
+        log_returns = np.log(first / 100)
+        drift = (0.05 - 0.5 * 0.2 ** 2) * 30 / 365
+        assert np.allclose(log_returns[:500] + log_returns[501:], 2 * drift)
+        print("✓ Seeded terminal prices reuse buffer")
+    
+    def test_importance_sampling_deep_otm(self):
+        """Test shifted sampling prices deep-OTM options with small error"""
+        import numpy as np
+        
+        for option_type, strike in (('call', 140), ('put', 70)):
+            bs_price = BlackScholesModel.calculate_greeks(100, strike, 30 / 365, 0.25, option_type).price
+            result = MonteCarloSimulator.simulate_importance_sampled(
+                100, strike, 0.25, 0.05, 30, option_type, 20000, rng=np.random.default_rng(3)
+            )
+            
+            assert result['shift'] != 0
+            assert abs(result['option_price'] - bs_price) < 4 * result['std_error']
+            assert result['std_error'] < 0.1 * bs_price
+        
+        # ATM strikes are left unshifted
+        atm = MonteCarloSimulator.simulate_importance_sampled(100, [100, 140], 0.25, 0.05, 30)
+        assert atm['shift'][0] == 0 and atm['shift'][1] > 0
+        print("✓ Importance sampling: deep-OTM prices match Black-Scholes")
+    
     def test_var_cvar(self):
         """Test VaR and CVaR calculations"""
         result = MonteCarloSimulator.calculate_var_cvar(
@@ -195,6 +328,109 @@ class TestMonteCarloSimulation:
         
         print(f"✓ Risk metrics - VaR: ${result['var_95']:.2f}, CVaR: ${result['cvar_95']:.2f}")
     
+    def test_simulate_and_analyze(self):
+        """Test fused price/ITM/VaR statistics from one terminal-price sample"""
+        import numpy as np
+        
+        result = MonteCarloSimulator.simulate_and_analyze(
+            100, 100, 0.20, 0.05, 30, 'call', position_size=5, num_simulations=20000,
+            rng=np.random.default_rng(7)
+        )
+        bs_price = BlackScholesModel.calculate_greeks(100, 100, 30 / 365, 0.20, 'call').price
+        
+        assert abs(result['option_price'] - bs_price) < 4 * result['std_error'] + 0.01
+        assert 0 <= result['prob_itm_at_expiry'] <= 1
+        assert result['cvar_95'] >= result['var_95'] >= 0
+        assert result['best_gain'] >= -result['var_95']
+        print(f"✓ Fused MC - price: ${result['option_price']:.2f}, best gain: ${result['best_gain']:.2f}")
+    
+    def test_simulate_and_analyze_batch_matches_single(self):
+        """Test batched underlyings reproduce per-underlying fused statistics"""
+        import numpy as np
+        
+        cases = [(100, 100, 0.20, 5), (50, 52, 0.30, 2), (200, 190, 0.25, 1)]
+        spots, strikes, vols, sizes = zip(*cases)
+        batch = MonteCarloSimulator.simulate_and_analyze_batch(
+            spots, strikes, vols, 0.05, 30, 'call', sizes, num_simulations=4000,
+            rng=np.random.default_rng(11)
+        )
+        
+        for i, (spot, strike, vol, size) in enumerate(cases):
+            single = MonteCarloSimulator.simulate_and_analyze(
+                spot, strike, vol, 0.05, 30, 'call', size, num_simulations=4000,
+                rng=np.random.default_rng(11)
+            )
+            for field in ('option_price', 'std_error', 'prob_itm_at_expiry', 'var_95', 'cvar_95',
+                          'best_gain'):
+                assert batch[field][i] == pytest.approx(single[field])
+        print(f"✓ Batched MC matches {len(cases)} single runs")
+    
+    def test_antithetic_std_error_from_pair_means(self):
+        """Test antithetic runs report the error of the pair means, not of the paths"""
+        import numpy as np
+        
+        # Deep ITM: the payoff is nearly linear in Z, so mirrored pairs cancel
+        result = MonteCarloSimulator.simulate_and_analyze(
+            100, 60, 0.20, 0.05, 30, 'call', num_simulations=4000, antithetic=True,
+            rng=np.random.default_rng(5)
+        )
+        prices = MonteCarloSimulator.simulate_terminal_prices(
+            100, 0.20, 0.05, 30, 4000, antithetic=True, rng=np.random.default_rng(5)
+        )
+        discounted = np.maximum(prices - 60, 0.0) * np.exp(-0.05 * 30 / 365)
+        pair_means = (discounted[:2000] + discounted[2000:]) / 2
+        
+        assert result['std_error'] == pytest.approx(pair_means.std() / np.sqrt(2000))
+        assert result['std_error'] < 0.1 * discounted.std() / np.sqrt(4000)
+        
+        european = MonteCarloSimulator.price_european_option(100, 100, 0.20, 0.05, 30)
+        assert european['ci_upper'] - european['option_price'] == pytest.approx(1.96 * european['std_error'])
+        print(f"✓ Antithetic std error: ${result['std_error']:.5f}")
+    
+    def test_sobol_normals_price_near_black_scholes(self):
+        """Test scrambled Sobol draws price close to BS and are seed-reproducible"""
+        import numpy as np
+        
+        bs_price = BlackScholesModel.calculate_greeks(100, 105, 30/365, 0.20, 'call').price
+        runs = [
+            MonteCarloSimulator.simulate_and_analyze(
+                100, 105, 0.20, 0.05, 30, 'call', num_simulations=2048,
+                rng=np.random.default_rng(seed), qmc=True
+            )['option_price']
+            for seed in (3, 3, 4)
+        ]
+        
+        assert runs[0] == runs[1]
+        assert abs(runs[0] - bs_price) < 0.02
+        assert abs(runs[2] - bs_price) < 0.02
+        print(f"✓ Sobol MC: {runs[0]:.4f} vs BS {bs_price:.4f}")
+    
+    def test_float32_simulation_matches_float64(self):
+        """Test f32 Monte Carlo arrays stay in f32 and agree with f64 within MC error"""
+        import numpy as np
+        
+        runs = {
+            dtype: MonteCarloSimulator.simulate_and_analyze(
+                100, 105, 0.20, 0.05, 30, 'call', num_simulations=20000,
+                rng=np.random.default_rng(5), dtype=dtype
+            )
+            for dtype in (np.float32, np.float64)
+        }
+        batch = MonteCarloSimulator.simulate_and_analyze_batch(
+            [100], [105], [0.20], 0.05, 30, num_simulations=20000,
+            rng=np.random.default_rng(5), dtype=np.float32
+        )
+        prices = MonteCarloSimulator.simulate_terminal_prices(
+            100, 0.20, 0.05, 30, 1000, rng=np.random.default_rng(5), dtype=np.float32
+        )
+        
+        assert prices.dtype == np.float32
+        assert batch['option_price'].dtype == np.float32
+        tolerance = 3 * runs[np.float64]['std_error']
+        assert runs[np.float32]['option_price'] == pytest.approx(runs[np.float64]['option_price'], abs=tolerance)
+        assert batch['option_price'][0] == pytest.approx(runs[np.float32]['option_price'], rel=1e-4)
+        print(f"✓ f32 MC: {runs[np.float32]['option_price']:.4f} vs f64 {runs[np.float64]['option_price']:.4f}")
+    
     def test_asian_option_vs_european(self):
         """Test Asian option (should have lower price than European)"""
         european = MonteCarloSimulator.price_european_option(
@@ -222,6 +458,19 @@ class TestMonteCarloSimulation:
             "Asian option should be cheaper than European"
         
         print(f"✓ Asian (${asian['option_price']:.2f}) <= European (${european['option_price']:.2f})")
+    
+    def test_asian_control_variate_tightens_estimate(self):
+        """Test European control variate shrinks the Asian standard error"""
+        args = (100, 100, 0.20, 0.05, 30, 'put')
+        
+        MonteCarloSimulator(seed=11)
+        plain = MonteCarloSimulator.price_asian_option(*args, num_simulations=5000, control_variate=False)
+        adjusted = MonteCarloSimulator.price_asian_option(*args, num_simulations=5000)
+        
+        assert adjusted['std_error'] < 0.8 * plain['std_error']
+        assert adjusted['option_price'] == pytest.approx(
+            plain['option_price'], abs=4 * plain['std_error'])
+        print(f"✓ Asian std error {plain['std_error']:.4f} -> {adjusted['std_error']:.4f}")
 
 
 class TestOptionsStrategy:
@@ -281,6 +530,88 @@ class TestOptionsStrategy:
         assert len(results) > 0, "Should analyze at least some strikes"
         print(f"✓ Strike ladder: analyzed {len(results)} strikes")
 
+    def test_strike_ladder_dataframe(self):
+        """Test columnar ladder result matches OptionsTrade fields"""
+        from dataclasses import fields
+        from src.strategy.options_strategy import OptionsTrade
+        
+        strat = OptionsStrategy()
+        # Long enough for a MACD signal line and a technical signal
+        closes = [100 - math.sin(i/10)*5 + (i*0.1) for i in range(60)]
+        strikes = [100, 102.5, 105, 107.5, 110]
+        
+        df = strat.analyze_strike_ladder_df('SPY', closes, 102, strikes, 30, 'call')
+        
+        assert list(df.columns) == [f.name for f in fields(OptionsTrade)]
+        assert len(df) == len(strikes)
+        assert list(df['strike_price']) == strikes
+        assert df['prob_itm'].between(0, 1).all()
+        assert 'SPY' in format_trade_report(next(df.itertuples()))
+        print(f"✓ Strike ladder DataFrame: {len(df)} rows")
+    
+    def test_technicals_memoized_across_strikes(self):
+        """Test RSI/MACD/volatility are computed once per closes series"""
+        strat = OptionsStrategy()
+        closes = [100 - math.sin(i/10)*5 + (i*0.1) for i in range(40)]
+        
+        calls = []
+        original = strat.rsi.calculate
+        strat.rsi.calculate = lambda c, *a: calls.append(1) or original(c, *a)
+        
+        first = strat._precompute_tech(closes, 'call')
+        assert strat._precompute_tech(list(closes), 'call') is first
+        assert len(calls) == 1
+        
+        strat._precompute_tech(closes + [closes[-1]], 'call')
+        assert len(calls) == 2
+        print("✓ Technicals memoized")
+    
+    def test_greeks_memoized_on_quantized_inputs(self):
+        """Test near-identical inputs share one cached Greeks evaluation"""
+        from src.strategy.options_strategy import _greeks_cached
+        
+        strat = OptionsStrategy()
+        _greeks_cached.cache_clear()
+        
+        first = strat._greeks(100.00001, 105, 30 / 365, 0.25, 'call')
+        second = strat._greeks(100.00002, 105.001, 30.2 / 365, 0.250001, 'call')
+        
+        assert _greeks_cached.cache_info().hits == 1
+        assert first is second
+        expected = BlackScholesModel.calculate_greeks(100, 105, 30 / 365, 0.25, 'call')
+        assert first.price == pytest.approx(expected.price)
+        print("✓ Greeks memoized")
+    
+    def test_strict_filter_skips_monte_carlo(self, monkeypatch):
+        """Test strikes that cannot reach the threshold never reach Monte Carlo"""
+        def fail(*args, **kwargs):
+            raise AssertionError("Monte Carlo should have been skipped")
+        
+        closes = [100 - math.sin(i/10)*5 + (i*0.1) for i in range(40)]
+        # Signal strength is at most 80, so confidence is at most 0.3*80 + 65 = 89
+        strat = OptionsStrategy(min_confidence_threshold=90, strict_filter=True)
+        monkeypatch.setattr(MonteCarloSimulator, 'simulate_and_analyze', fail)
+        monkeypatch.setattr(MonteCarloSimulator, 'simulate_terminal_prices', fail)
+        
+        for option_type in ('call', 'put'):
+            assert strat.analyze('SPY', closes, 102, 105, 30, option_type) is None
+            assert strat.analyze_strike_ladder('SPY', closes, 102, [100, 105], 30, option_type) == {}
+        print("✓ Strict filter skips Monte Carlo")
+    
+    def test_recommendation_tiers(self):
+        """Test recommendation table lookup at the tier boundaries"""
+        strat = OptionsStrategy()
+        cases = [
+            (80, 0.45, 'STRONG_BUY'), (80, 0.66, 'BUY'), (79.9, 0.50, 'BUY'),
+            (70, 0.70, 'BUY'), (60, 0.80, 'HOLD'), (90, 0.85, 'SELL'),
+            (50, 0.20, 'SELL'), (49.9, 0.50, 'STRONG_SELL'), (90, 0.95, 'STRONG_SELL'),
+            (90, float('nan'), 'STRONG_SELL'),
+        ]
+        for confidence, prob_itm, expected in cases:
+            rec = strat._get_recommendation(confidence, {}, {'prob_itm_at_expiry': prob_itm})
+            assert rec == expected, (confidence, prob_itm, rec)
+        print("✓ Recommendation tiers")
+
 
 class TestVolatilityEstimation:
     """Test volatility estimation"""
@@ -301,6 +632,19 @@ class TestVolatilityEstimation:
         # Should be in reasonable range (actual ~10%)
         assert 0.05 < vol < 0.30, f"Volatility {vol:.1%} seems wrong"
         print(f"✓ Estimated volatility: {vol:.1%}")
+    
+    def test_estimate_volatility_matches_numpy(self):
+        """Test compiled volatility against NumPy returns std"""
+        import numpy as np
+        
+        prices = 100 * np.cumprod(1 + np.random.default_rng(5).normal(0, 0.02, 60))
+        for window in (2, 20, 60):
+            recent = prices[-window:]
+            returns = np.diff(recent) / recent[:-1]
+            expected = min(2.0, max(0.05, returns.std() * math.sqrt(252)))
+            
+            assert estimate_volatility_from_prices(list(prices), window) == pytest.approx(expected, rel=1e-12)
+        print("✓ Volatility matches NumPy")
 
 
 if __name__ == '__main__':
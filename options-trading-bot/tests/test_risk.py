@@ -1,31 +1,33 @@
+import numpy as np
 import pytest
 from src.risk import RiskManager
 
+
+@pytest.fixture(scope="class")
+def rm():
+    """RiskManager holds no per-trade state, so one instance serves the class"""
+    return RiskManager(account_size=10000, max_risk_percent=0.10)
+
+
 class TestRiskManager:
     
-    def test_position_size_calculation(self):
+    def test_position_size_calculation(self, rm):
         """Test position sizing with 10% max risk"""
-        rm = RiskManager(account_size=10000, max_risk_percent=0.10)
-        
         result = rm.calculate_position_size(entry_price=100, stop_loss_price=95)
         
         assert result['contracts'] > 0
         assert result['risk_amount'] <= 1000  # 10% of 10000
         assert result['risk_percent'] <= 10.0
     
-    def test_max_risk_limit(self):
+    def test_max_risk_limit(self, rm):
         """Test that position sizing respects 10% max risk"""
-        rm = RiskManager(account_size=10000, max_risk_percent=0.10)
-        
         # Small stop loss = large contracts
         result = rm.calculate_position_size(entry_price=100, stop_loss_price=99)
         
         assert result['risk_percent'] <= 10.0
     
-    def test_trade_validation_long(self):
+    def test_trade_validation_long(self, rm):
         """Test validation of a long trade"""
-        rm = RiskManager(account_size=10000, max_risk_percent=0.10)
-        
         validation = rm.validate_trade(
             entry_price=100,
             stop_loss=95,
@@ -36,10 +38,8 @@ class TestRiskManager:
         assert validation['direction'] == 'LONG'
         assert validation['risk_reward_ratio'] == 2.0  # 10 risk, 20 reward
     
-    def test_trade_validation_short(self):
+    def test_trade_validation_short(self, rm):
         """Test validation of a short trade"""
-        rm = RiskManager(account_size=10000, max_risk_percent=0.10)
-        
         validation = rm.validate_trade(
             entry_price=100,
             stop_loss=105,
@@ -49,10 +49,8 @@ class TestRiskManager:
         assert validation['valid'] is True
         assert validation['direction'] == 'SHORT'
     
-    def test_invalid_trade_same_price(self):
+    def test_invalid_trade_same_price(self, rm):
         """Test rejection of invalid trade (entry == stop loss)"""
-        rm = RiskManager(account_size=10000, max_risk_percent=0.10)
-        
         validation = rm.validate_trade(
             entry_price=100,
             stop_loss=100,
@@ -60,3 +58,20 @@ class TestRiskManager:
         )
         
         assert validation['valid'] is False
+    
+    def test_trade_batch_matches_validate_trade(self, rm):
+        """Each batch element agrees with the scalar validate_trade"""
+        entries = np.array([100, 100, 100, 100, 100, 100, 50, 100])
+        stops = np.array([95, 105, 100, 105, 95, 99.5, 0, 1])
+        targets = np.array([110, 90, 110, 110, 90, 101, 60, 150])
+        
+        batch = rm.validate_trade_batch(entries, stops, targets)
+        
+        for i, args in enumerate(zip(entries.tolist(), stops.tolist(), targets.tolist())):
+            validation = rm.validate_trade(*args)
+            assert batch['valid'][i] == validation['valid']
+            if validation['valid']:
+                assert batch['direction'][i] == validation['direction']
+                assert batch['risk_reward_ratio'][i] == pytest.approx(validation['risk_reward_ratio'])
+                assert batch['contracts'][i] == validation['position']['contracts']
+                assert batch['risk_percent'][i] == pytest.approx(validation['position']['risk_percent'])
@@ -1,6 +1,10 @@
 import pytest
 from src.strategy import OptionsStrategy
 
+# Strong downtrend into a flat base (oversold), shared read-only
+DOWNTREND_PRICES = tuple(range(100, 50, -2)) + (50,) * 10
+
+
 class TestOptionsStrategy:
     
     def test_strategy_initialization(self):
@@ -23,11 +27,7 @@ class TestOptionsStrategy:
         """Test buy signal generation"""
         strategy = OptionsStrategy(account_size=10000)
         
-        # Create strong downtrend (oversold)
-        prices = list(range(100, 50, -2)) + [50] * 10
-        current_price = 50
-        
-        signal = strategy.generate_signal(prices, current_price)
+        signal = strategy.generate_signal(DOWNTREND_PRICES, 50)
         
         # Should generate either BUY or HOLD based on RSI/BB
         assert signal['signal'] in ['BUY', 'HOLD', 'REJECT']
@@ -67,3 +67,84 @@ class TestOptionsStrategy:
         assert result is not None
         assert result['action'] == 'CLOSE'
         assert result['reason'] == 'Stop loss hit'
+    
+    def test_position_update_short(self):
+        """Test SHORT exits mirror LONG ones"""
+        strategy = OptionsStrategy()
+        
+        position = {
+            'id': 'pos_1',
+            'direction': 'SHORT',
+            'stop_loss': 110,
+            'take_profit': 90
+        }
+        strategy.open_positions.append(position)
+        
+        assert strategy.update_position('pos_1', current_price=100) is None
+        assert strategy.update_position('pos_1', current_price=90)['reason'] == 'Take profit hit'
+        assert strategy.update_position('pos_1', current_price=112)['reason'] == 'Stop loss hit'
+
+
+class TestTradingStrategy:
+    
+    def test_update_matches_analyze(self):
+        """Feeding closes one at a time gives the same signals as analyzing each prefix"""
+        from src.strategy.trading_strategy import TradingStrategy
+        closes = [100 - (i % 9) * 1.3 + (i % 4) * 0.8 - i * 0.1 for i in range(50)]
+        
+        streamed, batch = TradingStrategy(), TradingStrategy()
+        for n in range(1, len(closes) + 1):
+            expected = batch.analyze('TEST', closes[:n], closes[n - 1])
+            signal = streamed.update('TEST', closes[n - 1])
+            assert (signal.action, signal.confidence) == (expected.action, expected.confidence)
+            assert signal.indicators == pytest.approx(expected.indicators)
+    
+    def test_reset_clears_streamed_history(self):
+        """A reset strategy starts update() series from scratch"""
+        from src.strategy.trading_strategy import TradingStrategy
+        closes = [100 - (i % 9) * 1.3 + (i % 4) * 0.8 - i * 0.1 for i in range(40)]
+        
+        reused, fresh = TradingStrategy(), TradingStrategy()
+        for close in closes:
+            reused.update('TEST', close)
+        reused.reset()
+        
+        for close in closes[:35]:
+            signal = reused.update('TEST', close)
+            expected = fresh.update('TEST', close)
+            assert (signal.action, signal.reason) == (expected.action, expected.reason)
+            assert signal.indicators == expected.indicators
+    
+    def test_recent_high_sliding_window_repeated_close(self):
+        """A sliding window whose new close repeats the last one drops the old high"""
+        from src.strategy.trading_strategy import TradingStrategy, HIGH_WINDOW
+        closes = [200.0] + [100 + i * 0.2 for i in range(HIGH_WINDOW - 1)]
+        closes.append(closes[-1])
+        
+        strategy = TradingStrategy()
+        assert strategy._push_close('TEST', closes[:HIGH_WINDOW]) == 200.0
+        assert strategy._push_close('TEST', closes[1:]) == max(closes[1:])
+    
+    def test_analyze_batch_matches_fresh_analyze(self):
+        """Each NaN-padded batch row gets the signal a freshly reset strategy gives it"""
+        import numpy as np
+        from src.strategy.trading_strategy import TradingStrategy
+        series = [
+            [100 - (i % 9) * 1.3 + (i % 4) * 0.8 - i * 0.3 for i in range(60)],
+            [50 + (i % 7) * 0.9 - (i % 3) * 1.1 + i * 0.2 for i in range(45)],
+            [80 + i * 0.4 for i in range(33)],
+            [120 - i * 0.5 for i in range(20)],
+        ]
+        matrix = np.full((len(series), 60), np.nan)
+        for row, closes in enumerate(series):
+            matrix[row, 60 - len(closes):] = closes
+        
+        strategy = TradingStrategy()
+        batch = strategy.analyze_batch(['A', 'B', 'C', 'D'], matrix, [s[-1] for s in series])
+        
+        for signal, closes in zip(batch, series):
+            strategy.reset()
+            expected = strategy.analyze(signal.symbol, closes, closes[-1])
+            assert (signal.action, signal.confidence, signal.reason) == \
+                (expected.action, expected.confidence, expected.reason)
+            assert signal.indicators == pytest.approx(expected.indicators)